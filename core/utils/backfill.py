@@ -0,0 +1,249 @@
+"""
+This module provides a resumable backfill of replica rows into SQLite.
+
+A backfill splits a time range into exact calendar month slices and runs
+one query per slice on the replica.  Slices run concurrently, each worker
+reusing its own replica connection, and stream their rows in chunks to a
+single writer that inserts them with executemany into an SQLite database
+in WAL mode.  A slice is recorded as completed after its last chunk, so an
+interrupted backfill only runs the slices it did not finish, after removing
+the rows a partial slice already wrote.
+"""
+
+import datetime
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pymysql
+from pywikibot import config as _config
+
+
+def connect(dbname="arwiki"):
+    return pymysql.connect(
+        host=_config.db_hostname_format.format(dbname),
+        read_default_file=_config.db_connect_file,
+        db=_config.db_name_format.format(dbname),
+        charset='utf8mb4',
+        port=_config.db_port,
+        cursorclass=pymysql.cursors.DictCursor,
+    )
+
+
+def timestamp(value):
+    """Return value as a MediaWiki timestamp, e.g. 20230101000000."""
+    return value.strftime("%Y%m%d%H%M%S")
+
+
+def month_slices(start, end):
+    """
+    Split the days from start to end, both included, into calendar months.
+
+    Args:
+        start (datetime.date): The first day.
+        end (datetime.date): The last day.
+
+    Returns:
+        list: (start, end) datetime pairs, each from the first second of a
+        month (or of start) to the first second after it, so a slice
+        matches start <= time < end and no time is in two slices.
+    """
+    slices = []
+    current = datetime.datetime(start.year, start.month, start.day)
+    last = datetime.datetime(end.year, end.month, end.day) + datetime.timedelta(days=1)
+    while current < last:
+        if current.month == 12:
+            next_month = datetime.datetime(current.year + 1, 1, 1)
+        else:
+            next_month = datetime.datetime(current.year, current.month + 1, 1)
+        slices.append((current, min(next_month, last)))
+        current = next_month
+    return slices
+
+
+def decode(value):
+    return str(value, 'utf-8', 'replace') if isinstance(value, bytes) else value
+
+
+class Backfill:
+    """
+    A class for loading the rows of a replica query into an SQLite table, one time slice at a time.
+
+    Args:
+        name (str): The name of the backfill, its completed slices are
+         recorded under this name.
+        database_path (str): The SQLite database path.
+        table (str): The SQLite table the rows are inserted into.
+        columns (tuple): The table columns the query fills, in the order it
+         selects them.
+        query (str): The replica query, with {start} and {end} replaced by
+         the MediaWiki timestamps of a slice.
+        slice_column (str): The table column with the timestamp a row belongs
+         to, used to remove the rows of an interrupted slice.
+        create_table (str, optional): The CREATE TABLE IF NOT EXISTS statement of table.
+        dbname (str): The replica database, e.g. wikidatawiki.
+        workers (int): The number of slices queried at the same time.
+        chunk_size (int): The number of rows fetched and inserted at a time.
+        connect (callable, optional): Opens a replica connection from dbname.
+    """
+
+    def __init__(self, name, database_path, table, columns, query, slice_column, create_table=None,
+                 dbname="arwiki", workers=4, chunk_size=1000, connect=connect):
+        self.name = name
+        self.table = table
+        self.columns = tuple(columns)
+        self.query = query
+        self.slice_column = slice_column
+        self.dbname = dbname
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.connect = connect
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._stop = threading.Event()
+        self.db_conn = self._create_db_table(database_path, create_table)
+
+    def _create_db_table(self, database_path, create_table):
+        """
+        Create the table of completed slices, and the target table if given.
+
+        Returns:
+            sqlite3.Connection: A connection to the SQLite database.
+        """
+        conn = sqlite3.connect(database_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cursor = conn.cursor()
+        if create_table is not None:
+            cursor.execute(create_table)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS backfill_slices (
+                name TEXT NOT NULL,
+                slice_start TEXT NOT NULL,
+                slice_end TEXT NOT NULL,
+                rows INTEGER NOT NULL,
+                PRIMARY KEY (name, slice_start)
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def completed(self):
+        """Return the start timestamps of the slices already loaded."""
+        rows = self.db_conn.execute("SELECT slice_start FROM backfill_slices WHERE name = ?", (self.name,))
+        return {row[0] for row in rows}
+
+    def _connection(self):
+        # every worker thread keeps one replica connection for all its slices
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self.connect(self.dbname)
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _put(self, rows_queue, item):
+        # gives up when the writer stopped, so a failed run does not leave workers blocked on a full queue
+        while not self._stop.is_set():
+            try:
+                rows_queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _query_slice(self, start, end, rows_queue):
+        if self._stop.is_set():
+            return
+        try:
+            connection = self._connection()
+            with connection.cursor(pymysql.cursors.SSCursor) as cursor:
+                cursor.execute(self.query.format(start=start, end=end))
+                while True:
+                    rows = cursor.fetchmany(self.chunk_size)
+                    if not rows:
+                        break
+                    if not self._put(rows_queue, ("rows", start, end, [tuple(decode(value) for value in row)
+                                                                        for row in rows])):
+                        return
+            self._put(rows_queue, ("done", start, end, None))
+        except Exception as e:
+            # the next slice of this worker opens a new connection
+            self._local.connection = None
+            self._put(rows_queue, ("error", start, end, e))
+
+    def _clear_slice(self, start, end):
+        # rows left by a slice that was interrupted before it was recorded
+        with self.db_conn:
+            self.db_conn.execute(f"DELETE FROM {self.table} WHERE {self.slice_column} >= ? AND {self.slice_column} < ?",
+                                 (start, end))
+
+    def run(self, slices):
+        """
+        Load the slices that are not completed yet.
+
+        Args:
+            slices (list): (start, end) datetime pairs, see month_slices.
+
+        Returns:
+            int: The number of slices that failed, they are run again by the next call.
+        """
+        completed = self.completed()
+        pending = [(timestamp(start), timestamp(end)) for start, end in slices]
+        pending = [(start, end) for start, end in pending if start not in completed]
+        print(f"{self.name}: {len(slices) - len(pending)} slices already loaded, {len(pending)} to load")
+        for start, end in pending:
+            self._clear_slice(start, end)
+
+        insert = (f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+                  f"VALUES ({', '.join('?' for _ in self.columns)})")
+        # bounded, so slow SQLite writes slow down the replica reads instead of filling memory
+        rows_queue = queue.Queue(maxsize=self.workers * 4)
+        self._stop.clear()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(self._query_slice, start, end, rows_queue) for start, end in pending]
+                try:
+                    failed = self._write(rows_queue, insert, len(pending))
+                except BaseException:
+                    # stop the workers before the executor waits for them: the running ones give up on
+                    # the full queue and the queued ones never start (shutdown(cancel_futures=True) needs 3.9)
+                    self._stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        return failed
+
+    def _write(self, rows_queue, insert, remaining):
+        # the single writer of the SQLite database, returns the number of failed slices
+        counts = {}
+        failed = 0
+        while remaining:
+            kind, start, end, value = rows_queue.get()
+            if kind == "rows":
+                with self.db_conn:
+                    self.db_conn.executemany(insert, value)
+                counts[start] = counts.get(start, 0) + len(value)
+            elif kind == "done":
+                with self.db_conn:
+                    self.db_conn.execute(
+                        "INSERT OR REPLACE INTO backfill_slices (name, slice_start, slice_end, rows) "
+                        "VALUES (?, ?, ?, ?)", (self.name, start, end, counts.get(start, 0)))
+                print(f"{self.name}: loaded {start} to {end}, {counts.get(start, 0)} rows")
+                remaining -= 1
+            else:
+                print(f"Error loading {self.name} slice {start} to {end}: {value}")
+                self._clear_slice(start, end)
+                failed += 1
+                remaining -= 1
+        return failed
+
+    def close(self):
+        self.db_conn.close()
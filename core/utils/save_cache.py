@@ -0,0 +1,147 @@
+"""
+This module provides a local store of the text the bot last saved to each page.
+
+Reports and status templates are regenerated on every run, and most of the
+time the result is identical to what is already on the wiki.  SaveCache keeps
+the hash and revision id of the last saved text per page in an SQLite
+database, so an unchanged page is skipped without downloading its current
+text and without a save request.  A page is saved again anyway once its entry
+is older than max_age, which also repairs pages edited by others meanwhile.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# seconds after which a page is saved even if its text did not change
+default_max_age = 7 * 86400
+
+
+def text_hash(text):
+    return hashlib.sha256(str(text).encode("utf-8")).hexdigest()
+
+
+class SaveCache:
+    """
+    A class for remembering the last text saved to each page.
+
+    Args:
+        max_age (int, optional): The number of seconds after which a page is
+         saved even if its text did not change. Defaults to default_max_age.
+        database_path (str, optional): The SQLite database path. Defaults to
+         ~/page_saves.db.
+    """
+
+    def __init__(self, max_age=None, database_path=None):
+        self.max_age = default_max_age if max_age is None else max_age
+        self._lock = threading.Lock()
+        self.db_conn = self._create_db_table(database_path)
+
+    def _create_db_table(self, database_path):
+        """
+        Create the saves table in an SQLite database.
+
+        Returns:
+            sqlite3.Connection: A connection to the SQLite database.
+        """
+        if database_path is None:
+            home_path = os.path.expanduser("~")
+            database_path = os.path.join(home_path, "page_saves.db")
+
+        # reports running in parallel threads share one connection behind the lock,
+        # WAL and the timeout cover the other processes saving at the same time
+        conn = sqlite3.connect(database_path, timeout=60, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS saves (
+                site TEXT NOT NULL,
+                title TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                revid INTEGER,
+                saved_at REAL NOT NULL,
+                PRIMARY KEY (site, title)
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def is_unchanged(self, site, title, text):
+        """
+        Check if text is what was last saved to the page and the entry is still fresh.
+
+        Args:
+            site (str): The site of the page.
+            title (str): The title of the page.
+            text (str): The new text of the page.
+
+        Returns:
+            bool: True if saving text can be skipped.
+        """
+        with self._lock:
+            row = self.db_conn.execute("SELECT hash, saved_at FROM saves WHERE site = ? AND title = ?",
+                                       (str(site), title)).fetchone()
+        if row is None:
+            return False
+        saved_hash, saved_at = row
+        return saved_hash == text_hash(text) and time.time() - saved_at < self.max_age
+
+    def record(self, site, title, text, revid=None):
+        """
+        Remember that text was saved to the page.
+
+        Args:
+            site (str): The site of the page.
+            title (str): The title of the page.
+            text (str): The saved text.
+            revid (int, optional): The revision id of the save.
+        """
+        with self._lock:
+            self.db_conn.execute("INSERT OR REPLACE INTO saves (site, title, hash, revid, saved_at) "
+                                 "VALUES (?, ?, ?, ?, ?)",
+                                 (str(site), title, text_hash(text), revid, time.time()))
+            self.db_conn.commit()
+
+
+_default_cache = None
+
+
+def default_cache(max_age=None):
+    """Return the store in the home directory, created with max_age on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SaveCache(max_age=max_age)
+    return _default_cache
+
+
+def save_if_changed(page, text, summary, cache=None, **kwargs):
+    """
+    Save text to page unless it is the text the bot last saved there.
+
+    Args:
+        page (pywikibot.Page): The page to save.
+        text (str): The new text of the page.
+        summary (str): The edit summary.
+        cache (SaveCache, optional): The store of saved texts. Defaults to the
+         store in the home directory.
+        **kwargs: Passed to page.save.
+
+    Returns:
+        bool: True if the page was saved.
+    """
+    if cache is None:
+        cache = default_cache()
+    title = page.title()
+    if cache.is_unchanged(page.site, title, text):
+        print(f"skip {title}: the text did not change since the last save")
+        return False
+    page.text = text
+    page.save(summary=summary, **kwargs)
+    try:
+        revid = page.latest_revision_id
+    except Exception:
+        revid = None
+    cache.record(page.site, title, text, revid)
+    return True
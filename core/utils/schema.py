@@ -0,0 +1,37 @@
+from sqlalchemy import inspect, text
+
+
+def add_missing_columns(metadata, bind):
+    """
+    Add columns that were added to the models after their tables were created.
+
+    create_all only creates missing tables, so new nullable/defaulted columns
+    are added here with ALTER TABLE.
+
+    Returns:
+        set: (table name, column name) pairs of the added columns.
+    """
+    added = set()
+    inspector = inspect(bind)
+    with bind.begin() as connection:
+        for table in metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            found = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in found:
+                    continue
+                column_type = column.type.compile(dialect=bind.dialect)
+                default = ""
+                if column.server_default is not None:
+                    default = f" DEFAULT {column.server_default.arg}"
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default}"))
+                added.add((table.name, column.name))
+    return added
+
+
+def add_missing_indexes(metadata, bind):
+    """Create the indexes of the models that do not exist in the database yet."""
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind, checkfirst=True)
@@ -0,0 +1,39 @@
+class TextEdits:
+    """
+    Collects span edits against one text and applies them in a single pass.
+
+    Every edit is a (start, end, replacement) tuple whose offsets refer to the
+    original text, so edits do not shift each other and identical snippets
+    elsewhere in the text are left untouched.  Overlapping edits are ignored
+    after the first one.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.edits = []
+
+    def __len__(self):
+        return len(self.edits)
+
+    def add(self, start, end, replacement):
+        self.edits.append((start, end, replacement))
+
+    def apply(self):
+        """
+        Rebuild the text with all collected edits.
+
+        Returns:
+            str: the new text.
+        """
+        if not self.edits:
+            return self.text
+        parts = []
+        position = 0
+        for start, end, replacement in sorted(self.edits, key=lambda edit: (edit[0], edit[1])):
+            if start < position:
+                continue
+            parts.append(self.text[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(self.text[position:])
+        return "".join(parts)
@@ -73,6 +73,27 @@ class Database:
             # Close the connection
             self.connection.close()
 
+    def stream_content_from_database(self, size=1000):
+        """Executes the current SQL query and yields the rows without keeping the whole result in memory.
+
+        Args:
+            size (int): The number of rows fetched from the server at a time.
+
+        Yields:
+            dict: The rows of the result.
+        """
+        connection = self.connection
+        try:
+            with connection.cursor(pymysql.cursors.SSDictCursor) as cursor:
+                cursor.execute(self._query)
+                while True:
+                    rows = cursor.fetchmany(size)
+                    if not rows:
+                        break
+                    yield from rows
+        finally:
+            connection.close()
+
     @connection.setter
     def connection(self, value):
         """Sets the current connection to the database.
@@ -20,6 +20,20 @@ def update_page_statuses_to_pending(session: Session, task_name: TaskName):
     session.commit()
 
 
+def priority_order(per_edit_limit=20):
+    """
+    Order pages by the work one edit can do on them.
+
+    Pages with more unarchived citations come first, capped at the number of
+    citations one edit handles, then more popular pages, then the oldest.
+    """
+    return (
+        func.least(Page.citation_count, per_edit_limit).desc(),
+        Page.popularity.desc(),
+        Page.update_date,
+    )
+
+
 def get_articles(session, thread_number, pages_type):
     if thread_number == 1:
         thread_number = 0
@@ -29,18 +43,18 @@ def get_articles(session, thread_number, pages_type):
     query1 = session.query(Page.id, Page.title, Page.thread_number). \
         filter_by(status=Status.PENDING, task_name=pages_type, thread_number=1). \
         filter(Page.update_date < now). \
-        order_by(Page.update_date). \
+        order_by(*priority_order()). \
         limit(200).offset(thread_number)
     query2 = session.query(Page.id, Page.title, Page.thread_number). \
         filter_by(status=Status.PENDING, task_name=pages_type, thread_number=2). \
         filter(Page.update_date < now). \
-        order_by(Page.update_date). \
+        order_by(*priority_order()). \
         limit(200).offset(thread_number)
 
     query3 = session.query(Page.id, Page.title, Page.thread_number). \
         filter_by(status=Status.PENDING, task_name=pages_type, thread_number=3). \
         filter(Page.update_date < now). \
-        order_by(Page.update_date). \
+        order_by(*priority_order()). \
         limit(200).offset(thread_number)
 
     yield from query1.all()
@@ -0,0 +1,21 @@
+"""
+Add the columns of database/models.py that are missing in the database.
+
+Importing the models only creates missing tables.  The jobs that fill and
+process the pages table run this script first, so the ALTER TABLE
+statements run once per job start instead of in every importing thread.
+"""
+
+from core.utils.schema import add_missing_columns
+from database.engine import engine
+from database.models import Base
+
+
+def main(*args: str) -> int:
+    for table, column in sorted(add_missing_columns(Base.metadata, engine)):
+        print(f"added column {table}.{column}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
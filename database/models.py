@@ -40,6 +40,12 @@ class Page(Base):
     create_date: Mapped[datetime] = mapped_column(insert_default=func.now())
     update_date: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.current_timestamp())
     task_name: Mapped[TaskName] = mapped_column(insert_default=TaskName.MAINTENANCE)
+    # estimated number of unarchived citations, used by webcite to schedule pages
+    citation_count: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
+    # page popularity signal (number of language links) used to break ties
+    popularity: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
+    # webcite passes in a row that archived nothing, the page waits longer after each one
+    idle_passes: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
 
     def __repr__(self) -> str:
         return f"pages(id={self.id!r}, title={self.title!r})"
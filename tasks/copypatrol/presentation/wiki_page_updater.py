@@ -1,5 +1,7 @@
 import pywikibot
 
+from core.utils.save_cache import save_if_changed
+
 
 class WikiPageUpdater:
     def __init__(self, site, page_name):
@@ -35,5 +37,4 @@ class WikiPageUpdater:
 [[تصنيف:قوالب صيانة ويكيبيديا]]
 </noinclude>"""
         text = text.replace("OPENEDNUMBER", str(open_cases_count))
-        page.text = text
-        page.save("تحديث v2.0.0")
+        save_if_changed(page, text, "تحديث v2.0.0")
@@ -1,6 +1,5 @@
 from database.helpers import is_page_present
 from module import get_pages
-from tasks.webcite.module import get_pages
 import logging
 import random
 from datetime import datetime
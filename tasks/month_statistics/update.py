@@ -14,6 +14,7 @@ import pywikibot
 import requests
 
 from core.utils.file import File
+from core.utils.save_cache import save_if_changed
 from core.utils.wikidb import Database
 
 script_dir = os.path.dirname(__file__)
@@ -204,8 +205,9 @@ text = str(text).replace("TOTAL_VIEWS", str(total_views))
 
 # print(new_pages_count_by_namespace)
 # print(db.query)
-page.text = text
 logger.info("Saving page content")
 
-page.save("v3.1.0 تحديث")
-logger.info("Page saved successfully")
+if save_if_changed(page, text, "v3.1.0 تحديث"):
+    logger.info("Page saved successfully")
+else:
+    logger.info("Page text did not change, save skipped")
@@ -5,7 +5,8 @@ from sqlalchemy import select
 
 from tasks.requests.core.module import PageProcessor, RequestsPage, RequestsScanner
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader, database_rows
 from core.utils.wikidb import Database
 
 # Create an instance of the RequestsPage class
@@ -15,6 +16,7 @@ type_of_request = 1
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
@@ -22,14 +24,14 @@ try:
         try:
             gen = []
             database = Database()
+            # only articles get the category, see AddCategoryHandler
             if request.to_namespace == 10:
                 to_page = pywikibot.Page(site, request.to_name)
                 if to_page.exists():
                     database.query = """select lt_title as prt_title from pagelinks
 inner join linktarget ON linktarget.lt_id = pagelinks.pl_target_id
 where pl_from = {} and pagelinks.pl_from_namespace = 10 and linktarget.lt_namespace = 0;""".format(to_page.pageid)
-                    database.get_content_from_database()
-                    gen = database.result
+                    gen = database_rows(database, namespace=0)
             else:
                 to_page = pywikibot.Page(site, request.to_name)
                 if to_page.exists():
@@ -40,19 +42,9 @@ where pl_from = {} and pagelinks.pl_from_namespace = 10 and linktarget.lt_namesp
                     and lt.lt_namespace = 14
                     and cla.cl_type = "page"
                     and page.page_namespace = 0""".format(to_page.pageid)
-                    database.get_content_from_database()
-                    gen = database.result
+                    gen = database_rows(database, namespace=0)
 
-            pages = []
-            for row in gen:
-                page_title = str(row['prt_title'], 'utf-8')
-                pages.append(Page(
-                    title=page_title,
-                    namespace=0
-                ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            loader.load(request, gen)
         except Exception as e:
             session.rollback()
             print("An error occurred while committing the changes:", e)
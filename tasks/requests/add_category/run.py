@@ -1,60 +1,84 @@
-import traceback
-
 import pywikibot
-from sqlalchemy import select, func, distinct
 from sqlalchemy.orm import Session
 
+from core.utils.wikidb import Database
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
-
-# Create an instance of the RequestsPage class
-site = pywikibot.Site()
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+from tasks.requests.core.wikitext import WikitextEditor
 
 type_of_request = 1
 
-try:
-    session = Session(engine)
-
-    stmt = select(Request).join(Page).filter(Request.status == Status.RECEIVED, Page.status == Status.PENDING,
-                                             Request.request_type == type_of_request).group_by(Request).having(
-        func.count(Page.id) == func.count(distinct(Page.id))).limit(100)
-
-    for request in session.scalars(stmt):
-
-        page_title = request.from_title
-        page_new_title = request.to_title
-
-        added_category = pywikibot.Category(site, request.from_name)
-
-        pages = session.query(Page).filter(Page.request == request, Page.status == Status.PENDING).limit(100).all()
-
-        for page in pages:
-            try:
-                p = pywikibot.Page(site, page.page_name)
-                if p.exists():
-                    categories = p.categories()
-                    has_category = False
-                    for category in categories:
-                        tem = pywikibot.Category(p.site, category.title())
-                        if tem.title(with_ns=False).lower() == added_category.title(with_ns=False).lower():
-                            has_category = True
-                            break
-
-                    if not has_category:
-                        text = p.text
-                        text += "\n[[" + added_category.title(with_ns=True) + "]]"
-                        p.text = text
-                        p.save(summary="بوت:إضافة تصنيف")
-
-                    page.status = Status.COMPLETED
-                    session.commit()
-            except Exception as e:
-                print(f"An error occurred where save : {e}")
-                just_the_string = traceback.format_exc()
-                print(just_the_string)
-                session.rollback()
-
-except Exception as e:
-    print(f"An error occurred: {e}")
-    just_the_string = traceback.format_exc()
-    print(just_the_string)
+members_query = """select page.page_title as prt_title, page.page_namespace as prt_namespace from categorylinks cla
+inner join page on page.page_id = cla.cl_from
+inner join linktarget lt ON cla.cl_target_id = lt.lt_id
+where lt.lt_title in (select page.page_title from page where page_id = {})
+and lt.lt_namespace = 14"""
+
+
+class AddCategoryHandler(RequestHandler):
+    """
+    Adds the category of a request to its pages.
+
+    The pages are loaded by add_category/load.py, which reads the articles
+    linked from a template or in a category, as before the executor.  The
+    membership check reads the members of every namespace, so it works for
+    the pages of any namespace the loader stores.
+    """
+    request_type = type_of_request
+
+    def __init__(self, site):
+        super().__init__(site)
+        # request id -> category to add
+        self.categories = {}
+        # request id -> (namespace, title) of the pages already in the category, None if unknown
+        self.members = {}
+
+    def order_pages(self, query):
+        return query
+
+    def start_request(self, request):
+        category = pywikibot.Category(self.site, request.from_name)
+        self.categories[request.id] = category
+        self.members[request.id] = self.load_members(category)
+
+    def load_members(self, category):
+        """
+        Return the (namespace, title) pairs of the pages in category from the replica, or None.
+
+        One query per request replaces reading the categories of every page.
+        """
+        try:
+            if not category.exists():
+                return None
+            database = Database()
+            database.query = members_query.format(category.pageid)
+            return {(row['prt_namespace'], str(row['prt_title'], 'utf-8').replace("_", " "))
+                    for row in database.stream_content_from_database()}
+        except Exception as e:
+            print(f"An error occurred while loading the members of {category.title()}: {e}")
+            return None
+
+    def transform(self, request, p, text):
+        added_category = self.categories[request.id]
+        # the link may have been added by an earlier request of the same edit
+        if any(WikitextEditor(text).category_links(added_category.title(with_ns=False))):
+            return text
+        # the members also include pages categorized by their templates
+        members = self.members.get(request.id)
+        if members is not None and (p.namespace(), p.title(with_ns=False)) in members:
+            return text
+        return text + "\n[[" + added_category.title(with_ns=True) + "]]"
+
+    def summary(self, request):
+        return "بوت:إضافة تصنيف"
+
+
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        RequestExecutor(site, session, [AddCategoryHandler]).run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,20 @@
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 
 home_path = os.path.expanduser("~")
 database_path = os.path.join(home_path, "requests.db")
 
 engine = create_engine(f"sqlite+pysqlite:////{database_path}",echo=False)
+
+
+@event.listens_for(engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    # WAL lets the load and run jobs read while another process writes
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-20000")
+    cursor.close()
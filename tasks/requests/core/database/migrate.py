@@ -0,0 +1,26 @@
+"""
+Add the columns and indexes of the requests.db models that are missing in the database.
+
+Importing the models only creates missing tables.  The requests jobs run
+this script first, like database/migrate.py for the pages database, so the
+ALTER TABLE statements run once per job start.
+"""
+
+from core.utils.schema import add_missing_columns, add_missing_indexes
+from tasks.requests.core.database.engine import engine
+from tasks.requests.core.database.models import Base, count_pages
+
+
+def main(*args: str) -> int:
+    Base.metadata.create_all(engine)
+    added = add_missing_columns(Base.metadata, engine)
+    for table, column in sorted(added):
+        print(f"added column {table}.{column}")
+    if ("requests", "pending_count") in added:
+        count_pages(engine)
+    add_missing_indexes(Base.metadata, engine)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
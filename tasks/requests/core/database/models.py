@@ -1,6 +1,6 @@
 from typing import List as typing_list
 
-from sqlalchemy import String, INTEGER, TIMESTAMP,func,ForeignKey,Text
+from sqlalchemy import String, INTEGER, TIMESTAMP,func,ForeignKey,Text,Index,select,update,Float
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
@@ -25,6 +25,9 @@ class Status(enum.Enum):
 
 class Request(Base):
     __tablename__ = "requests"
+    __table_args__ = (
+        Index("ix_requests_type_status_pending", "request_type", "status", "pending_count"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     from_title: Mapped[str] = mapped_column(String(255))
@@ -36,6 +39,13 @@ class Request(Base):
     status: Mapped[Status] = mapped_column(insert_default=Status.PENDING)
     create_date: Mapped[datetime] = mapped_column(insert_default=func.now())
     update_date: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.current_timestamp())
+    # number of pages stored while the request is loaded, the load resumes from here after a crash
+    loaded_count: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
+    # pages of the request by status, updated in the transactions that change the pages
+    pending_count: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
+    completed_count: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
+    # failed attempts to edit a page of the request, the page stays pending and is tried again
+    failed_count: Mapped[int] = mapped_column(INTEGER, insert_default=0, server_default="0")
 
 
     @hybrid_property
@@ -49,12 +59,26 @@ class Request(Base):
         back_populates="request", cascade="all, delete-orphan"
     )
 
+    def add_pending(self, number):
+        self.pending_count = (self.pending_count or 0) + number
+
+    def complete_page(self, page):
+        """Mark one pending page of the request as completed and update the counters."""
+        if page.status == Status.COMPLETED:
+            return
+        page.status = Status.COMPLETED
+        self.pending_count = max((self.pending_count or 0) - 1, 0)
+        self.completed_count = (self.completed_count or 0) + 1
+
     def __repr__(self) -> str:
         return f"User(id={self.id!r}, from={self.from_title!r}, to={self.to_title!r})"
 
 
 class Page(Base):
     __tablename__ = "pages"
+    __table_args__ = (
+        Index("ix_pages_request_status_namespace", "request_id", "status", "namespace"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -74,4 +98,32 @@ class Page(Base):
         return f"pages(id={self.id!r}, title={self.title!r})"
 
 
+class PageEvent(Base):
+    """One page of a request that was processed, or failed, by the run stage."""
+    __tablename__ = "page_events"
+    __table_args__ = (
+        Index("ix_page_events_date_type", "create_date", "request_type"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    request_id: Mapped[int] = mapped_column(INTEGER)
+    request_type: Mapped[int] = mapped_column(INTEGER)
+    failed: Mapped[bool] = mapped_column(insert_default=False)
+    # seconds spent saving the page, 0 when no edit was needed
+    save_seconds: Mapped[float] = mapped_column(Float, insert_default=0)
+    create_date: Mapped[datetime] = mapped_column(insert_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"page_events(id={self.id!r}, request_id={self.request_id!r}, failed={self.failed!r})"
+
+
+def count_pages(bind):
+    """Fill the page counters of requests created before the counters existed."""
+    with bind.begin() as connection:
+        for column, status in ((Request.pending_count, Status.PENDING), (Request.completed_count, Status.COMPLETED)):
+            count = select(func.count(Page.id)).where(Page.request_id == Request.id,
+                                                      Page.status == status).scalar_subquery()
+            connection.execute(update(Request).values({column: count}))
+
+
 Base.metadata.create_all(engine)
@@ -0,0 +1,281 @@
+import time
+import traceback
+
+import pywikibot
+from sqlalchemy import select
+
+from core.utils.helpers import check_status
+from tasks.requests.core.database.models import Request, Status, Page, PageEvent
+
+
+class RequestHandler:
+    """
+    Base class for the run stage of one request type.
+
+    A handler turns one pending page of a request into new page text.  The
+    executor fetches the page, calls transform and saves the result with
+    the handler summary, so handlers only describe the change itself.
+    """
+    request_type = None
+    # number of requests and of pages per request picked in one run
+    request_limit = 100
+    page_limit = 100
+    # page that stops the handler when its text is not "لا"
+    stop_page = None
+    stop_page_cache_seconds = 60
+
+    def __init__(self, site):
+        self.site = site
+        self._can_run = None
+        self._can_run_checked = 0
+
+    def can_run(self):
+        if self.stop_page is None:
+            return True
+        now = time.monotonic()
+        if self._can_run is None or now - self._can_run_checked > self.stop_page_cache_seconds:
+            self._can_run = check_status(self.stop_page)
+            self._can_run_checked = now
+        return self._can_run
+
+    def order_pages(self, query):
+        return query.order_by(Page.namespace.desc())
+
+    def start_request(self, request):
+        """Prepare per request data before its pages are processed."""
+
+    def load_page(self, request, page):
+        return pywikibot.Page(self.site, title=str(page.page_name), ns=page.namespace)
+
+    def transform(self, request, p, text):
+        """
+        Return the new text of page p for request, or text when nothing changes.
+
+        Earlier requests of the same edit may already have changed text in
+        memory, so the current state of the page is read from text only and
+        p is used for its title, namespace and site.
+        """
+        raise NotImplementedError
+
+    def transform_batch(self, requests, p, text):
+        """
+        Apply several requests of this handler to page p at once.
+
+        Handlers that can do this faster than one transform per request
+        override it.
+
+        Returns:
+            tuple: (new text, requests that changed the text).
+        """
+        changed = []
+        for request in requests:
+            new_text = self.transform(request, p, text)
+            if new_text != text:
+                changed.append(request)
+                text = new_text
+        return text, changed
+
+    def summary(self, request):
+        raise NotImplementedError
+
+
+def page_key(page):
+    """
+    Key of the wiki page a Page row points to, equal for all spellings of its title.
+    """
+    title = str(page.title).replace("_", " ").strip()
+    return page.namespace, title[:1].upper() + title[1:]
+
+
+def join_summaries(summaries):
+    return "، ".join(dict.fromkeys(summaries))
+
+
+class RequestExecutor:
+    """
+    Runs the pending pages of all request types with one site and one session.
+
+    Work is interleaved page by page between request types, so a large
+    request of one type does not hold back the other types.  The work is
+    read and planned in windows of window_size wiki pages, so editing starts
+    with the first window and a failure loses at most one window.  Pending
+    pages of different requests that point to the same wiki page within a
+    window are planned together: the page is fetched once, every transform
+    is applied in memory and the page is saved once with a combined summary.
+
+    Args:
+        site (pywikibot.Site): the site shared by all handlers.
+        session (Session): the requests.db session shared by all handlers.
+        handlers (list): RequestHandler subclasses to run.
+    """
+
+    # number of titles preloaded in one API call
+    preload_size = 50
+    # number of wiki pages planned and saved before more pending work is read
+    window_size = 50
+
+    def __init__(self, site, session, handlers):
+        self.site = site
+        self.session = session
+        self.handlers = [handler(site) for handler in handlers]
+        self.processed = 0
+
+    def pending_requests(self, handler):
+        # an index lookup on the page counters instead of joining the pages
+        stmt = select(Request).filter(Request.request_type == handler.request_type,
+                                      Request.status == Status.RECEIVED,
+                                      Request.pending_count > 0).limit(handler.request_limit)
+        return self.session.scalars(stmt).all()
+
+    def pending_pages(self, handler, request):
+        query = self.session.query(Page).filter(Page.request == request, Page.status == Status.PENDING)
+        return handler.order_pages(query).limit(handler.page_limit).all()
+
+    def work(self, handler):
+        """Yield (handler, request, page) items of one handler."""
+        if not handler.can_run():
+            return
+        for request in self.pending_requests(handler):
+            handler.start_request(request)
+            for page in self.pending_pages(handler, request):
+                yield handler, request, page
+
+    def interleaved_work(self):
+        """Yield the work items of all handlers, one handler after the other."""
+        queues = [self.work(handler) for handler in self.handlers]
+        while queues:
+            for queue in list(queues):
+                try:
+                    yield next(queue)
+                except StopIteration:
+                    queues.remove(queue)
+                except Exception as e:
+                    print(f"An error occurred while loading requests: {e}")
+                    print(traceback.format_exc())
+                    queues.remove(queue)
+
+    def windows(self):
+        """
+        Yield plans of at most window_size wiki pages from the interleaved work.
+
+        Work items are read lazily, so a request is started only when its
+        pages are reached, and each window is edited and committed before the
+        next one is planned.  Pending items of one wiki page are grouped
+        within a window.
+
+        Yields:
+            list: lists of (handler, request, page) items, one list per wiki
+            page, in the order the pages first appear in the interleaved work.
+        """
+        groups = {}
+        for item in self.interleaved_work():
+            groups.setdefault(page_key(item[2]), []).append(item)
+            if len(groups) >= self.window_size:
+                yield list(groups.values())
+                groups = {}
+        if groups:
+            yield list(groups.values())
+
+    def preloaded(self, plan):
+        """
+        Yield (group, pywikibot page) pairs of a plan with the pages preloaded.
+
+        Content, existence and latest revision of preload_size pages are
+        fetched in one API call instead of one request per page.
+        """
+        for index in range(0, len(plan), self.preload_size):
+            chunk = plan[index:index + self.preload_size]
+            pages = [group[0][0].load_page(group[0][1], group[0][2]) for group in chunk]
+            try:
+                # preloadpages updates the given page objects in place
+                for _ in self.site.preloadpages(pages, groupsize=self.preload_size, content=True):
+                    pass
+            except Exception as e:
+                # the pages are then loaded one by one when used
+                print(f"An error occurred while preloading pages: {e}")
+            yield from zip(chunk, pages)
+
+    def run(self):
+        for plan in self.windows():
+            for group, p in self.preloaded(plan):
+                self.process(group, p)
+        return self.processed
+
+    def process(self, group, p=None):
+        handler, request, page = group[0]
+        try:
+            if p is None:
+                p = handler.load_page(request, page)
+            save_seconds = 0
+            if p.exists():
+                text = p.text
+                new_text, summaries, done = self.apply(p, text, group)
+                if new_text != text:
+                    p.text = new_text
+                    started = time.monotonic()
+                    p.save(summary=join_summaries(summaries))
+                    save_seconds = time.monotonic() - started
+                else:
+                    print("skip " + p.title())
+            else:
+                print(f"Page '{page.page_name}' does not exist. Skipping...")
+                done = [item[2] for item in group]
+            for page in done:
+                page.request.complete_page(page)
+                self.session.add(PageEvent(request_id=page.request_id, request_type=page.request.request_type,
+                                           save_seconds=save_seconds))
+            self.session.commit()
+            self.processed += len(done)
+        except Exception as e:
+            print(f"An error occurred where save : {e}")
+            print(traceback.format_exc())
+            self.session.rollback()
+            self.record_failure(group)
+
+    def record_failure(self, group):
+        """Count a failed attempt for every request of group, its pages stay pending."""
+        try:
+            for _, request, page in group:
+                request.failed_count = (request.failed_count or 0) + 1
+                self.session.add(PageEvent(request_id=request.id, request_type=request.request_type, failed=True))
+            self.session.commit()
+        except Exception as e:
+            print(f"An error occurred while recording a failure: {e}")
+            self.session.rollback()
+
+    def apply(self, p, text, group):
+        """
+        Apply the transforms of all items of one page in memory.
+
+        Returns:
+            tuple: (new text, summaries of the transforms that changed it,
+            Page rows that are done).
+        """
+        summaries = []
+        done = []
+        for handler, items in self.by_handler(group):
+            if not handler.can_run():
+                continue
+            requests = [request for _, request, _ in items]
+            try:
+                if len(items) == 1:
+                    new_text = handler.transform(requests[0], p, text)
+                    changed = requests if new_text != text else []
+                else:
+                    new_text, changed = handler.transform_batch(requests, p, text)
+            except Exception as e:
+                print(f"An error occurred while processing {items[0][2].page_name}: {e}")
+                print(traceback.format_exc())
+                continue
+            summaries.extend(handler.summary(request) for request in changed)
+            text = new_text
+            done.extend(page for _, _, page in items)
+        return text, summaries, done
+
+    @staticmethod
+    def by_handler(group):
+        """Split the items of one page into (handler, items) pairs, keeping the handler order."""
+        handlers = {}
+        for item in group:
+            handlers.setdefault(item[0], []).append(item)
+        return handlers.items()
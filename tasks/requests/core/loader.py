@@ -0,0 +1,74 @@
+from sqlalchemy import insert, select
+
+from tasks.requests.core.database.models import Page, Status
+
+
+class PageLoader:
+    """
+    Stores the pages of a request in chunks while they are read.
+
+    Pages are written with one executemany insert per chunk and the request
+    loaded_count and pending_count are updated in the same transaction, so an error only loses
+    the current chunk.  A request that stopped in the middle stays PENDING
+    and the next load skips the pages it already stored.
+
+    Args:
+        session (Session): the requests.db session.
+        chunk_size (int): number of pages written in one transaction.
+    """
+
+    def __init__(self, session, chunk_size=2000):
+        self.session = session
+        self.chunk_size = chunk_size
+
+    def stored_keys(self, request):
+        if not request.loaded_count:
+            return set()
+        stmt = select(Page.title, Page.namespace).filter(Page.request_id == request.id)
+        return {(title, namespace) for title, namespace in self.session.execute(stmt)}
+
+    def load(self, request, rows):
+        """
+        Store the (title, namespace) rows of request and mark it RECEIVED.
+
+        Returns:
+            int: number of pages stored by this call.
+        """
+        seen = self.stored_keys(request)
+        if seen:
+            print(f"resume request {request.id} after {request.loaded_count} pages")
+        chunk = []
+        stored = 0
+        for title, namespace in rows:
+            key = (title, int(namespace))
+            if key in seen:
+                continue
+            seen.add(key)
+            chunk.append({"title": title, "namespace": key[1], "request_id": request.id,
+                          "status": Status.PENDING})
+            if len(chunk) >= self.chunk_size:
+                stored += self._write(request, chunk)
+                chunk = []
+        if chunk:
+            stored += self._write(request, chunk)
+        request.status = Status.RECEIVED
+        self.session.commit()
+        return stored
+
+    def _write(self, request, chunk):
+        self.session.execute(insert(Page), chunk)
+        request.loaded_count = (request.loaded_count or 0) + len(chunk)
+        request.add_pending(len(chunk))
+        self.session.commit()
+        return len(chunk)
+
+
+def database_rows(database, namespace=None):
+    """
+    Yield (title, namespace) rows of a replica query streamed from database.
+
+    Rows use the prt_title column and the prt_namespace column, or namespace
+    when it is given.
+    """
+    for row in database.stream_content_from_database():
+        yield str(row['prt_title'], 'utf-8'), row['prt_namespace'] if namespace is None else namespace
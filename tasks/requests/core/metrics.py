@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, func, case, delete
+
+from tasks.requests.core.database.models import Request, Status, PageEvent
+
+request_type_names = {
+    1: "إضافة تصنيف",
+    2: "استبدال الوصلات",
+    3: "توزيع قالب",
+    4: "أرشفة الاستشهادات",
+    5: "توزيع بوابة",
+    6: "استبدال القوالب",
+    7: "إزالة",
+}
+
+
+def utc_now():
+    # requests.db stores func.now() timestamps in UTC without a time zone
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class RequestMetrics:
+    """
+    Throughput, latency and progress of the requests in requests.db.
+
+    Rates are pages per minute over the last window_minutes, measured from
+    the page events written by the executor, so they include the time
+    between runs and can be used directly to estimate when a request ends.
+
+    Args:
+        session (Session): the requests.db session.
+        window_minutes (int): length of the sliding window.
+        now (datetime, optional): the current UTC time, for tests.
+    """
+
+    def __init__(self, session, window_minutes=180, now=None):
+        self.session = session
+        self.window_minutes = window_minutes
+        self.now = now or utc_now()
+
+    def type_stats(self):
+        """
+        Return request type -> dict of pages, failed, rate (pages per minute)
+        and save_seconds (average save latency) over the window.
+        """
+        since = self.now - timedelta(minutes=self.window_minutes)
+        stmt = select(
+            PageEvent.request_type,
+            func.sum(case((PageEvent.failed.is_(False), 1), else_=0)),
+            func.sum(case((PageEvent.failed.is_(True), 1), else_=0)),
+            func.avg(case((PageEvent.save_seconds > 0, PageEvent.save_seconds), else_=None)),
+        ).filter(PageEvent.create_date >= since).group_by(PageEvent.request_type)
+        stats = {}
+        for request_type, pages, failed, save_seconds in self.session.execute(stmt):
+            stats[request_type] = {
+                "pages": pages or 0,
+                "failed": failed or 0,
+                "rate": (pages or 0) / self.window_minutes,
+                "save_seconds": save_seconds,
+            }
+        return stats
+
+    def open_requests(self):
+        """Return the requests that are loading or still have pending pages."""
+        stmt = select(Request).filter(
+            (Request.status == Status.PENDING) |
+            ((Request.status == Status.RECEIVED) & (Request.pending_count > 0))
+        ).order_by(Request.request_type, Request.id)
+        return self.session.scalars(stmt).all()
+
+    def eta(self, pending, rate):
+        """Return the expected end time of pending pages at rate pages per minute, or None."""
+        if not pending:
+            return self.now
+        if not rate:
+            return None
+        return self.now + timedelta(minutes=pending / rate)
+
+    def rows(self):
+        """
+        Return one dict per open request with its counters and ETA.
+
+        Requests of the same type share the rate of their type, so a request
+        waits for the pages of the requests before it.
+        """
+        stats = self.type_stats()
+        queued = {}
+        rows = []
+        for request in self.open_requests():
+            rate = stats.get(request.request_type, {}).get("rate", 0)
+            queued[request.request_type] = queued.get(request.request_type, 0) + (request.pending_count or 0)
+            rows.append({
+                "request": request,
+                "type": request.request_type,
+                "loading": request.status == Status.PENDING,
+                "pending": request.pending_count or 0,
+                "completed": request.completed_count or 0,
+                "failed": request.failed_count or 0,
+                "eta": None if request.status == Status.PENDING else self.eta(queued[request.request_type], rate),
+            })
+        return rows
+
+
+def prune_events(session, keep_days=7, now=None):
+    """
+    Delete the page events older than keep_days, the rates only read the last window.
+
+    Returns:
+        int: the number of deleted events.
+    """
+    before = (now or utc_now()) - timedelta(days=keep_days)
+    result = session.execute(delete(PageEvent).where(PageEvent.create_date < before))
+    session.commit()
+    return result.rowcount
+
+
+def format_eta(eta):
+    return eta.strftime("%Y-%m-%d %H:%M") + " (UTC)" if eta is not None else "غير معروف"
+
+
+def status_table(metrics):
+    """Return the wikitext of the status page built from a RequestMetrics."""
+    stats = metrics.type_stats()
+    rows = metrics.rows()
+    pending_by_type = {}
+    for row in rows:
+        pending_by_type[row["type"]] = pending_by_type.get(row["type"], 0) + row["pending"]
+
+    lines = [
+        f"آخر تحديث: {metrics.now.strftime('%Y-%m-%d %H:%M')} (UTC)، "
+        f"المعدلات محسوبة على آخر {metrics.window_minutes} دقيقة.",
+        "",
+        "== حسب النوع ==",
+        '{| class="wikitable sortable"',
+        "! النوع !! صفحات متبقية !! صفحات في الدقيقة !! متوسط زمن الحفظ (ثانية) !! محاولات فاشلة",
+    ]
+    for request_type in sorted(set(stats) | set(pending_by_type)):
+        stat = stats.get(request_type, {})
+        save_seconds = stat.get("save_seconds")
+        lines.append("|-")
+        lines.append(f"| {request_type_names.get(request_type, request_type)} || {pending_by_type.get(request_type, 0)}"
+                     f" || {stat.get('rate', 0):.2f} || {'' if save_seconds is None else f'{save_seconds:.1f}'}"
+                     f" || {stat.get('failed', 0)}")
+    lines.append("|}")
+    lines += [
+        "",
+        "== الطلبات المفتوحة ==",
+        '{| class="wikitable sortable"',
+        "! رقم !! النوع !! من !! إلى !! متبقية !! مكتملة !! فشل !! الانتهاء المتوقع",
+    ]
+    for row in rows:
+        request = row["request"]
+        to_name = f"[[:{request.to_name}]]" if request.to_title and request.to_namespace is not None else ""
+        eta = "جاري التحميل" if row["loading"] else format_eta(row["eta"])
+        lines.append("|-")
+        lines.append(f"| {request.id} || {request_type_names.get(row['type'], row['type'])} || "
+                     f"[[:{request.from_name}]] || {to_name} || {row['pending']} || {row['completed']} || "
+                     f"{row['failed']} || {eta}")
+    lines.append("|}")
+    return "\n".join(lines)
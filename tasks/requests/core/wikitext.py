@@ -0,0 +1,52 @@
+import wikitextparser as wtp
+
+from core.utils.helpers import prepare_str
+from core.utils.text_edits import TextEdits
+
+
+def normalized_names(names):
+    return frozenset(prepare_str(name) for name in names)
+
+
+class WikitextEditor:
+    """
+    Edits templates and links of one page text in place.
+
+    The text is parsed once, matching nodes are found by their normalized
+    name and every change is recorded as a span edit on the original text,
+    so nothing is copied and the text is rebuilt once by apply.
+
+    Args:
+        text (str): the page text.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.parsed = wtp.parse(text)
+        self.edits = TextEdits(text)
+
+    def templates(self, names):
+        """Yield the templates whose name is one of names, compared with prepare_str."""
+        names = normalized_names(names)
+        for template in self.parsed.templates:
+            if prepare_str(template.name) in names:
+                yield template
+
+    def category_links(self, category):
+        """Yield the links that add the page to category, given without namespace."""
+        category = prepare_str(category)
+        for link in self.parsed.wikilinks:
+            if link.title.startswith("تصنيف:") and prepare_str(link.title.replace("تصنيف:", "")) == category:
+                yield link
+
+    def remove(self, node):
+        self.edits.add(*node.span, "")
+
+    def rename(self, template, name):
+        # the name starts right after the opening braces
+        start = template.span[0] + 2
+        self.edits.add(start, start + len(template.name), name)
+
+    def apply(self):
+        """Return the text with all recorded edits."""
+        return self.edits.apply()
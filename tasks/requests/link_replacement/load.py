@@ -5,7 +5,9 @@ from sqlalchemy import select
 
 from tasks.requests.core.module import PageProcessor, RequestsPage, RequestsScanner
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status,Page
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader
+from tasks.requests.link_replacement.run import redirect_titles
 
 # Create an instance of the RequestsPage class
 site = pywikibot.Site()
@@ -14,22 +16,19 @@ type_of_request = 2
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
     for request in session.scalars(stmt):
         try:
             page = pywikibot.Page(site, request.from_name)
-            gen = page.backlinks(follow_redirects=False, namespaces=[0, 14, 10, 6], content=True)
-            pages = []
-            for p in gen:
-                pages.append(Page(
-                    title=p.title(with_ns=False),
-                    namespace=int(p.namespace())
-                ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            # pages linking through a redirect are edited too, the redirects themselves are left alone
+            redirects = set(redirect_titles(page))
+            # only the titles are stored, the text is fetched when the page is edited
+            gen = page.backlinks(follow_redirects=bool(redirects), namespaces=[0, 14, 10, 6], content=False)
+            loader.load(request, ((p.title(with_ns=False), p.namespace()) for p in gen
+                                  if p.title() not in redirects))
         except Exception as e:
             session.rollback()
             print("An error occurred while committing the changes:", e)
@@ -1,3 +1,110 @@
-# get admin list
-# get users list
-# merege lists
+import re
+
+
+def normalize_title(title):
+    """Return the form MediaWiki stores a title in: spaces, no extra blanks, first letter upper case."""
+    title = re.sub(r"[ _]+", " ", title).strip()
+    return title[:1].upper() + title[1:]
+
+
+def title_pattern(title):
+    """
+    Return a regex matching all spellings of a link target that point to title.
+
+    Spaces may be written as underscores and the first letter in either case.
+    """
+    title = normalize_title(title)
+    if not title:
+        return None
+    first = title[0]
+    if first.lower() != first.upper():
+        head = "[" + re.escape(first.upper()) + re.escape(first.lower()) + "]"
+    else:
+        head = re.escape(first)
+    words = [re.escape(word) for word in title[1:].split(" ")]
+    return head + "[ _]+".join(words)
+
+
+# the prefix and the suffixes the pipe trick drops, as in the pre-save transform of MediaWiki
+pipe_trick_prefix = re.compile(r"^:?[ _0-9A-Za-z\u0080-\uffff-]+:|^:")
+pipe_trick_suffix = re.compile(r"(?: ?\([^()]+\)|(?:, |，).+)$")
+
+
+def pipe_trick(target):
+    """Return the label MediaWiki gives [[target|]]: without prefix, parenthesized or comma suffix."""
+    label = pipe_trick_prefix.sub("", target.replace("_", " ").strip(), count=1)
+    return pipe_trick_suffix.sub("", label, count=1)
+
+
+class LinkRewriter:
+    """
+    Rewrites the wiki links of many source titles in one pass over a text.
+
+    All source titles and their aliases, e.g. the redirects to them, are
+    compiled into one pattern, and every matching link is rebuilt by one
+    re.sub call.  Links keep their leading colon, section and label.  A link
+    without a label, or with the empty label of the pipe trick, keeps the
+    text it showed before.
+
+    Args:
+        replacements (iterable): (source title, destination title) pairs.
+        aliases (dict, optional): source title -> other titles whose links
+         are rewritten to the destination of the source.
+    """
+
+    def __init__(self, replacements, aliases=None):
+        self.destinations = {}
+        # normalized title of a link target -> normalized source title it stands for
+        self.sources = {}
+        for source, destination in replacements:
+            source = normalize_title(source)
+            # the first request for a title wins when requests disagree
+            if source not in self.destinations:
+                self.destinations[source] = destination
+                self.sources[source] = source
+        for source, titles in (aliases or {}).items():
+            source = normalize_title(source)
+            if source not in self.destinations:
+                continue
+            destination = normalize_title(self.destinations[source])
+            for title in titles:
+                title = normalize_title(title)
+                # a title that is itself a source keeps its own destination
+                if title != destination:
+                    self.sources.setdefault(title, source)
+        patterns = [title_pattern(title) for title in self.sources]
+        patterns = sorted((pattern for pattern in patterns if pattern), key=len, reverse=True)
+        self.pattern = None
+        if patterns:
+            self.pattern = re.compile(
+                r"\[\[(?P<colon>[ _]*:)?[ _]*(?P<target>" + "|".join(patterns) + r")[ _]*"
+                r"(?P<section>#[^|\]]*)?(?P<label>\|(?:(?!\]\]).)*?)?\]\]"
+            )
+
+    def rewrite(self, text):
+        """
+        Rewrite the links of all source titles in text.
+
+        Returns:
+            tuple: (new text, set of the normalized source titles that were replaced).
+        """
+        replaced = set()
+        if self.pattern is None:
+            return text, replaced
+
+        def replace(match):
+            source = self.sources.get(normalize_title(match.group("target")))
+            if source is None:
+                return match.group(0)
+            replaced.add(source)
+            destination = self.destinations[source]
+            section = match.group("section") or ""
+            label = match.group("label")
+            if label is None:
+                label = "|" + match.group("target").replace("_", " ") + section
+            elif not label[1:].strip():
+                label = "|" + pipe_trick(match.group("target"))
+            colon = ":" if match.group("colon") else ""
+            return "[[" + colon + destination + section + label + "]]"
+
+        return self.pattern.sub(replace, text), replaced
@@ -1,62 +1,69 @@
-import re
-
 import pywikibot
-from sqlalchemy import select, func, distinct
 from sqlalchemy.orm import Session
 
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
-
-# Create an instance of the RequestsPage class
-site = pywikibot.Site()
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+from tasks.requests.link_replacement.module import LinkRewriter, normalize_title
 
 type_of_request = 2
 
-try:
-    session = Session(engine)
-
-    stmt = select(Request).join(Page).filter(Request.status == Status.RECEIVED, Page.status == Status.PENDING,
-                                             Request.request_type == type_of_request).group_by(Request).having(
-        func.count(Page.id) == func.count(distinct(Page.id))).limit(100)
-
-    for request in session.scalars(stmt):
-
-        page_title = request.from_title
-        page_new_title = request.to_title
-
-        pages = session.query(Page).filter(Page.request == request, Page.status == Status.PENDING).order_by(
-            Page.namespace.desc()).limit(100).all()
-
-        for page in pages:
-            try:
-                p = pywikibot.Page(site, page.page_name)
-                print(p.title())
-                text = str(p.text)
-                reg_str = r"\[\[(" + re.escape(page_title) + r")(\|(?:.*?))?\]\]"
-                link_list = re.findall(reg_str, text)
-                # if link_list:
-                for r in link_list:
-                    r_link = r[0]
-                    r_title = r[1]
-                    if r_title == '':
-                        r_title = "|" + r_link
-                    old_link = "[[" + r[0] + r[1] + "]]"
-                    new_link = "[[" + page_new_title + r_title + "]]"
-                    text = text.replace(old_link, new_link)
-
-                p.text = text
-                # print(text)
-                if not p.exists():
-                    print(f"Page '{page.page_name}' does not exist. Skipping...")
-                    continue
-                p.save(
-                    summary="بوت:[[ويكيبيديا:طلبات استبدال الوصلات]] استبدال [[" + page_title + "]] ب [[" + page_new_title + "]]")
-
-                page.status = Status.COMPLETED
-                session.commit()
-            except Exception as e:
-                print(f"An error occurred where save : {e}")
-                session.rollback()
-
-except Exception as e:
-    print(f"An error occurred: {e}")
+
+def redirect_titles(page):
+    """Return the titles of the redirects to page, links to them are replaced as well."""
+    try:
+        return [redirect.title() for redirect in page.redirects()]
+    except Exception as e:
+        print(f"An error occurred while loading the redirects to {page.title()}: {e}")
+        return []
+
+
+class LinkReplacementHandler(RequestHandler):
+    request_type = type_of_request
+    # number of compiled LinkRewriter objects kept, the least recently used is dropped
+    rewriter_cache_size = 32
+
+    def __init__(self, site):
+        super().__init__(site)
+        # request ids -> LinkRewriter compiled for them, in the order they were last used
+        self.rewriters = {}
+        # request id -> titles of the redirects to its source page
+        self.redirects = {}
+
+    def start_request(self, request):
+        self.redirects[request.id] = redirect_titles(pywikibot.Page(self.site, request.from_name))
+
+    def rewriter(self, requests):
+        key = tuple(request.id for request in requests)
+        rewriter = self.rewriters.pop(key, None)
+        if rewriter is None:
+            rewriter = LinkRewriter(((request.from_name, request.to_name) for request in requests),
+                                    aliases={request.from_name: self.redirects.get(request.id, ())
+                                             for request in requests})
+            if len(self.rewriters) >= self.rewriter_cache_size:
+                del self.rewriters[next(iter(self.rewriters))]
+        self.rewriters[key] = rewriter
+        return rewriter
+
+    def transform(self, request, p, text):
+        return self.transform_batch([request], p, text)[0]
+
+    def transform_batch(self, requests, p, text):
+        print(p.title())
+        # one pattern and one pass for all the link replacements of the page
+        text, replaced = self.rewriter(requests).rewrite(text)
+        return text, [request for request in requests if normalize_title(request.from_name) in replaced]
+
+    def summary(self, request):
+        return "بوت:[[ويكيبيديا:طلبات استبدال الوصلات]] استبدال [[" + request.from_title + "]] ب [[" + \
+            request.to_title + "]]"
+
+
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        RequestExecutor(site, session, [LinkReplacementHandler]).run()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 
 from core.utils.wikidb import Database
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader, database_rows
 
 # Create an instance of the RequestsPage class
 site = pywikibot.Site()
@@ -47,13 +48,13 @@ portal_query = """select p1.page_id,p1.page_title  as "prt_title" from pagelinks
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
     for request in session.scalars(stmt):
         try:
             gen = []
-            pages = []
             database = Database()
             from_page = pywikibot.Page(site, title=request.from_name)
             to_page = pywikibot.Page(site, title=request.to_name)
@@ -63,33 +64,19 @@ try:
                 # template
                 if request.from_namespace == 10:
                     database.query = template_query.replace("FROM_ID", str(from_id)).replace("TO_ID", str(to_id))
-                    database.get_content_from_database()
-                    gen = database.result
+                    gen = database_rows(database, namespace=0)
                 # category
                 elif request.from_namespace == 14:
                     database.query = category_query.replace("FROM_ID", str(from_id)).replace("TO_ID", str(to_id))
-                    database.get_content_from_database()
-                    gen = database.result
+                    gen = database_rows(database, namespace=0)
                 # portal
                 elif request.from_namespace == 100:
                     database.query = portal_query.replace("FROM_ID", str(from_id)).replace("TO_ID", str(to_id))
-                    database.get_content_from_database()
-                    gen = database.result
+                    gen = database_rows(database, namespace=0)
                 elif request.from_namespace == 0:
-                    pages.append(Page(
-                        title=request.from_name,
-                        namespace=0
-                    ))
+                    gen = [(request.from_name, 0)]
 
-            for row in gen:
-                page_title = str(row['prt_title'], 'utf-8')
-                pages.append(Page(
-                    title=page_title,
-                    namespace=0
-                ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            loader.load(request, gen)
 
         except Exception as e:
             session.rollback()
@@ -1,7 +1,4 @@
-import traceback
-
 import pywikibot
-from sqlalchemy import select, func, distinct
 from sqlalchemy.orm import Session
 
 from core.utils.helpers import prepare_str
@@ -9,64 +6,61 @@ from core.utils.pipeline import PipelineWithExtraSteps
 from tasks.maintenance.bots.portals_bar import PortalsBar
 from tasks.maintenance.bots.portals_merge import PortalsMerge
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
-
-# Create an instance of the RequestsPage class
-site = pywikibot.Site()
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+from tasks.requests.core.wikitext import WikitextEditor
 
 type_of_request = 5
 
-try:
-    session = Session(engine)
+# templates whose positional arguments are portal names, as listed by PortalsMerge
+portal_templates = ["صندوق بوابات", "Portal box", "مجموعة بوابات", "Portail", "وصلة بوابة", "صندوق بوابة",
+                    "Portal bar", "شب", "شريط بوابة", "شريط البوابات", "شريط بوابات", "بوابة", "Portal"]
+
 
-    stmt = select(Request).join(Page).filter(Request.status == Status.RECEIVED, Page.status == Status.PENDING,
-                                             Request.request_type == type_of_request).group_by(Request).having(
-        func.count(Page.id) == func.count(distinct(Page.id))).limit(1)
+def has_portal(text, portal):
+    """Return True if text links to portal, given without namespace, with a link or a portal template."""
+    portal = prepare_str(portal)
+    editor = WikitextEditor(text)
+    for template in editor.templates(portal_templates):
+        if any(prepare_str(argument.value) == portal for argument in template.arguments if argument.positional):
+            return True
+    return any(prepare_str(link.title) == prepare_str("بوابة:") + portal for link in editor.parsed.wikilinks)
 
-    for request in session.scalars(stmt):
 
-        page_title = request.from_title
+class PortalDistributionHandler(RequestHandler):
+    request_type = type_of_request
+    request_limit = 1
+    page_limit = 1000
+
+    def load_page(self, request, page):
+        return pywikibot.Page(self.site, title=str(page.page_name), ns=0)
+
+    def transform(self, request, p, text):
         page_new_title = request.to_title
+        # the portal may have been added by an earlier request of the same edit
+        if has_portal(text, page_new_title):
+            return text
+        # if not found start add portal to page
+        text += "\n"
+        text += "{{شريط بوابات|" + page_new_title + "}}"
+
+        pipeline = PipelineWithExtraSteps(p, text, "", [
+            PortalsMerge,
+            PortalsBar,
+        ], [])
+
+        processed_text, processed_summary = pipeline.process()
+        return processed_text
+
+    def summary(self, request):
+        return f"بوت:[[ويكيبيديا:طلبات توزيع بوابة]] أضاف ([[بوابة:{request.to_title}]] )"
+
+
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        RequestExecutor(site, session, [PortalDistributionHandler]).run()
+    return 0
+
 
-        pages = session.query(Page).filter(Page.request == request, Page.status == Status.PENDING).order_by(
-            Page.namespace.desc()).limit(1000).all()
-
-        for page in pages:
-            try:
-                p = pywikibot.Page(site, title=str(page.page_name), ns=0)
-                if p.exists():
-                    # check if portal is found in page with different name
-                    found = False
-                    for p2 in p.linkedPages(namespaces=100, content=False):
-                        if prepare_str(p2.title(with_ns=False)) == prepare_str(page_new_title):
-                            found = True
-                            break
-                    if not found:
-                        # if not found start add portal to page
-                        text = p.text
-                        text += "\n"
-                        text += "{{شريط بوابات|" + page_new_title + "}}"
-
-                        pipeline = PipelineWithExtraSteps(p, text, "", [
-                            PortalsMerge,
-                            PortalsBar,
-                        ], [])
-
-                        processed_text, processed_summary = pipeline.process()
-
-                        p.text = processed_text
-                        p.save(summary=f"بوت:[[ويكيبيديا:طلبات توزيع بوابة]] أضاف ([[بوابة:{page_new_title}]] )")
-
-                    # start change page status in database
-                    page.status = Status.COMPLETED
-                    session.commit()
-            except Exception as e:
-                print(f"An error occurred where save : {e}")
-                just_the_string = traceback.format_exc()
-                print(just_the_string)
-                session.rollback()
-
-except Exception as e:
-    print(f"An error occurred: {e}")
-    just_the_string = traceback.format_exc()
-    print(just_the_string)
+if __name__ == "__main__":
+    raise SystemExit(main())
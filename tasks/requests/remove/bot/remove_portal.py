@@ -1,8 +1,5 @@
-import copy
-
-import wikitextparser as wtp
-
 from core.utils.helpers import prepare_str
+from tasks.requests.core.wikitext import WikitextEditor
 
 
 class RemovePortal:
@@ -24,21 +21,17 @@ class RemovePortal:
             "بوابة",
             "Portal"
         ]
-        self.tem_text = copy.deepcopy(self.page_text)
+        self.tem_text = self.page_text
 
     def start_remove(self):
-        parsed = wtp.parse(self.page_text)
-        for template in self.list_of_templates:
-            for template_page in parsed.templates:
-                temp_template = copy.deepcopy(template_page)
-                if prepare_str(template_page.name) == prepare_str(template):
-                    for arg in template_page.arguments:
-                        try:
-                            if prepare_str(arg.value) == prepare_str(self.portal):
-                                temp_template = str(temp_template).replace(str(arg), "")
-                        except:
-                            pass
-                self.tem_text = str(self.tem_text).replace(str(template_page), str(temp_template))
+        editor = WikitextEditor(self.page_text)
+        portal = prepare_str(self.portal)
+        # one pass over the templates, the portal arguments are removed by span
+        for template_page in editor.templates(self.list_of_templates):
+            for arg in template_page.arguments:
+                if prepare_str(arg.value) == portal:
+                    editor.remove(arg)
+        self.tem_text = editor.apply()
 
 #
 # site = pywikibot.Site()
@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 
 from core.utils.wikidb import Database
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader, database_rows
 
 # Create an instance of the RequestsPage class
 site = pywikibot.Site()
@@ -35,6 +36,7 @@ and  linktarget.lt_title in (select page_title from page where page_id in (FROM_
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
@@ -49,30 +51,18 @@ try:
                     # template
                     if to_page.namespace() == 10:
                         database.query = template_query.replace("FROM_ID", str(from_id))
-                        database.get_content_from_database()
-                        gen = database.result
+                        gen = database_rows(database)
                     elif to_page.namespace() == 100:
                         database.query = portal_query.replace("FROM_ID", str(from_id))
-                        database.get_content_from_database()
-                        gen = database.result
+                        gen = database_rows(database)
                     elif to_page.namespace() == 14:
                         database.query = category_query.replace("FROM_ID", str(from_id))
-                        database.get_content_from_database()
-                        gen = database.result
+                        gen = database_rows(database)
             except Exception as e:
                 # todo:add some code like log or alert send to wiki
                 print(e)
 
-            pages = []
-            for row in gen:
-                page_title = str(row['prt_title'], 'utf-8')
-                pages.append(Page(
-                    title=page_title,
-                    namespace=row['prt_namespace']
-                ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            loader.load(request, gen)
 
         except Exception as e:
             session.rollback()
@@ -4,7 +4,8 @@ from sqlalchemy.orm import Session
 
 from core.utils.wikidb import Database
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader, database_rows
 
 # Create an instance of the RequestsPage class
 site = pywikibot.Site()
@@ -32,6 +33,7 @@ and page.page_is_redirect = 0
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
@@ -47,30 +49,19 @@ try:
                     # template
                     if request.extra is None:
                         database.query = template_query.replace("FROM_ID", str(from_id))
-                        database.get_content_from_database()
-                        gen = database.result
+                        gen = database_rows(database)
                     else:
                         cat_obj = pywikibot.Category(site, request.extra)
                         if cat_obj.exists():
                             cat_id = cat_obj.pageid
                             database.query = category_query.replace("FROM_ID", str(from_id)).replace("CAT_ID",
                                                                                                      str(cat_id))
-                            database.get_content_from_database()
-                            gen = database.result
+                            gen = database_rows(database)
             except Exception as e:
                 # todo:add some code like log or alert send to wiki
                 print(e)
 
-            pages = []
-            for row in gen:
-                page_title = str(row['prt_title'], 'utf-8')
-                pages.append(Page(
-                    title=page_title,
-                    namespace=row['prt_namespace']
-                ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            loader.load(request, gen)
 
         except Exception as e:
             session.rollback()
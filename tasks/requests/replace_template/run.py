@@ -1,66 +1,38 @@
-import copy
-import traceback
-
 import pywikibot
-import wikitextparser as wtp
-from sqlalchemy import select, func, distinct
 from sqlalchemy.orm import Session
 
-from core.utils.helpers import prepare_str, check_status
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
-
-# Create an instance of the RequestsPage class
-site = pywikibot.Site()
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+from tasks.requests.core.wikitext import WikitextEditor
 
 type_of_request = 6
 
-try:
-    session = Session(engine)
-
-    stmt = select(Request).join(Page).filter(Request.status == Status.RECEIVED, Page.status == Status.PENDING,
-                                             Request.request_type == type_of_request).group_by(Request).having(
-        func.count(Page.id) == func.count(distinct(Page.id))).limit(20)
 
-    if check_status("ويكيبيديا:طلبات استبدال القوالب/إيقاف"):
+class ReplaceTemplateHandler(RequestHandler):
+    request_type = type_of_request
+    request_limit = 20
+    page_limit = 1000
+    stop_page = "ويكيبيديا:طلبات استبدال القوالب/إيقاف"
 
-        for request in session.scalars(stmt):
+    def transform(self, request, p, text):
+        template_from = request.from_title
+        template_to = request.to_title
+        editor = WikitextEditor(text)
+        for template in editor.templates([template_from]):
+            editor.rename(template, str(template_to).replace("_", ' '))
+        return editor.apply()
 
-            template_from = request.from_title
-            template_to = request.to_title
+    def summary(self, request):
+        return "بوت:[[ويكيبيديا:طلبات استبدال القوالب]] استبدال [[قالب:" + request.from_title + "]] ب [[قالب:" + \
+            request.to_title + "]]  (v2.0.0)"
 
-            pages = session.query(Page).filter(Page.request == request, Page.status == Status.PENDING).order_by(
-                Page.namespace.desc()).limit(1000).all()
 
-            for page in pages:
-                try:
-                    p = pywikibot.Page(site, title=str(page.page_name), ns=page.namespace)
-                    if p.exists() and check_status("ويكيبيديا:طلبات استبدال القوالب/إيقاف"):
-                        temp_text = p.text
-                        temo_text2 = copy.deepcopy(p.text)
-                        parsed = wtp.parse(p.text)
-                        for template in parsed.templates:
-                            if prepare_str(template.name) == prepare_str(template_from):
-                                temp_template = copy.deepcopy(template)
-                                temp_template.name = str(template_to).replace("_", ' ')
-                                temp_text = temp_text.replace(str(template), str(temp_template))
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        RequestExecutor(site, session, [ReplaceTemplateHandler]).run()
+    return 0
 
-                        p.text = temp_text
-                        if temo_text2 != p.text:
-                            p.save(
-                                summary="بوت:[[ويكيبيديا:طلبات استبدال القوالب]] استبدال [[قالب:" + template_from + "]] ب [[قالب:" + template_to + "]]  (v2.0.0)"
-                            )
-                        else:
-                            print("skip " + p.title())
-                        page.status = Status.COMPLETED
-                        session.commit()
-                except Exception as e:
-                    print(f"An error occurred where save : {e}")
-                    just_the_string = traceback.format_exc()
-                    print(just_the_string)
-                    session.rollback()
 
-except Exception as e:
-    print(f"An error occurred: {e}")
-    just_the_string = traceback.format_exc()
-    print(just_the_string)
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+import pywikibot
+from sqlalchemy.orm import Session
+
+from tasks.requests.add_category.run import AddCategoryHandler
+from tasks.requests.core.database.engine import engine
+from tasks.requests.core.executor import RequestExecutor
+from tasks.requests.core.metrics import prune_events
+from tasks.requests.link_replacement.run import LinkReplacementHandler
+from tasks.requests.portal_distribution.run import PortalDistributionHandler
+from tasks.requests.remove.run import RemoveHandler
+from tasks.requests.replace_template.run import ReplaceTemplateHandler
+from tasks.requests.status import publish_status
+from tasks.requests.template_distribution.run import TemplateDistributionHandler
+
+# request type -> handler of its run stage
+# type 4 (cite) has no run stage, its pages are queued for webcite by cite/load.py
+handlers = {
+    AddCategoryHandler.request_type: AddCategoryHandler,
+    LinkReplacementHandler.request_type: LinkReplacementHandler,
+    TemplateDistributionHandler.request_type: TemplateDistributionHandler,
+    PortalDistributionHandler.request_type: PortalDistributionHandler,
+    ReplaceTemplateHandler.request_type: ReplaceTemplateHandler,
+    RemoveHandler.request_type: RemoveHandler,
+}
+
+
+def main(*args: str) -> int:
+    # one site, one login and one requests.db session for all request types
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        executor = RequestExecutor(site, session, list(handlers.values()))
+        processed = executor.run()
+        try:
+            publish_status(site, session)
+        except Exception as e:
+            print(f"An error occurred while publishing the status: {e}")
+        try:
+            # the status rates only read the last hours of page events
+            prune_events(session)
+        except Exception as e:
+            print(f"An error occurred while pruning the page events: {e}")
+    print(f"processed {processed} pages")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
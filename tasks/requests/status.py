@@ -0,0 +1,32 @@
+import pywikibot
+from sqlalchemy.orm import Session
+
+from tasks.requests.core.database.engine import engine
+from tasks.requests.core.metrics import RequestMetrics, prune_events, status_table
+
+status_page_title = "مستخدم:LokasBot/حالة الطلبات"
+
+
+def publish_status(site, session, title=status_page_title):
+    """Save the status table of the requests to the wiki when it changed."""
+    page = pywikibot.Page(site, title)
+    text = status_table(RequestMetrics(session))
+    # the first line holds the update time, only save when the counters changed
+    old_text = page.text if page.exists() else ""
+    if old_text.split("\n", 1)[-1] == text.split("\n", 1)[-1]:
+        return False
+    page.text = text
+    page.save(summary="بوت:تحديث حالة الطلبات")
+    return True
+
+
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        publish_status(site, session)
+        prune_events(session)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
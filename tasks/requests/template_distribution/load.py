@@ -4,8 +4,9 @@ from sqlalchemy import select
 
 
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status,Page
-from tasks.requests.template_distribution.models import WikiLinkExtractor
+from tasks.requests.core.database.models import Request, Status
+from tasks.requests.core.loader import PageLoader
+from tasks.requests.template_distribution.models import WikiLinkExtractor, resolve_titles
 
 # Create an instance of the RequestsPage class
 site = pywikibot.Site()
@@ -14,6 +15,7 @@ type_of_request = 3
 
 try:
     session = Session(engine)
+    loader = PageLoader(session)
 
     stmt = select(Request).filter(Request.status == Status.PENDING, Request.request_type == type_of_request).limit(20)
 
@@ -22,18 +24,9 @@ try:
             page = pywikibot.Page(site, request.from_name)
 
             extractor = WikiLinkExtractor(page.text)
-            links = extractor.extract_links()
-            pages = []
-            for temlink in links:
-                link = pywikibot.Page(site, temlink)
-                if link.exists() and link.namespace() == 0:
-                    pages.append(Page(
-                        title=link.title(with_ns=False),
-                        namespace=0
-                    ))
-            request.status = Status.RECEIVED
-            request.pages = pages
-            session.commit()
+            # existence, namespace and redirects of the links are checked in batches
+            titles = resolve_titles(site, extractor.iter_links(), namespace=0)
+            loader.load(request, ((title, 0) for title in titles))
         except Exception as e:
             session.rollback()
             print("An error occurred while committing the changes:", e)
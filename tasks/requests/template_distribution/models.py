@@ -1,20 +1,68 @@
 import re
 
+import pywikibot
+
+link_pattern = re.compile(r'\[\[(.*?)\]\]', re.IGNORECASE)
+
 
 class WikiLinkExtractor:
     def __init__(self, text):
         self.text = text
         self.links = []
 
+    def iter_links(self):
+        """Yield the targets of the wiki links of the text, skipping category links."""
+        for match in link_pattern.finditer(self.text):
+            match = match.group(1)
+            if "تصنيف:" not in match.lower() and "category:" not in match.lower():
+                yield match.split("|")[0]
+
     def extract_links(self):
-        pattern = re.compile(r'\[\[(.*?)\]\]', re.IGNORECASE)
-        matches = re.findall(pattern, self.text)
-        for match in matches:
-            if "تصنيف:" not in match.lower() and "Category:" not in match.lower():
-                if "|" in match:
-                    link = match.split("|")[0]
-                else:
-                    link = match
-                self.links.append(link)
+        self.links = list(self.iter_links())
         return self.links
 
+
+def resolve_titles(site, titles, namespace=0, batch_size=50):
+    """
+    Yield the canonical titles of the existing pages in namespace that titles point to.
+
+    Titles are checked batch_size at a time with one API query that also
+    normalizes them and follows redirects.  Every page is yielded once, so
+    several links to the same article or to its redirects give one title.
+
+    Args:
+        site (pywikibot.Site): the site of the titles.
+        titles (iterable): the titles to check, as written in the links.
+        namespace (int): the namespace of the pages to keep.
+        batch_size (int): the number of titles in one API query.
+    """
+    seen = set()
+    batch = []
+    for title in titles:
+        title = title.strip()
+        if title and title not in batch:
+            batch.append(title)
+        if len(batch) >= batch_size:
+            yield from _resolve_batch(site, batch, namespace, seen)
+            batch = []
+    if batch:
+        yield from _resolve_batch(site, batch, namespace, seen)
+
+
+def _resolve_batch(site, titles, namespace, seen):
+    params = {
+        "action": "query",
+        "format": "json",
+        "titles": "|".join(titles),
+        "redirects": True,
+        "formatversion": 2
+    }
+    request = pywikibot.data.api.Request(site=site, **params)
+    data = request.submit()
+    for page in data.get("query", {}).get("pages", []):
+        if page.get("missing") or page.get("invalid") or page.get("ns") != namespace:
+            continue
+        title = pywikibot.Page(site, page["title"]).title(with_ns=False)
+        if title not in seen:
+            seen.add(title)
+            yield title
@@ -1,70 +1,66 @@
-import traceback
-
 import pywikibot
-from sqlalchemy import select, func, distinct
 from sqlalchemy.orm import Session
 
 from tasks.requests.core.database.engine import engine
-from tasks.requests.core.database.models import Request, Status, Page
-
-# Create an instance of the RequestsPage class
-site = pywikibot.Site()
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+from tasks.requests.core.wikitext import WikitextEditor
 
 type_of_request = 3
 
-try:
-    session = Session(engine)
 
-    stmt = select(Request).join(Page).filter(Request.status == Status.RECEIVED, Page.status == Status.PENDING,
-                                             Request.request_type == type_of_request).group_by(Request).having(
-        func.count(Page.id) == func.count(distinct(Page.id))).limit(100)
+def template_redirects(template):
+    """Return the names of the redirects to template, a page using one of them already has the template."""
+    try:
+        return [redirect.title(with_ns=False)
+                for redirect in template.backlinks(filter_redirects=True, namespaces=[10])]
+    except Exception as e:
+        print(f"An error occurred while loading the redirects to {template.title()}: {e}")
+        return []
+
+
+class TemplateDistributionHandler(RequestHandler):
+    request_type = type_of_request
+
+    def __init__(self, site):
+        super().__init__(site)
+        # request id -> names of its template and of the redirects to it
+        self.names = {}
+
+    def start_request(self, request):
+        template = pywikibot.Page(self.site, request.from_title, ns=10)
+        self.names[request.id] = [request.from_title] + template_redirects(template)
+
+    def transform(self, request, p, text):
+        if p.namespace() != 0:
+            return text
+        # the template may have been added by an earlier request of the same edit, or under a redirect name
+        if any(WikitextEditor(text).templates(self.names.get(request.id, [request.from_title]))):
+            return text
+        print(p.title())
+        template_name = "{{" + request.from_title + "}}"
+        if request.extra is not None and "أعلى" in str(request.extra):
+            return template_name + '\n' + text
+        portal_template = '{{شريط بوابات'
+        stub_template = '{{بذرة'
+        category_template = '[[تصنيف:'
+        if portal_template in text:
+            return text.replace(portal_template, template_name + '\n' + portal_template, 1)
+        if stub_template in text:
+            return text.replace(stub_template, template_name + '\n' + stub_template, 1)
+        if category_template in text:
+            return text.replace(category_template, template_name + '\n' + category_template, 1)
+        return text + '\n' + template_name
 
-    for request in session.scalars(stmt):
+    def summary(self, request):
+        return "بوت:توزيع قالب"
 
-        pages = session.query(Page).filter(Page.request == request, Page.status == Status.PENDING).order_by(
-            Page.namespace.desc()).limit(100).all()
 
-        for page in pages:
-            try:
-                link = pywikibot.Page(site, page.page_name)
-                if link.exists() and link.namespace() == 0:
-                    template_found = False
-                    for tpl in link.templates(content=False):
-                        tpl_title = str(tpl.title()).lower()
-                        page_title = str(request.from_name).lower()
-                        if tpl_title == page_title:
-                            template_found = True
-                            break
-                    print(link.title())
-                    if not template_found:
-                        if 'extra' in request.__dict__ and "أعلى" in str(request.__dict__['extra']):
-                            template_name = "{{" + request.from_title + "}}"
-                            text = template_name + '\n' + link.text
-                        else:
-                            template_name = "{{" + request.from_title + "}}"
-                            text = link.text
-                            portal_template = '{{شريط بوابات'
-                            stub_template = '{{بذرة'
-                            category_template = '[[تصنيف:'
-                            if portal_template in text:
-                                text = text.replace(portal_template, template_name + '\n' + portal_template, 1)
-                            elif stub_template in text:
-                                text = text.replace(stub_template, template_name + '\n' + stub_template, 1)
-                            elif category_template in text:
-                                text = text.replace(category_template, template_name + '\n' + category_template, 1)
-                            else:
-                                text = text + '\n' + template_name
-                        if text != link.text:
-                            link.text = text
-                            link.save("بوت:توزيع قالب")
+def main(*args: str) -> int:
+    site = pywikibot.Site()
+    with Session(engine) as session:
+        RequestExecutor(site, session, [TemplateDistributionHandler]).run()
+    return 0
 
-                page.status = Status.COMPLETED
-                session.commit()
-            except Exception as e:
-                print(f"An error occurred where save : {e}")
-                just_the_string = traceback.format_exc()
-                print(just_the_string)
-                session.rollback()
 
-except Exception as e:
-    print(f"An error occurred: {e}")
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -41,7 +41,7 @@ page_name = "ويكيبيديا:مشروع ويكي العراق/قائمة ال
 
 
 def username(row, result, index):
-    username = str(row['username'], 'utf-8')
+    username = row['username']
     name = username.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "{{مس|" + username + "}}"
 
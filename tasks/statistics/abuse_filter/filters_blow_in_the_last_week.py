@@ -35,7 +35,7 @@ def afl_filter_id(row, result, index):
 
 
 def afl_public_comments(row, result, index):
-    af_public_comments = str(row['af_public_comments'], 'utf-8')
+    af_public_comments = row['af_public_comments']
     return af_public_comments
 
 
@@ -75,7 +75,7 @@ def day_7(row, result, index):
 
 
 def user_registration(row, result, index):
-    last_edit_date = str(row['last_edit_date'], 'utf-8')
+    last_edit_date = row['last_edit_date']
     return "{{نسخ:#time:j F Y|" + last_edit_date + "}}"
 
 
@@ -1,67 +1,30 @@
 import pywikibot
 
+from tasks.statistics.group_activity import Metric, Source, group_activity_query, log_metric, log_source
 from tasks.statistics.module import UpdatePage, ArticleTables, index, Database
 
 # Set the parameters for the update
-query = """select user_name,
-				  (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "rights" and
-                    log_params like '%5::newgroups%"bot"%'
-                    and log_params not like '%::oldgroups"%"sysop"%5::newgroups%'
-                    and log_params not like '%::oldgroups"%"bot"%5::newgroups%') as "+بوت",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights" and
-                  log_params like '%5::newgroups%"sysop"%'
-                  and log_params not like '%::oldgroups"%"sysop"%5::newgroups%') as "+إداري",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%5::newgroups%"bureaucrat"%'
-                  and log_params not like '%::oldgroups"%"bureaucrat"%5::newgroups%') as "+بيروقراط",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%5::newgroups%"accountcreator"%'
-                  and log_params not like '%::oldgroups"%"accountcreator"%5::newgroups%') as "+منشئ حسابات",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%5::newgroups%"import"%'
-                  and log_params not like '%::oldgroups"%"import"%5::newgroups%') as "+مستورد",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%::oldgroups"%"import"%5::newgroups%'
-                  and log_params not like '%5::newgroups%"import"%' ) as "-مستورد",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%::oldgroups"%"accountcreator"%5::newgroups%'
-                  and log_params not like '%5::newgroups%"accountcreator"%') as "-منشئ حسابات",
-
-                  (select count(*) from logging
-                   inner join actor on actor_id = log_actor
-                   where actor_user = user_id and log_type = "rights"  and
-                  log_params like '%::oldgroups"%"bot"%5::newgroups%'
-                  and log_params not like '%::oldgroups"%"sysop"%5::newgroups%'
-                  and log_params not like '%5::newgroups%"bot"%') as "-بوت",
-
-                  (select count(*) from revision
-                   inner join actor on actor_id = rev_actor
-                   where actor_user = user_id and rev_page = 213729 and
-                  rev_minor_edit = 0) as "وب:طصب"
-from user
-inner join user_groups
-on ug_user = user_id
-where ug_group = "bureaucrat";"""
+log_metrics = [
+    log_metric("+بوت", "rights", params_like=('%5::newgroups%"bot"%',),
+               params_not_like=('%::oldgroups"%"sysop"%5::newgroups%', '%::oldgroups"%"bot"%5::newgroups%')),
+    log_metric("+إداري", "rights", params_like=('%5::newgroups%"sysop"%',),
+               params_not_like=('%::oldgroups"%"sysop"%5::newgroups%',)),
+    log_metric("+بيروقراط", "rights", params_like=('%5::newgroups%"bureaucrat"%',),
+               params_not_like=('%::oldgroups"%"bureaucrat"%5::newgroups%',)),
+    log_metric("+منشئ حسابات", "rights", params_like=('%5::newgroups%"accountcreator"%',),
+               params_not_like=('%::oldgroups"%"accountcreator"%5::newgroups%',)),
+    log_metric("+مستورد", "rights", params_like=('%5::newgroups%"import"%',),
+               params_not_like=('%::oldgroups"%"import"%5::newgroups%',)),
+    log_metric("-مستورد", "rights", params_like=('%::oldgroups"%"import"%5::newgroups%',),
+               params_not_like=('%5::newgroups%"import"%',)),
+    log_metric("-منشئ حسابات", "rights", params_like=('%::oldgroups"%"accountcreator"%5::newgroups%',),
+               params_not_like=('%5::newgroups%"accountcreator"%',)),
+    log_metric("-بوت", "rights", params_like=('%::oldgroups"%"bot"%5::newgroups%',),
+               params_not_like=('%::oldgroups"%"sysop"%5::newgroups%', '%5::newgroups%"bot"%')),
+]
+# non minor edits to ويكيبيديا:طلب صلاحية بوت
+bot_requests = Source("revision", "rev_actor", [Metric("وب:طصب", "rev_minor_edit = 0")], where="rev_page = 213729")
+query = group_activity_query("bureaucrat", [log_source(log_metrics), bot_requests])
 file_path = 'stub/activity_of_bureaucrats.txt'
 page_name = "ويكيبيديا:تقارير قاعدة البيانات/نشاط البيروقراطيين"
 
@@ -78,7 +41,7 @@ def create_category_page_for_every_user():
     database.get_content_from_database()
     site = pywikibot.Site()
     for row in database.result:
-        user_name = str(row['user_name'], 'utf-8')
+        user_name = row['user_name']
         page = pywikibot.Page(site, f'تصنيف:خلاصة بيروقراط بواسطة {user_name}')
         if not page.exists():
             text = "{{تصنيف ويكيبيديا}}\n{{تصنيف مخفي}}"
@@ -101,14 +64,14 @@ list_of_categories = create_category_page_for_every_user()
 
 
 def username(row, result, index):
-    username = str(row['user_name'], 'utf-8')
+    username = row['user_name']
     name = username.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "{{مس|" + username + "}}"
 
 
 def total_numbers_in_category(row, result, index):
     number = 0
-    user_name = str(row['user_name'], 'utf-8')
+    user_name = row['user_name']
     # to avoid raising any errors
     if user_name in list_of_categories:
         number += list_of_categories[user_name]
@@ -116,7 +79,7 @@ def total_numbers_in_category(row, result, index):
 
 
 def total(row, result, index):
-    user_name = str(row['user_name'], 'utf-8')
+    user_name = row['user_name']
     del row['user_name']
     number = sum(row.values())
     # to avoid raising any errors
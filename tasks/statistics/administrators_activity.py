@@ -1,46 +1,21 @@
+from tasks.statistics.group_activity import group_activity_query, log_metric, log_source
 from tasks.statistics.module import UpdatePage, ArticleTables, index
 
 # Set the parameters for the update
-query = """SELECT user_name,
-
-           (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "delete"  and log_action not in ("delete_redir","restore") ) as "delete_count",
-           (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "delete" and log_action = "restore" ) as "restore_count",
-
-           (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "delete" and log_action = "revision" ) as "revision_count",
-           (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "delete" and log_action = "event"  ) as "event_count",
-           (select count(*) from logging
-                    inner join actor on actor_id = log_actor
-                    where actor_user = user_id and log_type = "protect" and log_action in("modify","protect")) as "protect_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "protect" and log_action = "unprotect") as "unprotect_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "protect" and log_action = "modify") as "modify_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "block" ) as "block_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "block" and log_action = "unblock") as "unblock_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "block" and log_action = "reblock") as "reblock_count",
-       (select count(*) from logging
-                                 inner join actor on actor_id = log_actor
-        where actor_user = user_id and log_type = "rights" ) as "rights_count"
-FROM user
-         JOIN user_groups ON user_id = ug_user
-WHERE ug_group = "sysop" and user_name not in ("مرشح الإساءة")
-ORDER BY user_name ASC , delete_count DESC, restore_count DESC, revision_count DESC, event_count DESC, protect_count DESC, unprotect_count DESC, modify_count DESC, block_count DESC, unblock_count DESC, reblock_count DESC, rights_count DESC;"""
+metrics = [
+    log_metric("delete_count", "delete", exclude_actions=("delete_redir", "restore")),
+    log_metric("restore_count", "delete", actions=("restore",)),
+    log_metric("revision_count", "delete", actions=("revision",)),
+    log_metric("event_count", "delete", actions=("event",)),
+    log_metric("protect_count", "protect", actions=("modify", "protect")),
+    log_metric("unprotect_count", "protect", actions=("unprotect",)),
+    log_metric("modify_count", "protect", actions=("modify",)),
+    log_metric("block_count", "block"),
+    log_metric("unblock_count", "block", actions=("unblock",)),
+    log_metric("reblock_count", "block", actions=("reblock",)),
+    log_metric("rights_count", "rights"),
+]
+query = group_activity_query("sysop", [log_source(metrics)], excluded_users=("مرشح الإساءة",))
 
 file_path = 'stub/administrators_activity.txt'
 page_name = "ويكيبيديا:تقارير قاعدة البيانات/نشاط الإداريين"
@@ -73,14 +48,14 @@ def end_main_table(result):
 
 
 def username(row, result, index):
-    username = str(row['user_name'], 'utf-8')
+    username = row['user_name']
     name = username.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "[[مستخدم:" + username + "|" + name + "]]"
 
 
 def total(row, result, index):
     number = 0
-    user_name = str(row['user_name'], 'utf-8')
+    user_name = row['user_name']
     del row['user_name']
     number = sum(row.values())
     # to avoid raising any errors
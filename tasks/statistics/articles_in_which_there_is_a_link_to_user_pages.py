@@ -19,12 +19,12 @@ page_name = "ويكيبيديا:تقارير قاعدة البيانات/مقا
 
 
 def page_title(row, result, index):
-    username = str(row['ll_page_title'], 'utf-8')
+    username = row['ll_page_title']
     name = username
     return "[[" + username + "]]"
 
 def username(row, result,index):
-    username = str(row['ll_page_to_title'], 'utf-8')
+    username = row['ll_page_to_title']
     name = username.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     if row['ll_pl_namespace'] == 2:
         page_prefix = 'مستخدم:'
@@ -33,7 +33,7 @@ def main(*args: str) -> int:
 
         # todo: edit this to make it outside main def
         def page_title(row, result, index):
-            username = str(row['page_title'], 'utf-8')
+            username = row['page_title']
             name = username
             return "[[:" + language + ":" + username + "|" + name + "]]"
 
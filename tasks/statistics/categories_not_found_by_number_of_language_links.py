@@ -68,7 +68,7 @@ day_of_week = current_time.tm_wday
 
 
 def page_title(row, result, index):
-    cat_name = str(row['lt_title'], 'utf-8')
+    cat_name = row['lt_title']
     name = cat_name.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "[[:en:category:" + cat_name + "|" + name + "]]"
 
@@ -33,12 +33,12 @@ page_name = "ويكيبيديا:مصادر موثوق بها/معاجم وقوا
 
 
 def item(row, result, index):
-    name = str(row['q_iwl_title'], 'utf-8')
+    name = row['q_iwl_title']
     return f"[[d:{name}|{name}]]"
 
 
 def item_title(row, result, index):
-    name = str(row['q_iwl_title'], 'utf-8')
+    name = row['q_iwl_title']
     name_of_itme = ""
     try:
         site = pywikibot.Site("wikidata")
@@ -102,7 +102,7 @@ def header_page(result):
 <div style="background: #E5E4E2; padding: 0.5em; -moz-border-radius: 0.3em; border-radius: 0.3em;">
 """.replace("COUNT_OF_CITES", str(total['count_of_cites'])).replace("COUNT_OF_REF", str(count_of_ref)).replace(
         "TOP_CITE_ROW_COUNT", str(top_cite_row['count_of_cites'])).replace("Q_IWL_TITLE",
-                                                                           str(top_cite_row['q_iwl_title'], 'utf-8'))
+                                                                           top_cite_row['q_iwl_title'])
     return tem_header
 
 
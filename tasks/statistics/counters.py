@@ -0,0 +1,261 @@
+"""
+Local store of all-time counters of the replica, advanced by deltas.
+
+Reports such as the pages with most revisions count rows of the whole
+history every day.  CounterStore keeps those counts in an SQLite database
+together with the last id of the replica table they include, so a daily
+run only counts the rows added since then and the report is rendered from
+the store.  The first run fills the store in slices of ids, committing the
+counts and the watermark of every slice together, so an interrupted run
+resumes where it stopped.
+
+Rows that come back below the watermark, such as undeleted or merged
+revisions, are not seen by the deltas, so refresh counts a counter again
+from the first id every rebuild_days days, and rebuild can be run by hand
+with python counters.py --rebuild=NAME.
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+from tasks.statistics.module import Database
+
+
+class Counter:
+    """
+    A counter of replica rows grouped by an integer key.
+
+    Args:
+        name (str): the name of the counter in the store.
+        last_id_query (str): selects the current maximum id as last_id.
+        delta_query (str): selects key and value of the rows with an id in
+         ({start}, {end}].
+    """
+
+    def __init__(self, name, last_id_query, delta_query):
+        self.name = name
+        self.last_id_query = last_id_query
+        self.delta_query = delta_query
+
+
+page_revisions = Counter(
+    "page_revisions",
+    "SELECT MAX(rev_id) AS last_id FROM revision",
+    """SELECT rev_page AS `key`, COUNT(*) AS value
+FROM revision
+WHERE rev_id > {start} AND rev_id <= {end}
+GROUP BY rev_page""",
+)
+
+actor_reviews = Counter(
+    "actor_reviews",
+    "SELECT MAX(log_id) AS last_id FROM logging",
+    """SELECT log_actor AS `key`, COUNT(*) AS value
+FROM logging
+WHERE log_id > {start} AND log_id <= {end}
+  and log_type = "review"
+  and log_action in ('approve','approve-ia','approve-a','approve2-i','approve-i','approve2','unapprove','unapprove2')
+GROUP BY log_actor""",
+)
+
+
+def fetch(query):
+    database = Database()
+    database.query = query
+    database.get_content_from_database()
+    return database.result
+
+
+class CounterStore:
+    """
+    A class for keeping replica counters in an SQLite database.
+
+    Args:
+        database_path (str, optional): The SQLite database path. Defaults to
+         ~/statistics_counters.db.
+    """
+
+    def __init__(self, database_path=None):
+        self.db_conn = self._create_db_table(database_path)
+
+    def _create_db_table(self, database_path):
+        """
+        Create the counters and watermarks tables in an SQLite database.
+
+        Returns:
+            sqlite3.Connection: A connection to the SQLite database.
+        """
+        if database_path is None:
+            home_path = os.path.expanduser("~")
+            database_path = os.path.join(home_path, "statistics_counters.db")
+
+        # reports running in parallel open their own connection to the same file
+        conn = sqlite3.connect(database_path, timeout=60)
+        conn.execute("PRAGMA journal_mode=WAL")
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS counters (
+                counter TEXT NOT NULL,
+                key INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (counter, key)
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_counters_value ON counters (counter, value)")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS watermarks (
+                counter TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rebuilds (
+                counter TEXT PRIMARY KEY,
+                rebuilt_at INTEGER NOT NULL
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def watermark(self, counter):
+        """Return the last replica id included in counter, 0 if it was never filled."""
+        row = self.db_conn.execute("SELECT last_id FROM watermarks WHERE counter = ?", (counter.name,)).fetchone()
+        return row[0] if row else 0
+
+    def add(self, counter, rows, last_id):
+        """
+        Add the counts of a delta and move the watermark to last_id in one transaction.
+
+        Args:
+            counter (Counter): the counter.
+            rows (list): dicts with key and value.
+            last_id (int): the last replica id included in rows.
+        """
+        with self.db_conn:
+            self.db_conn.executemany(
+                "INSERT INTO counters (counter, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT (counter, key) DO UPDATE SET value = value + excluded.value",
+                [(counter.name, row['key'], row['value']) for row in rows]
+            )
+            self.db_conn.execute("INSERT OR REPLACE INTO watermarks (counter, last_id) VALUES (?, ?)",
+                                 (counter.name, last_id))
+
+    def advance(self, counter, slice_size=5000000):
+        """
+        Count the replica rows added since the watermark of counter.
+
+        Args:
+            counter (Counter): the counter.
+            slice_size (int): the number of ids counted by one replica query.
+        """
+        start = self.watermark(counter)
+        last_id = fetch(counter.last_id_query)[0]['last_id'] or 0
+        while start < last_id:
+            end = min(start + slice_size, last_id)
+            rows = fetch(counter.delta_query.format(start=start, end=end))
+            self.add(counter, rows, end)
+            print(f"{counter.name}: counted ids {start + 1} to {end}, {len(rows)} keys")
+            start = end
+
+    def rebuild(self, counter, slice_size=5000000):
+        """
+        Count counter again from the first id and replace its counts with the new ones.
+
+        The new counts are built under a staging name, so the report keeps its
+        current counts until the rebuild is done, and an interrupted rebuild
+        resumes from its own watermark.
+        """
+        staging = Counter(counter.name + ":rebuild", counter.last_id_query, counter.delta_query)
+        self.advance(staging, slice_size)
+        with self.db_conn:
+            for table in ("counters", "watermarks"):
+                self.db_conn.execute(f"DELETE FROM {table} WHERE counter = ?", (counter.name,))
+                self.db_conn.execute(f"UPDATE {table} SET counter = ? WHERE counter = ?", (counter.name, staging.name))
+            self.db_conn.execute("INSERT OR REPLACE INTO rebuilds (counter, rebuilt_at) VALUES (?, ?)",
+                                 (counter.name, int(time.time())))
+        print(f"{counter.name}: rebuilt")
+
+    def rebuilt_at(self, counter):
+        """Return the unix time of the last rebuild of counter, None if it was never rebuilt."""
+        row = self.db_conn.execute("SELECT rebuilt_at FROM rebuilds WHERE counter = ?", (counter.name,)).fetchone()
+        return row[0] if row else None
+
+    def refresh(self, counter, rebuild_days=30, slice_size=5000000):
+        """
+        Advance counter, or rebuild it when its last rebuild is older than rebuild_days.
+
+        A counter filled before rebuilds were recorded starts its rebuild
+        period now instead of being rebuilt at once.
+        """
+        rebuilt_at = self.rebuilt_at(counter)
+        if rebuilt_at is None and self.watermark(counter) > 0:
+            with self.db_conn:
+                self.db_conn.execute("INSERT INTO rebuilds (counter, rebuilt_at) VALUES (?, ?)",
+                                     (counter.name, int(time.time())))
+            rebuilt_at = int(time.time())
+        if rebuilt_at is None or time.time() - rebuilt_at > rebuild_days * 86400:
+            self.rebuild(counter, slice_size)
+        # the rows added while the rebuild ran
+        self.advance(counter, slice_size)
+
+    def top(self, counter, limit, offset=0):
+        """Return (key, value) pairs of counter, highest value first."""
+        return self.db_conn.execute(
+            "SELECT key, value FROM counters WHERE counter = ? ORDER BY value DESC, key LIMIT ? OFFSET ?",
+            (counter.name, limit, offset)
+        ).fetchall()
+
+    def ranked(self, counter, resolve, limit, batch_size=None):
+        """
+        Return the rows of the limit highest keys of counter that resolve keeps.
+
+        The store has no titles or names and still counts deleted pages and
+        removed accounts, so the keys are read in batches and resolve turns a
+        batch of (key, value) pairs into report rows from the replica, dropping
+        the keys that should not be listed, until limit rows are found.
+
+        Args:
+            counter (Counter): the counter.
+            resolve (callable): takes a list of (key, value) pairs and returns
+             a list of rows.
+            limit (int): the number of rows.
+            batch_size (int, optional): keys per batch. Defaults to limit.
+        """
+        batch_size = batch_size or limit
+        rows = []
+        offset = 0
+        while len(rows) < limit:
+            batch = self.top(counter, batch_size, offset)
+            if not batch:
+                break
+            rows.extend(resolve(batch))
+            offset += batch_size
+        return rows[:limit]
+
+    def close(self):
+        self.db_conn.close()
+
+
+counters = {counter.name: counter for counter in (page_revisions, actor_reviews)}
+
+
+def main(*args: str) -> int:
+    # --rebuild=NAME counts the counter NAME again from the first id
+    store = CounterStore()
+    try:
+        for arg in args:
+            if arg.startswith("--rebuild="):
+                name = arg.split("=", 1)[1]
+                if name not in counters:
+                    print(f"unknown counter {name}, one of {', '.join(counters)}")
+                    return 1
+                store.rebuild(counters[name])
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(*sys.argv[1:]))
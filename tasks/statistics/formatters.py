@@ -0,0 +1,116 @@
+"""
+Shared cell formatters of the statistics reports.
+
+Every formatter here is a factory: it takes the arguments given to a column
+in reports.json and returns the (row, result, index) -> str function used by
+ArticleTable.  Reports declared in the registry can only use the formatters
+listed in FORMATTERS, so the formatting of a kind of cell is written once.
+"""
+
+import re
+
+from tasks.statistics.module import index as row_number
+
+# a conversion of a pattern without a field name, such as %s, and the escaped %%
+unnamed_conversion = re.compile(r"%(?![(%])")
+
+
+def display_name(name):
+    # a single underscore is a space in the title, a double one is a real underscore
+    return name.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
+
+
+def arabic_number(value):
+    return format(value, ',').replace(',', '٬')
+
+
+def index():
+    """The 1-based position of the row."""
+    return row_number
+
+
+class _AnyFields(dict):
+    def __missing__(self, key):
+        return 0
+
+
+def check_pattern(pattern):
+    """Raise ValueError if pattern is not a valid %-pattern of named fields."""
+    if not isinstance(pattern, str):
+        raise ValueError(f"the pattern {pattern!r} is not a string")
+    if unnamed_conversion.search(pattern.replace("%%", "")):
+        raise ValueError(f"the pattern {pattern!r} has a conversion without a field name")
+    try:
+        pattern % _AnyFields()
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"the pattern {pattern!r} is invalid: {e}") from None
+
+
+def text(pattern):
+    """The pattern filled with the row, e.g. "[[%(page_title)s]]"."""
+    # checked when the registry is loaded, not after the query ran
+    check_pattern(pattern)
+
+    def formatter(row, result, index):
+        return pattern % row
+    return formatter
+
+
+def constant(value):
+    """The same text in every row."""
+    def formatter(row, result, index):
+        return value
+    return formatter
+
+
+def user_link(field, prefix="مستخدم:"):
+    """A link to the page prefix + row[field], labelled with the name without underscores."""
+    def formatter(row, result, index):
+        name = row[field]
+        return "[[" + prefix + name + "|" + display_name(name) + "]]"
+    return formatter
+
+
+def number(field):
+    """row[field] with Arabic thousands separators."""
+    def formatter(row, result, index):
+        return arabic_number(row[field])
+    return formatter
+
+
+def contributions_link(field, count_field):
+    """row[count_field] with Arabic thousands separators, linked to the contributions of row[field]."""
+    def formatter(row, result, index):
+        return "[[خاص:مساهمات/" + row[field] + "|" + arabic_number(row[count_field]) + "]]"
+    return formatter
+
+
+def replace(field, replacements):
+    """row[field] with each key of replacements replaced by its value, in order."""
+    replacements = list(replacements.items())
+
+    def formatter(row, result, index):
+        value = row[field]
+        for old, new in replacements:
+            value = value.replace(old, new)
+        return value
+    return formatter
+
+
+def choice(field, values, default=""):
+    """The text of values for row[field], default for any other value."""
+    def formatter(row, result, index):
+        return values.get(row[field], default)
+    return formatter
+
+
+FORMATTERS = {
+    "index": index,
+    "text": text,
+    "constant": constant,
+    "user_link": user_link,
+    "number": number,
+    "contributions_link": contributions_link,
+    "replace": replace,
+    "choice": choice,
+}
@@ -0,0 +1,129 @@
+"""
+Queries of per-user activity counts for the members of a user group.
+
+A report declares its counts as metrics, each a condition on the rows of a
+source table such as logging.  Instead of one correlated COUNT(*) subquery
+per metric and member, group_activity_query compiles the metrics of each
+source into a single GROUP BY actor pass with one SUM(CASE ...) column per
+metric, restricted to the members of the group, and joins the results to
+the members.  Members without matching rows get 0, as with COUNT(*).
+"""
+
+
+def sql_string(value):
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def sql_list(values):
+    return ", ".join(sql_string(value) for value in values)
+
+
+class Metric:
+    """
+    One count of a report.
+
+    Args:
+        name (str): the column name of the count in the result.
+        condition (str): the SQL condition on the rows of the source table.
+        log_type (str, optional): the log type the condition is limited to,
+         used to read only the needed log types.
+    """
+
+    def __init__(self, name, condition, log_type=None):
+        self.name = name
+        self.condition = condition
+        self.log_type = log_type
+
+
+def log_metric(name, log_type, actions=(), exclude_actions=(), params_like=(), params_not_like=()):
+    """
+    Return a Metric counting the log entries of one type.
+
+    Args:
+        name (str): the column name of the count.
+        log_type (str): the log_type of the counted entries.
+        actions (iterable): count only these log actions, all if empty.
+        exclude_actions (iterable): do not count these log actions.
+        params_like (iterable): LIKE patterns log_params has to match.
+        params_not_like (iterable): LIKE patterns log_params must not match.
+    """
+    conditions = [f"log_type = {sql_string(log_type)}"]
+    if actions:
+        conditions.append(f"log_action IN ({sql_list(actions)})")
+    if exclude_actions:
+        conditions.append(f"log_action NOT IN ({sql_list(exclude_actions)})")
+    conditions += [f"log_params LIKE {sql_string(pattern)}" for pattern in params_like]
+    conditions += [f"log_params NOT LIKE {sql_string(pattern)}" for pattern in params_not_like]
+    return Metric(name, " AND ".join(conditions), log_type=log_type)
+
+
+class Source:
+    """
+    A table whose rows are counted per actor.
+
+    Args:
+        table (str): the table name.
+        actor_column (str): the column with the actor id of a row.
+        metrics (list): the Metric objects counted in this table.
+        where (str, optional): a condition every counted row matches, which
+         lets the database use an index for the single pass.
+    """
+
+    def __init__(self, table, actor_column, metrics, where=None):
+        self.table = table
+        self.actor_column = actor_column
+        self.metrics = metrics
+        self.where = where
+
+
+def log_source(metrics):
+    """Return the logging Source of metrics, reading only their log types."""
+    log_types = sorted({metric.log_type for metric in metrics})
+    return Source("logging", "log_actor", metrics, where=f"log_type IN ({sql_list(log_types)})")
+
+
+def group_activity_query(group, sources, excluded_users=()):
+    """
+    Return the query of the metric counts of every member of a user group.
+
+    Args:
+        group (str): the user group, e.g. sysop.
+        sources (list): the Source objects with the metrics of the report.
+        excluded_users (iterable): user names left out of the report.
+
+    Returns:
+        str: a query selecting user_name and one column per metric, ordered
+        by user_name.
+    """
+    members = f"SELECT ug_user FROM user_groups WHERE ug_group = {sql_string(group)}"
+    columns = ["user_name"]
+    joins = []
+    for number, source in enumerate(sources):
+        alias = f"s{number}"
+        sums = ",\n".join(
+            f"               SUM(CASE WHEN {metric.condition} THEN 1 ELSE 0 END) AS `{metric.name}`"
+            for metric in source.metrics
+        )
+        where = f"actor_user IN ({members})"
+        if source.where:
+            where += f"\n             AND {source.where}"
+        joins.append(f"""LEFT JOIN (SELECT actor_user,
+{sums}
+        FROM {source.table}
+                 INNER JOIN actor ON actor_id = {source.actor_column}
+        WHERE {where}
+        GROUP BY actor_user) {alias} ON {alias}.actor_user = user_id""")
+        columns += [f"CAST(COALESCE({alias}.`{metric.name}`, 0) AS UNSIGNED) AS `{metric.name}`"
+                    for metric in source.metrics]
+
+    where = f"ug_group = {sql_string(group)}"
+    if excluded_users:
+        where += f" AND user_name NOT IN ({sql_list(excluded_users)})"
+    select = ",\n       ".join(columns)
+    joined = "\n         ".join(joins)
+    return f"""SELECT {select}
+FROM user
+         JOIN user_groups ON user_id = ug_user
+         {joined}
+WHERE {where}
+ORDER BY user_name ASC;"""
@@ -0,0 +1,170 @@
+"""
+Run journal of the statistics reports.
+
+UpdatePage records for every report the wall time and row count of its
+query, the EXPLAIN plan of the query, and the time spent rendering and
+saving the page.  The entries are appended to a JSONL file, one line per
+report run, so slow replica queries can be found and compared over time.
+When a regression threshold is set, a report whose query time exceeds the
+threshold times the median of its previous runs is reported as a
+regression.  The file keeps the last window runs of every report, and a
+plan is only stored when it differs from the last stored plan of the
+report or the run regressed.
+"""
+
+import json
+import os
+import statistics
+import threading
+from collections import deque
+from datetime import datetime, timezone
+
+
+class RunJournal:
+    """
+    A class for recording the timings of report runs.
+
+    Args:
+        path (str, optional): The JSONL journal path. Defaults to
+         ~/statistics_journal.jsonl.
+        window (int): The number of previous runs of a report the median is
+         taken over.
+        regression_threshold (float, optional): Warn when the query time of
+         a report is more than this times its median. Disabled if None.
+        min_seconds (float): Query times that grow by less than this are
+         never reported as regressions.
+    """
+
+    def __init__(self, path=None, window=14, regression_threshold=None, min_seconds=5):
+        if path is None:
+            path = os.path.join(os.path.expanduser("~"), "statistics_journal.jsonl")
+        self.path = path
+        self.window = window
+        self.regression_threshold = regression_threshold
+        self.min_seconds = min_seconds
+        # the entries recorded by this process
+        self.entries = []
+        self._history = None
+        # report -> its last stored plan
+        self._plans = {}
+        self._lock = threading.Lock()
+        # the name run.py gives the report running in the current thread
+        self._current = threading.local()
+
+    def set_current_report(self, report):
+        """Record the entries of the current thread under report, until it is set to None."""
+        self._current.report = report
+
+    def current_report(self):
+        return getattr(self._current, "report", None)
+
+    def _load_history(self):
+        history = {}
+        lines = []
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    lines.append(entry)
+                    history.setdefault(entry.get("report"), deque(maxlen=self.window)).append(entry)
+                    if entry.get("plan") is not None:
+                        self._plans[entry.get("report")] = entry["plan"]
+        if len(lines) > sum(len(entries) for entries in history.values()):
+            self._trim(lines, history)
+        return history
+
+    def _trim(self, lines, history):
+        # rewrite the journal with the last window entries of every report, in their order
+        kept = {id(entry) for entries in history.values() for entry in entries}
+        entries = [entry for entry in lines if id(entry) in kept]
+        # keep the last stored plan of every report, older runs are dropped with theirs
+        kept_plans = {entry.get("report") for entry in entries if entry.get("plan") is not None}
+        self._plans = {report: plan for report, plan in self._plans.items() if report in kept_plans}
+        temporary_path = self.path + ".tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                for entry in entries:
+                    file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            print(f"Error trimming the statistics journal: {e}")
+
+    def _ensure_history(self):
+        # called with the lock held
+        if self._history is None:
+            self._history = self._load_history()
+
+    def median(self, report, field="query_seconds"):
+        """Return the median of field over the previous runs of report, or None."""
+        with self._lock:
+            self._ensure_history()
+            values = [entry[field] for entry in self._history.get(report, ()) if entry.get(field) is not None]
+        return statistics.median(values) if values else None
+
+    def regression(self, entry):
+        """Return a warning text if entry regressed against the median of its report, else None."""
+        if self.regression_threshold is None or entry.get("query_seconds") is None:
+            return None
+        median = self.median(entry["report"])
+        if median is None:
+            return None
+        seconds = entry["query_seconds"]
+        if seconds > median * self.regression_threshold and seconds - median >= self.min_seconds:
+            return (f"{entry['report']}: query took {seconds:.1f}s, "
+                    f"{seconds / max(median, 0.001):.1f} times its median of {median:.1f}s")
+        return None
+
+    def record(self, entry):
+        """
+        Append the entry of one report run to the journal.
+
+        Args:
+            entry (dict): report, query_seconds, rows, plan, render_seconds,
+             save_seconds and the other timings of the run.
+        """
+        entry = {"time": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"), **entry}
+        if entry.get("report") is None:
+            entry["report"] = self.current_report()
+        warning = self.regression(entry)
+        if warning is not None:
+            entry["regression"] = warning
+            print(f"WARNING: {warning}")
+        with self._lock:
+            self._ensure_history()
+            plan = entry.pop("plan", None)
+            if plan is not None and (warning is not None or plan != self._plans.get(entry["report"])):
+                entry["plan"] = plan
+                self._plans[entry["report"]] = plan
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+            try:
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.write(line + "\n")
+            except OSError as e:
+                print(f"Error writing the statistics journal: {e}")
+            self.entries.append(entry)
+            self._history.setdefault(entry["report"], deque(maxlen=self.window)).append(entry)
+        return entry
+
+
+def seconds_text(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def summary_table(entries):
+    """Return a text table of entries, slowest query first."""
+    lines = [f"{'report':<60} {'query':>8} {'rows':>7} {'render':>8} {'save':>8}"]
+    for entry in sorted(entries, key=lambda entry: -(entry.get("query_seconds") or 0)):
+        rows = entry.get("rows")
+        lines.append(f"{entry['report'][:60]:<60} {seconds_text(entry.get('query_seconds')):>8} "
+                     f"{'-' if rows is None else rows:>7} {seconds_text(entry.get('render_seconds')):>8} "
+                     f"{seconds_text(entry.get('save_seconds')):>8}"
+                     + ("  REGRESSION" if entry.get("regression") else "")
+                     + ("  ERROR: " + entry["error"] if entry.get("error") else ""))
+    return "\n".join(lines)
+
+
+# the journal of this process, see tasks/statistics/run.py for the regression flag
+run_journal = RunJournal()
@@ -73,17 +73,17 @@ connection = pymysql.connect(
 
 
 def file_name(row, result, index):
-    name = str(row['file'], 'utf-8')
+    name = row['file']
     return f"[https://commons.wikimedia.org/wiki/File:{name} {name}]"
 
 
 def file_image(row, result, index):
-    name = str(row['file'], 'utf-8')
+    name = row['file']
     return "[[ملف:" + name + "|150px]]"
 
 
 def username_link(row, result, index):
-    username = str(row['username'], 'utf-8').replace(" ", "_")
+    username = row['username'].replace(" ", "_")
     return f"[https://commons.wikimedia.org/w/index.php?title=User:{username} {username}]"
 
 
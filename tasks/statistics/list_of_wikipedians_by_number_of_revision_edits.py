@@ -1,37 +1,32 @@
+from tasks.statistics.counters import CounterStore, actor_reviews, fetch
 from tasks.statistics.module import UpdatePage, ArticleTables, index
 
 # Set the parameters for the update
-query = """SELECT
-  actor_name AS name,
-  count(logging.log_id) as score
-FROM logging
-INNER JOIN actor ON log_actor = actor.actor_id
-and log_type = "review" and  log_action in ('approve','approve-ia','approve-a','approve2-i','approve-i','approve2','unapprove','unapprove2')
-#and log_namespace = 0
-and ucase(actor_name) not like ucase("%BOT") COLLATE utf8mb4_general_ci
+# the reviews of each actor are counted in the local counter store, only the new log entries are read daily
+query = actor_reviews.delta_query
+actors_query = """SELECT actor_id, actor_name
+FROM actor
+WHERE actor_id IN ({ids})
+  and ucase(actor_name) not like ucase("%BOT") COLLATE utf8mb4_general_ci
   and actor_name not like "%بوت%" collate utf8mb4_general_ci
   and actor_name Not IN (SELECT user_name
                          FROM user_groups
                                   INNER JOIN user ON user_id = ug_user
                          WHERE ug_group = "bot")
   and actor_id NOT IN ("2579643")
-  and actor_user not in (137877)
-
-GROUP BY actor_name
-ORDER BY score desc,actor_name
-limit 100"""
+  and actor_user not in (137877)"""
 file_path = 'stub/list_of_wikipedians_by_number_of_revision_edits.txt'
 page_name = "ويكيبيديا:تقارير قاعدة البيانات/قائمة الويكيبيديين حسب عدد مراجعة التعديلات"
 
 
 def username(row, result, index):
-    user_name = str(row['name'], 'utf-8')
+    user_name = row['name']
     name = user_name.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "[[مستخدم:" + user_name + "|" + name + "]]"
 
 
 def total_edits(row, result, index):
-    user_name = str(row['name'], 'utf-8')
+    user_name = row['name']
     number = format(row['score'], ',').replace(',', '٬')
     return "[[خاص:مساهمات/" + user_name + "|" + number + "]]"
 
@@ -43,13 +38,28 @@ columns = [
 ]
 
 
+def resolve_actors(batch):
+    # names are read from the replica, so renames and new bot flags apply to past reviews too
+    rows = fetch(actors_query.format(ids=",".join(str(key) for key, _ in batch)))
+    names = {row['actor_id']: row['actor_name'] for row in rows}
+    return [{'name': names[key], 'score': score} for key, score in batch if key in names]
+
+
 def main(*args: str) -> int:
+    store = CounterStore()
+    try:
+        store.refresh(actor_reviews)
+        result = store.ranked(actor_reviews, resolve_actors, 100)
+    finally:
+        store.close()
+    result.sort(key=lambda row: (-row['score'], row['name']))
+
     # Create an instance of the ArticleTables class
     tables = ArticleTables()
     tables.add_table("main_table", columns)
 
     # Create an instance of the updater and update the page
-    updater = UpdatePage(query, file_path, page_name, tables)
+    updater = UpdatePage(query, file_path, page_name, tables, result=result)
     updater.update()
     return 0
 
@@ -1,29 +1,96 @@
 import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from operator import itemgetter
 
 import pymysql
 import pywikibot
 from pywikibot import config as _config
 
+from core.utils.save_cache import save_if_changed
+from tasks.statistics.journal import run_journal
+
+# saves of reports running in parallel go through one writer at a time
+save_lock = threading.Lock()
+
+
+def connect(dbname="arwiki"):
+    return pymysql.connect(
+        host=_config.db_hostname_format.format(dbname),
+        read_default_file=_config.db_connect_file,
+        db=replica_name(dbname),
+        charset='utf8mb4',
+        port=_config.db_port,
+        cursorclass=pymysql.cursors.DictCursor,
+    )
+
+
+class ConnectionPool:
+    """
+    A bounded pool of replica connections shared by the reports of one process.
+
+    At most size connections are open at the same time; a report waits for a
+    free connection and gives it back when its query is done.
+    """
+
+    def __init__(self, size=4):
+        self.size = size
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+                connection.ping(reconnect=True)
+            except queue.Empty:
+                connection = connect()
+            try:
+                yield connection
+            except Exception:
+                connection.close()
+                raise
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def replica_name(dbname="arwiki"):
+    return _config.db_name_format.format(dbname)
+
+
+def decode_row(row):
+    return {key: str(value, 'utf-8', 'replace') if isinstance(value, bytes) else value for key, value in row.items()}
+
 
 class Database:
+    # ConnectionPool used by all Database objects when set, see tasks/statistics/run.py
+    pool = None
+
     def __init__(self):
         self._connection = None
         self._query = ""
         self.result = []
+        # the database the query runs on, part of the key of the query cache
+        self.replica = replica_name()
+        # when set, the EXPLAIN plan of the query is kept in plan
+        self.explain = False
+        self.plan = None
 
     @property
     def connection(self):
         if self._connection is not None:
             return self._connection
         else:
-            return pymysql.connect(
-                host=_config.db_hostname_format.format("arwiki"),
-                read_default_file=_config.db_connect_file,
-                db=_config.db_name_format.format("arwiki"),
-                charset='utf8mb4',
-                port=_config.db_port,
-                cursorclass=pymysql.cursors.DictCursor,
-            )
+            return connect()
 
     @property
     def query(self):
@@ -34,20 +101,122 @@ class Database:
         self._query = value
 
     def get_content_from_database(self):
+        if self._connection is None and Database.pool is not None:
+            with Database.pool.connection() as connection:
+                self._execute(connection)
+            return
+        connection = self.connection
         try:
-            # Create a cursor object
-            with self.connection.cursor() as cursor:
-                # Execute the SELECT statement
-                cursor.execute(self._query)
-                # Fetch all the rows of the result
-                self.result = cursor.fetchall()
+            self._execute(connection)
         finally:
             # Close the connection
-            self.connection.close()
+            connection.close()
+
+    def _execute(self, connection):
+        # Create a cursor object
+        with connection.cursor() as cursor:
+            if self.explain:
+                self.plan = self._explain(cursor)
+            # Execute the SELECT statement
+            cursor.execute(self._query)
+            # Fetch all the rows of the result, with the binary columns of the replica decoded once
+            self.result = [decode_row(row) for row in cursor.fetchall()]
+
+    def _explain(self, cursor):
+        try:
+            cursor.execute("EXPLAIN " + self._query.strip().rstrip(";"))
+            return [decode_row(row) for row in cursor.fetchall()]
+        except pymysql.MySQLError as e:
+            return [{"error": str(e)}]
 
     @connection.setter
     def connection(self, value):
         self._connection = value
+        self.replica = getattr(value, "db", None) or repr(value)
+
+
+def normalize_sql(query):
+    """
+    Return query without comments, runs of whitespace outside quotes collapsed and no final semicolon.
+
+    A comment counts as whitespace, so the text on both sides of it stays
+    apart.  MySQL hints written as /*! ... */ or /*+ ... */ are kept.
+    """
+    parts = []
+    space = False
+    index = 0
+    query = query.strip()
+    while index < len(query):
+        char = query[index]
+        if char in "'\"`":
+            # copy the quoted text as it is, with its backslash escapes
+            end = index + 1
+            while end < len(query) and query[end] != char:
+                end += 2 if query[end] == "\\" and char != "`" else 1
+            if space and parts:
+                parts.append(" ")
+            space = False
+            parts.append(query[index:end + 1])
+            index = end + 1
+            continue
+        if char == "#" or (query.startswith("--", index) and query[index + 2:index + 3] in ("", " ", "\t", "\n", "\r")):
+            end = query.find("\n", index)
+            index = len(query) if end == -1 else end
+            space = True
+            continue
+        if query.startswith("/*", index) and query[index + 2:index + 3] not in ("!", "+"):
+            end = query.find("*/", index + 2)
+            index = len(query) if end == -1 else end + 2
+            space = True
+            continue
+        if char.isspace():
+            space = True
+        else:
+            if space and parts:
+                parts.append(" ")
+            space = False
+            parts.append(char)
+        index += 1
+    return "".join(parts).rstrip("; ")
+
+
+class QueryCache:
+    """
+    The results of the queries run by the reports of one process.
+
+    Results are keyed by the normalized SQL and the replica, so reports fed by
+    the same query read the replica once.  A report asking for a query that
+    another report is running waits for it instead of running it again.
+    Every caller gets its own copy of the rows, since some formatters change
+    the rows they format.
+    """
+
+    def __init__(self):
+        self._results = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def rows(self, database):
+        """
+        Return (rows, cached) for the query of database, running it only on the first request.
+        """
+        key = (normalize_sql(database.query), database.replica)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            cached = key in self._results
+            if not cached:
+                database.get_content_from_database()
+                self._results[key] = database.result
+        return [dict(row) for row in self._results[key]], cached
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._locks.clear()
+
+
+query_cache = QueryCache()
 
 
 class Page:
@@ -56,6 +225,8 @@ class Page:
         self._page_name = ""
         self.contents = ""
         self._summary = "بوت:إحصاءات V2.5.3"
+        self.lock_seconds = None
+        self.save_seconds = None
 
     @property
     def page_name(self):
@@ -89,11 +260,12 @@ class Page:
         # Get a Page object for the page
         page = pywikibot.Page(self.site, self.page_name)
         self.make_new_text()
-        # Set the text of the page
-        # Set the text of the page
-        page.text = self.contents
-        # Save the page
-        page.save(summary=self.summary)
+        # Save the page, unless it has the text the bot saved last time
+        started = time.monotonic()
+        with save_lock:
+            self.lock_seconds = time.monotonic() - started
+            save_if_changed(page, self.contents, self.summary)
+        self.save_seconds = time.monotonic() - started - self.lock_seconds
 
 
 class File:
@@ -128,49 +300,57 @@ class ArticleTable:
     def set_sort_column(self, column_name):
         self.sort_column = column_name
 
+    def formatters(self):
+        """Return one (row, result, index) -> str function per column, built once per table."""
+        formatters = []
+        for _, value_index, clause in self.columns:
+            if clause:
+                formatters.append(clause)
+            else:
+                formatters.append(lambda row, result, index, key=value_index: cell_text(row[key]))
+        return formatters
+
     def build_table(self, result, end_row_in_table=None, header_text=None, footer_text=None):
         if self.sort_column:
-            result = sorted(result, key=lambda x: x[self.sort_column], reverse=True)
+            result = sorted(result, key=itemgetter(self.sort_column), reverse=True)
 
-        table_header = ""
+        table_name = str(self.add_table_name)
+        parts = []
         if header_text is not None:
-            table_header += header_text(result)
+            parts.append(header_text(result).replace("TABLE_NAME", table_name))
 
         # create the table header
-        header = '{| class="wikitable sortable"\n'
+        parts.append('{| class="wikitable sortable"\n')
         for column_name, _, _ in self.columns:
-            header += f'!style="background-color:#808080" align="center"|{column_name}\n'
+            parts.append(f'!style="background-color:#808080" align="center"|{column_name}\n')
 
         # create the table body
-        body = header
-
+        formatters = self.formatters()
         for index, row in enumerate(result):
-            body += '|-\n'
-            for _, value_index, clause in self.columns:
-                if clause:
-                    cell_value = clause(row, result, index)
-                else:
-                    if isinstance(row[value_index], (str, bytes)):
-                        cell_value = str(row[value_index], 'utf-8')
-                    else:
-                        cell_value = str(row[value_index])
-                body += f'|{cell_value}\n'
-            body += '\n'
+            parts.append('|-\n')
+            for formatter in formatters:
+                parts.append(f'|{formatter(row, result, index)}\n')
+            parts.append('\n')
         if end_row_in_table is not None:
-            body += end_row_in_table(result)
+            parts.append(end_row_in_table(result).replace("TABLE_NAME", table_name))
 
         # create the table footer
-        footer = '|}\n'
-
+        parts.append('|}\n')
         if footer_text is not None:
-            footer += footer_text(result)
+            parts.append(footer_text(result).replace("TABLE_NAME", table_name))
 
         # return the full table
-        return str(table_header + body + footer).replace("TABLE_NAME", str(self.add_table_name))
+        return "".join(parts)
+
+
+def cell_text(value):
+    if isinstance(value, bytes):
+        return str(value, 'utf-8')
+    return str(value)
 
 
 class UpdatePage:
-    def __init__(self, query, file_path, page_name, tables, connection=None):
+    def __init__(self, query, file_path, page_name, tables, connection=None, result=None):
         self.database = Database()
         self.file = File()
         self.tables = tables
@@ -178,23 +358,53 @@ class UpdatePage:
         if connection is not None:
             self.database.connection = connection
         self.database.query = query
-        self.database.get_content_from_database()
-
+        # the name run.py runs the report under, the stub name when it runs on its own
+        self.report = run_journal.current_report() or os.path.splitext(os.path.basename(file_path))[0]
+        self.query_seconds = None
+        self.cached = False
+        # rows already computed by a shared query, see tasks/statistics/page_creations.py
+        self.result = result
         self.file.set_stub_path(file_path)
-        self.file.get_file_content()
-
         self.page.page_name = page_name
 
+    def load(self):
+        """Return the rows of the report, running its query through the query cache on first use."""
+        if self.result is None:
+            self.database.explain = True
+            started = time.monotonic()
+            self.result, self.cached = query_cache.rows(self.database)
+            if self.cached:
+                if self.database._connection is not None:
+                    self.database._connection.close()
+            else:
+                self.query_seconds = time.monotonic() - started
+            self.database.result = self.result
+        return self.result
+
     def update(self):
+        result = self.load()
+        self.file.get_file_content()
+        started = time.monotonic()
         content = self.file.contents
-        table_body = ""
-        for table in self.tables.tables:
-            table_body += table.build_table(result=self.database.result, end_row_in_table=table.add_end_row_to_table,
-                                            header_text=table.add_header_text, footer_text=table.add_footer_text)
+        table_body = "".join(
+            table.build_table(result=result, end_row_in_table=table.add_end_row_to_table,
+                              header_text=table.add_header_text, footer_text=table.add_footer_text)
+            for table in self.tables.tables)
 
         content = content.replace("BOT_TABLE_BODY", table_body)
         self.page.set_contents(content)
+        render_seconds = time.monotonic() - started
         self.page.save_page()
+        run_journal.record({
+            "report": self.report,
+            "query_seconds": self.query_seconds,
+            "cached": self.cached,
+            "rows": len(result),
+            "render_seconds": render_seconds,
+            "lock_seconds": self.page.lock_seconds,
+            "save_seconds": self.page.save_seconds,
+            "plan": self.database.plan,
+        })
 
 
 class ArticleTables:
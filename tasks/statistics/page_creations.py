@@ -0,0 +1,66 @@
+"""
+Shared data of the users_by_number_of_*_creation reports.
+
+The twelve reports count the pages each user created in one namespace, with
+or without bots.  Instead of twelve scans of the first revisions, one grouped
+query counts the creations of every actor by namespace and redirect state and
+marks bot actors, and every report takes its rows from that result.
+"""
+
+from tasks.statistics.module import Database, query_cache
+
+creations_query = """SELECT actor_name,
+       p.page_namespace as namespace,
+       p.page_is_redirect as is_redirect,
+       (ucase(actor_name) like ucase("%BOT") COLLATE utf8mb4_general_ci
+           or actor_name like "%بوت%" collate utf8mb4_general_ci
+           or actor_name IN (SELECT user_name
+                             FROM user_groups
+                                      INNER JOIN user ON user_id = ug_user
+                             WHERE ug_group = "bot")) as is_bot,
+       COUNT(*) as q_user_editcount
+FROM revision r
+         INNER JOIN actor ON r.rev_actor = actor.actor_id
+         INNER JOIN page p on r.rev_page = p.page_id
+WHERE r.rev_parent_id = 0
+  and (p.page_namespace in (0, 10, 12, 14) or (p.page_namespace = 100 and p.page_title not like "%/%"))
+  and (p.page_is_redirect = 0 or p.page_namespace = 0)
+  and actor_id NOT IN ("2579643")
+  and actor_user not in (137877)
+GROUP BY actor_name, p.page_namespace, p.page_is_redirect;"""
+
+
+def load_creations():
+    """
+    Return the (actor, namespace, is_redirect, is_bot, count) rows, querying the replica once per run.
+    """
+    database = Database()
+    database.query = creations_query
+    rows, _ = query_cache.rows(database)
+    return rows
+
+
+def creation_rows(namespace, is_redirect=False, with_bot=False, limit=500):
+    """
+    Return the rows of one creation report, as its own query returned them.
+
+    Args:
+        namespace (int): the namespace of the created pages.
+        is_redirect (bool): count redirects instead of pages.
+        with_bot (bool): include bot accounts.
+        limit (int): the number of users in the report.
+
+    Returns:
+        list: dicts with actor_name and q_user_editcount, users with more
+        than one creation, most creations first.
+    """
+    rows = []
+    for row in load_creations():
+        if row['namespace'] != namespace or bool(row['is_redirect']) != is_redirect:
+            continue
+        if row['is_bot'] and not with_bot:
+            continue
+        if row['q_user_editcount'] > 1:
+            rows.append({'actor_name': row['actor_name'], 'q_user_editcount': row['q_user_editcount']})
+    rows.sort(key=lambda row: (-row['q_user_editcount'], row['actor_name']))
+    return rows[:limit]
@@ -1,18 +1,19 @@
+from tasks.statistics.counters import CounterStore, fetch, page_revisions
 from tasks.statistics.module import UpdatePage, ArticleTables, index
 
 # Set the parameters for the update
-query = """SELECT COUNT(*) AS revisions, rev_page, p.page_namespace, p.page_title FROM revision r
-                   LEFT JOIN ( SELECT page_id, page_title, page_namespace FROM page ) p ON r.rev_page = p.page_id
-                   GROUP BY rev_page
-                   ORDER BY revisions DESC
-                   LIMIT 1000"""
+# the revisions of each page are counted in the local counter store, only the new revisions are read daily
+query = page_revisions.delta_query
+pages_query = """SELECT page_id, page_namespace, page_title
+FROM page
+WHERE page_id IN ({ids})"""
 file_path = 'stub/pages_with_most_revisions.txt'
 page_name = "ويكيبيديا:تقارير قاعدة البيانات/الصفحات التي تحتوي على أكبر عدد من المراجعات"
 
 
 def page_name_with_namespace(row, result, index):
     namespace = "{{ns:" + str(row['page_namespace']) + "}}"
-    temp_title = str(row['page_title'], 'utf-8')
+    temp_title = row['page_title']
     return f"[[{namespace}:{temp_title}]]"
 
 
@@ -24,13 +25,27 @@ columns = [
 ]
 
 
+def resolve_pages(batch):
+    # titles are read from the replica, pages deleted since they were counted are dropped
+    pages = {row['page_id']: row for row in fetch(pages_query.format(ids=",".join(str(key) for key, _ in batch)))}
+    return [{'revisions': revisions, 'rev_page': key, 'page_namespace': pages[key]['page_namespace'],
+             'page_title': pages[key]['page_title']} for key, revisions in batch if key in pages]
+
+
 def main(*args: str) -> int:
+    store = CounterStore()
+    try:
+        store.refresh(page_revisions)
+        result = store.ranked(page_revisions, resolve_pages, 1000)
+    finally:
+        store.close()
+
     # Create an instance of the ArticleTables class
     tables = ArticleTables()
     tables.add_table("main_table", columns)
 
     # Create an instance of the updater and update the page
-    updater = UpdatePage(query, file_path, page_name, tables)
+    updater = UpdatePage(query, file_path, page_name, tables, result=result)
     updater.update()
     return 0
 
@@ -51,24 +51,24 @@ page_name = "ويكيبيديا:تقارير قاعدة البيانات/نطا
 
 
 def username(row, result, index):
-    user_name = str(row['actor_name'], 'utf-8')
+    user_name = row['actor_name']
     return "[[User talk:" + user_name + "|" + user_name + "]]"
 
 
 def ipb_address(row, result, index):
-    return "{{ipr | 1 = " + str(row['ipb_address'], 'utf-8') + "}}"
+    return "{{ipr | 1 = " + row['ipb_address'] + "}}"
 
 
 def get_ip_range(row, result, index):
-    ipb_address = str(row['ipb_address'], 'utf-8')
-    ipb_range_start = str(row['ipb_range_start'], 'utf-8')
-    ipb_range_end = str(row['ipb_range_end'], 'utf-8')
+    ipb_address = row['ipb_address']
+    ipb_range_start = row['ipb_range_start']
+    ipb_range_end = row['ipb_range_end']
     ip_range_calculator = IPRangeCalculator(ipb_address, ipb_range_start, ipb_range_end)
     return str(ip_range_calculator.get_ip_range())
 
 
 def ipb_timestamp(row, result, index):
-    return "{{نسخ:#time::H:i، j F Y|" + str(row['ipb_timestamp'], 'utf-8') + "}}"
+    return "{{نسخ:#time::H:i، j F Y|" + row['ipb_timestamp'] + "}}"
 
 
 columns = [
@@ -0,0 +1,152 @@
+"""
+Registry of the statistics reports that need no code of their own.
+
+reports.json declares each report: the file of its SQL under sql/, its
+stub, the target page, its columns built from the shared formatters of
+tasks/statistics/formatters.py, its schedule and the replica it reads.
+load_registry validates the whole file once and returns ReportSpec objects,
+and run_spec runs one of them the way the main() of a report module does.
+"""
+
+import json
+import os
+import re
+
+from tasks.statistics.formatters import FORMATTERS
+from tasks.statistics.module import ArticleTables, UpdatePage, connect
+
+statistics_dir = os.path.dirname(os.path.abspath(__file__))
+registry_path = os.path.join(statistics_dir, "reports.json")
+
+schedules = ("daily", "weekly", "manual")
+default_replica = "arwiki"
+
+
+class RegistryError(ValueError):
+    pass
+
+
+class ReportSpec:
+    """
+    One report of the registry.
+
+    Args:
+        name (str): the unique name of the report.
+        query (str): the SQL of the report.
+        file_path (str): the stub path, relative to tasks/statistics.
+        page_name (str): the page the report is saved to.
+        columns (list): (title, field, formatter) tuples as ArticleTables takes them.
+        schedule (str): one of schedules.
+        replica (str): the database the query runs on, e.g. arwiki.
+    """
+
+    def __init__(self, name, query, file_path, page_name, columns, schedule, replica):
+        self.name = name
+        self.query = query
+        self.file_path = file_path
+        self.page_name = page_name
+        self.columns = columns
+        self.schedule = schedule
+        self.replica = replica
+
+
+def _column(name, number, column):
+    if not isinstance(column, dict) or not isinstance(column.get("title"), str):
+        raise RegistryError(f"{name}: column {number} needs a title")
+    args = {key: value for key, value in column.items() if key not in ("title", "format")}
+    if "format" not in column:
+        if set(args) != {"field"} or not isinstance(args["field"], str):
+            raise RegistryError(f"{name}: column {column['title']} needs either a field or a format")
+        return column["title"], args["field"]
+    factory = FORMATTERS.get(column["format"])
+    if factory is None:
+        raise RegistryError(f"{name}: column {column['title']} uses the unknown format {column['format']}")
+    try:
+        formatter = factory(**args)
+    except (TypeError, ValueError) as e:
+        raise RegistryError(f"{name}: column {column['title']}: {e}") from None
+    return column["title"], None, formatter
+
+
+def _spec(entry):
+    if not isinstance(entry, dict):
+        raise RegistryError(f"a report must be an object, not {entry!r}")
+    name = entry.get("name")
+    if not isinstance(name, str) or not name:
+        raise RegistryError(f"a report needs a name: {entry!r}")
+    for key in ("query", "stub", "page"):
+        if not isinstance(entry.get(key), str) or not entry[key]:
+            raise RegistryError(f"{name}: {key} is missing")
+    unknown = set(entry) - {"name", "query", "stub", "page", "columns", "schedule", "replica"}
+    if unknown:
+        raise RegistryError(f"{name}: unknown keys {', '.join(sorted(unknown))}")
+
+    schedule = entry.get("schedule", "daily")
+    if schedule not in schedules:
+        raise RegistryError(f"{name}: schedule must be one of {', '.join(schedules)}")
+    replica = entry.get("replica", default_replica)
+    if not isinstance(replica, str) or not re.fullmatch(r"[a-z_]+wik[a-z]+", replica):
+        raise RegistryError(f"{name}: {replica!r} is not a replica database name")
+
+    for key in ("query", "stub"):
+        if not os.path.isfile(os.path.join(statistics_dir, entry[key])):
+            raise RegistryError(f"{name}: the {key} file {entry[key]} does not exist")
+    with open(os.path.join(statistics_dir, entry["query"]), encoding="utf-8") as file:
+        query = file.read()
+
+    columns = entry.get("columns")
+    if not isinstance(columns, list) or not columns:
+        raise RegistryError(f"{name}: columns must be a non empty list")
+    columns = [_column(name, number, column) for number, column in enumerate(columns, 1)]
+    return ReportSpec(name, query, entry["stub"], entry["page"], columns, schedule, replica)
+
+
+def load_registry(path=registry_path):
+    """
+    Read and validate the registry.
+
+    Returns:
+        dict: report name -> ReportSpec, in the order of the file.
+
+    Raises:
+        RegistryError: if any report is invalid, naming the report.
+    """
+    with open(path, encoding="utf-8") as file:
+        try:
+            entries = json.load(file)
+        except ValueError as e:
+            raise RegistryError(f"{path}: {e}") from None
+    if not isinstance(entries, list):
+        raise RegistryError(f"{path}: the registry must be a list of reports")
+    specs = {}
+    for entry in entries:
+        spec = _spec(entry)
+        if spec.name in specs:
+            raise RegistryError(f"{spec.name}: the name is used twice")
+        specs[spec.name] = spec
+    return specs
+
+
+_registry = None
+
+
+def registry():
+    """Return the registry, loaded and validated on first use."""
+    global _registry
+    if _registry is None:
+        _registry = load_registry()
+    return _registry
+
+
+def run_spec(spec):
+    # Create an instance of the ArticleTables class
+    tables = ArticleTables()
+    tables.add_table("main_table", spec.columns)
+
+    # reports of other wikis keep their own connection, arwiki reports use the shared pool
+    connection = connect(spec.replica) if spec.replica != default_replica else None
+
+    # Create an instance of the updater and update the page
+    updater = UpdatePage(spec.query, spec.file_path, spec.page_name, tables, connection=connection)
+    updater.update()
+    return 0
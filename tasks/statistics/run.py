@@ -0,0 +1,122 @@
+import ast
+import importlib
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from tasks.statistics.journal import run_journal, summary_table
+from tasks.statistics.module import ConnectionPool, Database, query_cache
+from tasks.statistics.registry import registry, run_spec
+
+# module level names a script needs to be run as a report
+report_names = {"query", "file_path", "page_name", "columns", "main"}
+
+statistics_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def is_report(path):
+    """Return True if the script at path defines a report, checked without importing it."""
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=path)
+    found = set()
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            found.update(target.id for target in node.targets if isinstance(target, ast.Name))
+        elif isinstance(node, ast.FunctionDef):
+            found.add(node.name)
+    return report_names <= found
+
+
+def discover():
+    """
+    Return the names of the registered reports and the module names of the
+    report scripts of tasks/statistics and its packages.
+
+    Scripts are parsed, not imported, since some of them do their work at import time.
+    """
+    reports = list(registry())
+    for root, dirs, files in os.walk(statistics_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.exists(os.path.join(root, d, "__init__.py")))
+        package = os.path.relpath(root, statistics_dir).replace(os.sep, ".")
+        for name in sorted(files):
+            if not name.endswith(".py") or name in ("__init__.py", "module.py", "run.py"):
+                continue
+            if is_report(os.path.join(root, name)):
+                module = name[:-3] if package == "." else f"{package}.{name[:-3]}"
+                reports.append(module)
+    return reports
+
+
+def run_report(name):
+    started = time.monotonic()
+    # the journal entries of the report, including errors, are recorded under name
+    run_journal.set_current_report(name)
+    try:
+        if name in registry():
+            run_spec(registry()[name])
+        else:
+            module = importlib.import_module(f"tasks.statistics.{name}")
+            module.main()
+        print(f"{name}: done in {time.monotonic() - started:.1f}s")
+        return True
+    except Exception as e:
+        print(f"Error running report {name}: {e}")
+        print(traceback.format_exc())
+        run_journal.record({"report": name, "error": str(e), "seconds": time.monotonic() - started})
+        return False
+    finally:
+        run_journal.set_current_report(None)
+
+
+def run_reports(names, workers=4):
+    """
+    Run reports concurrently in this process.
+
+    The queries of up to workers reports run at the same time over a pool of
+    workers replica connections, while the pages are saved one at a time by
+    the shared writer lock of tasks.statistics.module.  Reports with the same
+    query share one result through the query cache, which is emptied after
+    the run.
+
+    Returns:
+        int: the number of reports that failed.
+    """
+    Database.pool = ConnectionPool(workers)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_report, names))
+    finally:
+        Database.pool.close()
+        Database.pool = None
+        query_cache.clear()
+    return results.count(False)
+
+
+def main(*args: str) -> int:
+    # --regression-threshold=N warns about reports whose query takes N times its median
+    # --schedule=S adds the registered reports of schedule S, see reports.json
+    options = [arg for arg in args if arg.startswith("--")]
+    # validate the registry before any report runs
+    registry()
+    names = []
+    for option in options:
+        if option.startswith("--regression-threshold="):
+            run_journal.regression_threshold = float(option.split("=", 1)[1])
+        elif option.startswith("--schedule="):
+            schedule = option.split("=", 1)[1]
+            names += [name for name, spec in registry().items() if spec.schedule == schedule]
+    # registered report names or report module names relative to tasks.statistics,
+    # all discovered reports if none is given
+    names += [(name[:-3] if name.endswith(".py") else name).replace("/", ".") for name in args if name not in options]
+    names = names or discover()
+    started = time.monotonic()
+    failed = run_reports(names)
+    print(summary_table(run_journal.entries))
+    print(f"ran {len(names)} reports in {time.monotonic() - started:.1f}s, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(*sys.argv[1:]))
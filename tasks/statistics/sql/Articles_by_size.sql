@@ -0,0 +1,4 @@
+select page_title,page_namespace,page_len from page 
+where page_namespace = 0
+order by page_len desc
+limit 1000
@@ -0,0 +1,10 @@
+SELECT
+    DISTINCT page_title,el_index
+FROM
+    externallinks
+        JOIN page ON el_from = page_id
+WHERE
+        el_index_60 LIKE 'mailto:%'
+  AND page_namespace = 0
+LIMIT
+    1000;
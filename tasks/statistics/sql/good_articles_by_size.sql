@@ -0,0 +1,7 @@
+select page_namespace,page_title,page_len from categorylinks cla
+inner join page on page.page_id = cla.cl_from
+inner join linktarget lt ON cla.cl_target_id = lt.lt_id
+where lt.lt_title like "مقالات_جيدة"
+and lt.lt_namespace = 14
+and cla.cl_type like "page"
+order by page_len desc
@@ -0,0 +1,15 @@
+SELECT
+  ipb_address,
+  actor_name,
+  ipb_timestamp,
+  comment_text
+FROM
+  ipblocks
+  INNER JOIN actor_ipblocks ON ipb_by_actor = actor_id
+  INNER JOIN comment_ipblocks ON ipb_reason_id = comment_id
+WHERE
+  ipb_expiry = "infinity"
+  AND ipb_user = 0
+  /* filter out some non-IPs with ipb_user = 0 */
+  AND ipb_address REGEXP '^[0-9]'
+  AND comment_text NOT REGEXP '(proxies|proxy|checkuser)';
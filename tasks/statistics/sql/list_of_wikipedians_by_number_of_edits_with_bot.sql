@@ -0,0 +1,5 @@
+SELECT user_name, user_editcount
+FROM user
+where user_id not in (137877)
+ORDER BY user_editcount DESC
+LIMIT 500;
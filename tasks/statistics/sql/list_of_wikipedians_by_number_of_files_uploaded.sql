@@ -0,0 +1,7 @@
+select count(log_id) as "count_of_uploads", actor_name
+from logging_userindex 
+inner join actor on actor_id = logging_userindex.log_actor
+where log_type like "upload"
+GROUP BY log_actor
+order by count(log_id) desc
+limit 500;
@@ -0,0 +1,8 @@
+SELECT page_namespace,
+                    page_title,
+                    SUM( page_len ) / 1024 / 1024 AS total_size
+                    FROM page
+                    WHERE page_namespace MOD 2 = 1
+                    GROUP BY page_namespace, page_title
+                    ORDER BY total_size DESC
+                    LIMIT 1000
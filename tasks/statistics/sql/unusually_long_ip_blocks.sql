@@ -0,0 +1,15 @@
+SELECT
+  ipb_address,
+  ipb_by_text,
+  ipb_timestamp,
+  ipb_expiry,
+  ipb_reason
+FROM
+  ipblocks_compat
+WHERE
+  ipb_expiry > DATE_FORMAT(DATE_ADD(NOW(), INTERVAL 1 month), '%Y%m%d%H%i%s')
+  AND ipb_expiry != "infinity"
+  AND ipb_user = 0
+  AND INSTR(LOWER(ipb_reason), 'proxy') = 0
+  AND INSTR(LOWER(ipb_reason), 'بروكسيات مفتوحة') = 0
+  AND INSTR(LOWER(ipb_reason), 'webhost') = 0;
@@ -0,0 +1,14 @@
+SELECT
+  ipb_address,
+  actor_name,
+  ipb_timestamp,
+  ipb_expiry,
+  comment_text
+FROM
+  ipblocks
+  INNER JOIN actor_ipblocks ON ipb_by_actor = actor_id
+  INNER JOIN comment_ipblocks ON ipb_reason_id = comment_id
+WHERE
+  ipb_expiry > DATE_FORMAT(DATE_ADD(NOW(), INTERVAL 1 month), '%Y%m%d%H%i%s')
+  AND ipb_expiry != "infinity"
+  AND ipb_user != 0;
@@ -1,7 +1,4 @@
-from tasks.statistics.module import UpdatePage, ArticleTables, index
-
-# Set the parameters for the update
-query = """SELECT u.user_name as user_name,
+SELECT u.user_name as user_name,
        (
            SELECT MIN(rev_timestamp)
            FROM revision
@@ -79,45 +76,4 @@ FROM user u
     AND actor_id NOT IN ("2579643")
     and actor_user not in (137877)
 ORDER BY pages_created DESC
-LIMIT 500;"""
-file_path = 'stub/users_by_the_number_of_pages_created.txt'
-page_name = "ويكيبيديا:تقارير قاعدة البيانات/المستخدمين حسب عدد إنشاء الصفحات"
-
-
-def username(row, result, index):
-    user_name = str(row['user_name'], 'utf-8')
-    name = user_name.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
-    return "[[مستخدم:" + user_name + "|" + name + "]]"
-
-
-def first_edit_date_str(row, result, index):
-    first_edit_date = str(row['first_edit_date'], 'utf-8')
-    return "{{نسخ:#time:j F Y|" + first_edit_date + "}}"
-
-
-columns = [
-    ("الرقم", None, index),
-    ("المستخدم", None, username),
-    ("أول مساهمة", None, first_edit_date_str),
-    ("مقالة", "pages_created"),
-    ("قالب", "template_created"),
-    ("مساعدة", "help_created"),
-    ("تصنيف", "category_created"),
-    ("بوابة", "portals_created"),
-    ("تحويلة", "redirect_created"),
-]
-
-
-def main(*args: str) -> int:
-    # Create an instance of the ArticleTables class
-    tables = ArticleTables()
-    tables.add_table("main_table", columns)
-
-    # Create an instance of the updater and update the page
-    updater = UpdatePage(query, file_path, page_name, tables)
-    updater.update()
-    return 0
-
-
-if __name__ == "__main__":
-    raise SystemExit(main())
+LIMIT 500;
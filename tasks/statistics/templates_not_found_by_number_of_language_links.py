@@ -20,13 +20,13 @@ LIMIT 1000;
 
 # todo: edit this to make it outside main def
 def en_template_name(row, result, index):
-    name = str(row['page_title'], 'utf-8')
+    name = row['page_title']
     language = 'en'
     return "[[:" + language + ":Template:" + name + "|" + name + "]]"
 
 
 def ar_template_name(row, result, index):
-    name = str(row['page_title'], 'utf-8')
+    name = row['page_title']
     language = 'ar'
     return "[[:" + language + ":قالب:" + name + "|" + name + "]]"
 
@@ -1,37 +1,20 @@
 from tasks.statistics.module import UpdatePage, ArticleTables, index
+from tasks.statistics.page_creations import creations_query, creation_rows
 
 # Set the parameters for the update
-query = """SELECT actor_name, COUNT(*) as q_user_editcount
-FROM revision r
-         INNER JOIN actor ON r.rev_actor = actor.actor_id
-         INNER JOIN page p on r.rev_page = p.page_id
-WHERE p.page_namespace = 12
-  and p.page_is_redirect = 0
-  and r.rev_parent_id = 0
-  and ucase(actor_name) not like ucase("%BOT") COLLATE utf8mb4_general_ci
-  and actor_name not like "%بوت%" collate utf8mb4_general_ci
-  and actor_name Not IN (SELECT user_name
-                         FROM user_groups
-                                  INNER JOIN user ON user_id = ug_user
-                         WHERE ug_group = "bot")
-  and actor_id NOT IN ("2579643")
-  and actor_user not in (137877)
-GROUP BY actor_name
-having COUNT(*) > 1
-ORDER BY COUNT(*) DESC
-LIMIT 500;"""
+query = creations_query
 file_path = 'stub/users_by_number_of_help_pages_creation.txt'
 page_name = "ويكيبيديا:تقارير قاعدة البيانات/المستخدمين حسب عدد إنشاء صفحات المساعدة"
 
 
 def username(row, result,index):
-    user_name = str(row['actor_name'], 'utf-8')
+    user_name = row['actor_name']
     name = user_name.replace("__", "[LOKA]").replace("_", " ").replace("[LOKA]", "_")
     return "[[مستخدم:" + user_name + "|" + name + "]]"
 
 
 def total_edits(row, result,index):
-    user_name = str(row['actor_name'], 'utf-8')
+    user_name = row['actor_name']
     number = format(row['q_user_editcount'], ',').replace(',', '٬')
     return "[[خاص:مساهمات/" + user_name + "|" + number + "]]"
 
@@ -49,7 +32,8 @@ def main(*args: str) -> int:
     tables.add_table("main_table", columns)
 
     # Create an instance of the updater and update the page
-    updater = UpdatePage(query, file_path, page_name, tables)
+    # the rows come from the creation counts shared by all users_by_number_of_*_creation reports
+    updater = UpdatePage(query, file_path, page_name, tables, result=creation_rows(12))
     updater.update()
     return 0
 
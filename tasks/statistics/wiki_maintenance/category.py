@@ -35,17 +35,17 @@ page_name = "مستخدم:فيصل/تصانيف"
 
 
 def delete_page(row, result, index):
-    page_title = str(row['deleted_page'], 'utf-8')
+    page_title = row['deleted_page']
     return "[[:en:" + page_title.rsplit("*/", 1)[-1] + "|"+page_title.rsplit("*/", 1)[-1]+"]]"
 
 
 def ar_page(row, result, index):
-    page_title = str(row['name_of_page'], 'utf-8')
+    page_title = row['name_of_page']
     return "[[:" + page_title + "]]"
 
 
 def date_of_delete(row, result, index):
-    date_delete = str(row['date_of_delete'], 'utf-8')
+    date_delete = row['date_of_delete']
     return "{{نسخ:#time:G:i، j F Y|" + date_delete + "}}"
 
 
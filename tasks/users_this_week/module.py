@@ -5,6 +5,8 @@ import pymysql
 import pywikibot
 from pywikibot import config as _config
 
+from core.utils.save_cache import save_if_changed
+
 
 class Translator:
     """A class for translating English words to Arabic.
@@ -311,10 +313,8 @@ class SubPage(Base):
             "DOMAIN_NAME", str(self.domain_name))
         # Set the page you want to edit
         page = pywikibot.Page(site, title)
-        # Load the page
-        page.text = table
-        # Save the page with a summary
-        page.save(summary=self.input_dict['summary'])
+        # Save the page with a summary, unless the table did not change
+        save_if_changed(page, table, self.input_dict['summary'])
 
 
 class SendTemplate(Base):
@@ -426,9 +426,9 @@ class MainPage(Base):
         page = pywikibot.Page(site, self.title_of_page)
 
         # Set the text of the page
-        page.text = str(self.text).replace('YEAR_NUMBER', str(self.year)).replace("WEEK_NUMBER",
-                                                                                  self.week_number).replace(
+        text = str(self.text).replace('YEAR_NUMBER', str(self.year)).replace("WEEK_NUMBER",
+                                                                             self.week_number).replace(
             "DOMAIN_NAME", self.domain_name).replace("ARCHIVE_INTO_TEXT_TEXT", self.archive_into_text_text)
 
-        # Save the page
-        page.save(summary=self.summary)
+        # Save the page, unless the text did not change
+        save_if_changed(page, text, self.summary)
@@ -9,6 +9,9 @@ from database.engine import engine
 from database.helpers import get_articles, get_page_count, update_page_statuses_to_pending
 from database.models import TaskName
 from tasks.webcite.module import ProcessArticle
+from tasks.webcite.modules.availability import AvailabilityPrefetcher, lookup_limiter
+from tasks.webcite.modules.cite import USER_AGENT
+from tasks.webcite.modules.domain_memory import DomainMemory
 from tasks.webcite.modules.request_limiter import RequestLimiter
 
 
@@ -16,13 +19,17 @@ def read(thread_number):
     try:
         print(thread_number)
         limiter = RequestLimiter()
+        domains = DomainMemory()
+        # shared by all pages claimed by this thread
+        availability = AvailabilityPrefetcher(USER_AGENT, limiter=lookup_limiter())
         site = pywikibot.Site()
         need_to_sleep = True
 
         with Session(engine) as session:
             for row in get_articles(session, thread_number,pages_type=TaskName.WEBCITE):
                 need_to_sleep = False
-                process_article = ProcessArticle(site=site,session=session, id=row[0], title=row[1], thread_number=thread_number, limiter=limiter)
+                process_article = ProcessArticle(site=site,session=session, id=row[0], title=row[1], thread_number=thread_number, limiter=limiter, domains=domains,
+                                                 availability=availability)
                 process_article.start()
 
         if not need_to_sleep:
@@ -65,6 +72,7 @@ def main():
         limiter = RequestLimiter()
         run_threads()
         limiter.clear_old_requests()
+        lookup_limiter().clear_old_requests()
     with Session(engine) as session:
         update_page_statuses_to_pending(session, TaskName.WEBCITE)
     return 0
@@ -43,7 +43,13 @@ list_of_template = [
     # Cite mailing list
     ["استشهاد بقائمة بريدية", mailing_list_type],
     ["Cite mailing list", mailing_list_type],
+]
 
 
+def normalize_name(name):
+    """Normalize a template or argument name for comparison."""
+    return str(name).lower().strip().replace(" ", "_")
 
-]
+
+# normalized template name -> citation type, built once at import time
+template_types = {normalize_name(name): type_name for name, type_name in list_of_template}
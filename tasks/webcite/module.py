@@ -7,30 +7,45 @@ from sqlalchemy.orm import Session
 from core.utils.helpers import check_status, check_edit_age
 from core.utils.wikidb import Database
 from database.models import Page, Status as Model_Status
+from tasks.webcite.modules.availability import AvailabilityPrefetcher
+from tasks.webcite.modules.domain_memory import DomainMemory
 from tasks.webcite.modules.parsed import Parsed
 from tasks.webcite.modules.request_limiter import RequestLimiter
 
 
-def get_pages(start):
-    query = """SELECT pl_2_title
-FROM (
-    SELECT DISTINCT page.page_title AS "pl_2_title"
+def get_pages_with_priority(start):
+    """
+    Yield recently edited articles with their scheduling signals.
+
+    Yields:
+        tuple: (title, citation_count, popularity) where citation_count is the
+        number of external links that do not point to the Wayback Machine and
+        popularity is the number of language links of the page.
+    """
+    query = """SELECT page_title AS "pl_2_title",
+       (SELECT COUNT(*) FROM externallinks
+        WHERE el_from = page_id
+          AND el_to_domain_index NOT LIKE '%://org.archive.%') AS "citation_count",
+       (SELECT COUNT(*) FROM langlinks WHERE ll_from = page_id) AS "popularity"
+FROM page
+WHERE page_id IN (
+    SELECT DISTINCT rev_page
     FROM revision
-    INNER JOIN page ON revision.rev_page = page.page_id
-    WHERE page.page_namespace IN (0)
-    AND rev_timestamp > DATE_SUB( now(), INTERVAL MINUTE_SUB_NUMBER MINUTE ) and page_is_redirect = 0
-) AS pages_list"""
+    WHERE rev_timestamp > DATE_SUB( now(), INTERVAL MINUTE_SUB_NUMBER MINUTE )
+)
+AND page_namespace IN (0) and page_is_redirect = 0"""
     database = Database()
     database.query = query.replace("MINUTE_SUB_NUMBER", str(start))
     database.get_content_from_database()
 
     for row in database.result:
         title = str(row['pl_2_title'], 'utf-8')
-        yield title
+        yield title, int(row['citation_count']), int(row['popularity'])
 
 
 class ProcessArticle:
-    def __init__(self,site: pywikibot.Site, session: Session, id: int, title: str, thread_number: int, limiter: RequestLimiter):
+    def __init__(self,site: pywikibot.Site, session: Session, id: int, title: str, thread_number: int, limiter: RequestLimiter,
+                 domains: DomainMemory = None, availability: AvailabilityPrefetcher = None):
         # init base
         self.site = site
         self.session = session
@@ -38,6 +53,8 @@ class ProcessArticle:
         self.title = title
         self.thread_number = thread_number
         self.limiter = limiter
+        self.domains = domains
+        self.availability = availability
         self.summary = "بوت:الإبلاغ عن رابط معطوب أو مؤرشف V1.6.4"
 
     def start(self):
@@ -60,18 +77,29 @@ class ProcessArticle:
                         if check_edit_age(page=self.page):
 
                             try:
-                                bot = Parsed(self.page.text, self.summary, self.limiter)
+                                bot = Parsed(self.page.text, self.summary, self.limiter, self.domains, self.availability)
                                 new_text, new_summary = bot()
+                                saved = False
                                 # write processed text back to the page
                                 if new_text != self.page.text and check_status(
                                         "مستخدم:LokasBot/الإبلاغ عن رابط معطوب أو مؤرشف"):
                                     print("start save " + self.page.title())
                                     self.page.text = new_text
                                     self.page.save(new_summary)
+                                    saved = True
                                 else:
                                     print("page not changed " + self.page.title())
 
-                                self._delete_page()
+                                if bot.reached_limit():
+                                    if saved or bot.made_progress():
+                                        # more citations are left, put the page back in the queue
+                                        self._requeue_page(bot.pending_number)
+                                    else:
+                                        # nothing was archived, e.g. the first citations keep failing or
+                                        # the rate limit was hit, so wait longer after every idle pass
+                                        self._delay_idle_page()
+                                else:
+                                    self._delete_page()
 
                             except Exception as e:
                                 logging.error(f"An error occurred while processing {self.title}: {e}")
@@ -99,6 +127,22 @@ class ProcessArticle:
             self.session.delete(self.page_query)
             self.session.commit()
 
+    def _requeue_page(self, citation_count):
+        # Put the page back in the queue with the number of citations still left
+        if self.page_query is not None:
+            self.page_query.status = Model_Status.PENDING
+            self.page_query.citation_count = citation_count
+            self.page_query.idle_passes = 0
+            self.page_query.update_date = datetime.datetime.now()
+            self.session.commit()
+
+    def _delay_idle_page(self, max_hours=48):
+        # 1, 2, 4 ... hours after each pass in a row that archived nothing
+        if self.page_query is not None:
+            idle_passes = (self.page_query.idle_passes or 0) + 1
+            self.page_query.idle_passes = idle_passes
+            self._delay_page(hours=min(2 ** (idle_passes - 1), max_hours))
+
     def _delay_page(self, hours=1):
         # Update the status of the page to indicate that it needs to be processed again later
         if self.page_query is not None:
@@ -0,0 +1,149 @@
+"""
+This module provides a class for checking many URLs on the Wayback Machine at once.
+
+The AvailabilityPrefetcher class deduplicates the URLs of a page (or of a
+batch of pages), looks up the newest successful snapshot of each one over a
+single pooled HTTP session and remembers the answers, so that a save request
+is only sent for URLs that have no recent snapshot.  Lookups take a slot of
+the lookups bucket of RequestLimiter, sized for the CDX API and separate
+from the budget of the save requests, and all prefetchers of a process run
+at most max_concurrent_lookups lookups at the same time.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tasks.webcite.modules.cite import Archive
+from tasks.webcite.modules.request_limiter import RequestLimiter
+
+CDX_API_URL = "https://web.archive.org/cdx/search/cdx"
+
+# lookups running at the same time in all the webcite threads of a process
+max_concurrent_lookups = 4
+lookup_slots = threading.BoundedSemaphore(max_concurrent_lookups)
+# CDX lookups allowed per minute in all webcite processes
+lookups_per_minute = 60
+
+
+def lookup_limiter():
+    """Return a RequestLimiter of the lookups bucket, for the thread that runs the prefetcher."""
+    return RequestLimiter(limit=lookups_per_minute, interval=60, name="lookups")
+
+
+class AvailabilityPrefetcher:
+    """
+    A class for looking up Wayback Machine snapshots of many URLs.
+
+    Args:
+        user_agent (str): The user agent sent to the Wayback Machine.
+        workers (int, optional): The number of lookups running at the same
+         time over the pooled session. Defaults to 4.
+        timeout (int, optional): The timeout of one lookup in seconds.
+         Defaults to 30.
+        limiter (RequestLimiter, optional): The limiter every lookup waits
+         for, see lookup_limiter. Lookups are not limited if None.
+        max_age (timedelta, optional): Snapshots older than this are ignored,
+         so their URL is archived again. Defaults to 365 days, None accepts
+         snapshots of any age.
+
+    Attributes:
+        results (dict): url -> Archive of its newest snapshot, or None if the
+         URL has no snapshot within max_age. URLs whose lookup failed are not
+         stored.
+    """
+
+    def __init__(self, user_agent, workers=4, timeout=30, limiter=None, max_age=timedelta(days=365)):
+        self.user_agent = user_agent
+        self.workers = workers
+        self.timeout = timeout
+        self.limiter = limiter
+        self.max_age = max_age
+        self.results = {}
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": user_agent})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+
+    def _lookup(self, url):
+        """
+        Look up the newest successful snapshot of one URL.
+
+        Returns:
+            tuple: (url, found, Archive or None), found is False if the lookup failed.
+        """
+        params = {
+            "url": url,
+            "output": "json",
+            "fl": "timestamp,original",
+            "filter": "statuscode:200",
+            "limit": "-1",
+        }
+        if self.max_age is not None:
+            params["from"] = (datetime.now() - self.max_age).strftime("%Y%m%d%H%M%S")
+        try:
+            response = self.session.get(CDX_API_URL, params=params, timeout=self.timeout)
+            if response.status_code != 200:
+                return url, False, None
+            rows = response.json() if response.text.strip() else []
+        except (requests.RequestException, ValueError) as e:
+            print(f"An error occurred while checking {url} on the archive: {e}")
+            return url, False, None
+        # the first row is the header
+        if len(rows) < 2:
+            return url, True, None
+        timestamp, original = rows[-1][0], rows[-1][1]
+        return url, True, Archive(f"https://web.archive.org/web/{timestamp}/{original}", timestamp)
+
+    def prefetch(self, urls):
+        """
+        Look up all URLs not checked yet, each distinct URL only once.
+
+        Args:
+            urls (iterable): The URLs to check.
+        """
+        new_urls = list(dict.fromkeys(url for url in urls if url not in self.results))
+        if not new_urls:
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = []
+            for url in new_urls:
+                # taken in this thread, the limiter connection belongs to it
+                self._wait_for_limiter()
+                lookup_slots.acquire()
+                futures.append(executor.submit(self._slot_lookup, url))
+            for future in futures:
+                url, found, archive = future.result()
+                if found:
+                    self.results[url] = archive
+
+    def _slot_lookup(self, url):
+        try:
+            return self._lookup(url)
+        finally:
+            lookup_slots.release()
+
+    def _wait_for_limiter(self):
+        if self.limiter is None:
+            return
+        while not self.limiter.can_make_request():
+            time.sleep(1)
+        self.limiter.add_request()
+
+    def fill(self, cites):
+        """
+        Prefetch the URLs of cites and set their archive_object.
+
+        Args:
+            cites (list): Cite objects with a URL.
+        """
+        self.prefetch(cite.url.value.strip() for cite in cites)
+        for cite in cites:
+            url = cite.url.value.strip()
+            if url in self.results:
+                cite.archive_object = self.results[url]
+                cite.availability_checked = True
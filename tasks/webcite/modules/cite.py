@@ -6,13 +6,16 @@ Archive: A class for storing information about an archived webpage.
 Cite: A class for creating and updating citations using templates.
 """
 
+import re
 import traceback
 
 import requests
 from waybackpy.exceptions import TooManyRequestsError
 from datetime import datetime, timedelta
 
-from tasks.webcite.data import list_of_template, web_type, press_release_type, newsgroup_type, news_type, map_type
+from tasks.webcite.data import list_of_template, web_type, press_release_type, newsgroup_type, news_type, map_type, \
+    mailing_list_type, template_types, normalize_name
+from tasks.webcite.modules.cites.mailinglist import MailingList
 from tasks.webcite.modules.cites.map import CiteMap
 from tasks.webcite.modules.cites.news import News
 from tasks.webcite.modules.cites.newsgroup import Newsgroup
@@ -22,6 +25,41 @@ from tasks.webcite.modules.cites.press_release import PressRelease
 from waybackpy import WaybackMachineCDXServerAPI
 from waybackpy import WaybackMachineSaveAPI
 
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
+
+excluded_sites = [
+    'archive.org',
+    'web.archive.org',
+    'mail.yahoo.com',
+    'duckduckgo.com/?q=',
+    'google.com/search',
+    '127.0.0.1',
+    'localhost',
+    '0.0.0.0',
+    'chrome:',
+    'chrome-extension:',
+    'about:',
+    'moz-extension:',
+    'file:',
+    'edge:',
+    'extension:',
+    'safari-web-extension:',
+    'chrome-error:'
+]
+
+# one pattern matching any excluded site, compiled once at import time
+excluded_sites_pattern = re.compile("|".join(re.escape(normalize_name(site)) for site in excluded_sites))
+
+# citation type -> class handling it
+cite_classes = {
+    web_type: WebCite,
+    press_release_type: PressRelease,
+    newsgroup_type: Newsgroup,
+    news_type: News,
+    map_type: CiteMap,
+    mailing_list_type: MailingList,
+}
+
 
 class Archive:
     """
@@ -53,8 +91,12 @@ class Cite:
         self.template = self._set_right_class(template)
         self.url = self.template.url()
 
-        self.user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
+        self.user_agent = USER_AGENT
         self.archive_object = None
+        # True when the archive site refused or failed to archive the url
+        self.archive_failed = False
+        # True when archive_object was already looked up, e.g. by AvailabilityPrefetcher
+        self.availability_checked = False
 
     def _set_right_class(self, template):
         """
@@ -66,19 +108,11 @@ class Cite:
         Returns:
             Cite object.
         """
-        for t in self.list_of_templates:
-            if str(t[0]).lower().strip().replace(" ","_") == str(template.name).lower().strip().replace(" ","_"):
-                class_name = t[1].strip().lower()
-                if class_name == web_type:
-                    return WebCite(template)
-                elif class_name == press_release_type:
-                    return PressRelease(template)
-                elif class_name == newsgroup_type:
-                    return Newsgroup(template)
-                elif class_name == news_type:
-                    return News(template)
-                elif class_name == map_type:
-                    return CiteMap(template)
+        cite_type = template_types.get(normalize_name(template.normal_name()))
+        cite_class = cite_classes.get(cite_type)
+        if cite_class is not None:
+            return cite_class(template)
+        return None
 
     def is_archived(self):
         """
@@ -101,30 +135,16 @@ class Cite:
         return None
 
     def is_url_excluded(self, url):
-        sites = [
-            'archive.org',
-            'web.archive.org',
-            'mail.yahoo.com',
-            'duckduckgo.com/?q=',
-            'google.com/search',
-            '127.0.0.1',
-            'localhost',
-            '0.0.0.0',
-            'chrome:',
-            'chrome-extension:',
-            'about:',
-            'moz-extension:',
-            'file:',
-            'edge:',
-            'extension:',
-            'safari-web-extension:',
-            'chrome-error:'
-        ]
-        status = True
-        for site in sites:
-            if site.lower().strip().replace(" ","_") in url.lower().strip().replace(" ","_"):
-                status = None
-        return status
+        """
+        Checks the URL against the compiled list of excluded sites.
+
+        Returns:
+            True if the URL can be archived, None if it is excluded.
+        """
+        if excluded_sites_pattern.search(normalize_name(url)):
+            return None
+        return True
+
     def check_available_on_api(self):
         """
         Checks if the webpage is available on Wayback Machine API
@@ -154,7 +174,8 @@ class Cite:
             # print(just_the_string)
 
     def archive_it(self):
-        self.check_available_on_api()
+        if not self.availability_checked:
+            self.check_available_on_api()
 
         if self.archive_object is None:
             try:
@@ -164,11 +185,14 @@ class Cite:
                 if r.status_code == 200:
                     self.archive_object = Archive(save_api.save(),
                                                   str(save_api.timestamp().strftime('%Y%m%d%H%M%S')))
+                else:
+                    self.archive_failed = True
             except TooManyRequestsError as error:
                 print(f"An error occurred while send link to archive site processing: {error}")
                 just_the_string = traceback.format_exc()
                 print(just_the_string)
             except Exception as error:
+                self.archive_failed = True
                 print(f"An error occurred while processing: {error}")
                 just_the_string = traceback.format_exc()
                 print(just_the_string)
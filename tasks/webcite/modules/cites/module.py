@@ -1,56 +1,66 @@
-import copy
-
+from tasks.webcite.data import normalize_name
 from tasks.webcite.modules.date_formatter import DateFormatter
 
+ARCHIVE_URL_ARGS = [
+    "مسار الأرشيف",
+    "archiveurl",
+    "archive-url",
+    "مسار أرشيف"
+]
+ARCHIVE_DATE_ARGS = [
+    "archivedate",
+    "تاريخ الأرشيف",
+    "archive-date",
+    "تاريخ أرشيف"
+]
+URL_ARGS = [
+    "url",
+    "المسار",
+    "مسار"
+]
+TITLE_ARGS = [
+    "title",
+    "العنوان",
+    "عنوان",
+]
+ACCESSDATE_ARGS = [
+    "accessdate",
+    "access-date",
+    "تاريخ الوصول",
+    "accessdate",
+    "تاريخ الوصول للمسار"
+]
+
+# normalized forms of the alias lists above, computed once at import time
+_NORMALIZED_ARCHIVE_URL_ARGS = [normalize_name(arg) for arg in ARCHIVE_URL_ARGS]
+_NORMALIZED_URL_ARGS = [normalize_name(arg) for arg in URL_ARGS]
+
+formatter_ar = DateFormatter(language='ar')
+
 
 class BaseCite:
     """Class representing a base for cite template"""
 
     def __init__(self, template):
         self.template = template
-        self.o_template = copy.deepcopy(template)
-        self.archive_url_args = [
-            "مسار الأرشيف",
-            "archiveurl",
-            "archive-url",
-            "مسار أرشيف"
-        ]
-        self.archive_date_args = [
-            "archivedate",
-            "تاريخ الأرشيف",
-            "archive-date",
-            "تاريخ أرشيف"
-        ]
-        self.url_args = [
-            "url",
-            "المسار",
-            "مسار"
-        ]
-        self.title_args = [
-            "title",
-            "العنوان",
-            "عنوان",
-        ]
-
-        self.accessdate_args = [
-            "accessdate",
-            "access-date",
-            "تاريخ الوصول",
-            "accessdate",
-            "تاريخ الوصول للمسار"
-
-        ]
+        # original text of the template, kept to detect changes
+        self.o_template = str(template)
+        self.archive_url_args = ARCHIVE_URL_ARGS
+        self.archive_date_args = ARCHIVE_DATE_ARGS
+        self.url_args = URL_ARGS
+        self.title_args = TITLE_ARGS
+        self.accessdate_args = ACCESSDATE_ARGS
 
         self.arguments_after_clean = []
+        # normalized argument name -> non empty arguments with that name
+        self.arguments_index = {}
         self.archive_url_args_found = []
         self._check_args_found()
 
     def url(self):
-        for need_arg in self.url_args:
-            for arg in self.template.arguments:
-                if need_arg.lower().strip().replace(" ", "_") == arg.name.lower().strip().replace(" ", "_"):
-                    if arg.value.strip().lower():
-                        return self.template.get_arg(arg.name)
+        for need_arg in _NORMALIZED_URL_ARGS:
+            for arg in self.arguments_index.get(need_arg, ()):
+                return self.template.get_arg(arg.name)
         return None
 
     def is_archived(self):
@@ -60,36 +70,35 @@ class BaseCite:
     def _check_args_found(self):
 
         for arg in self.template.arguments:
-            if len(arg.value.strip().lower()) >= 1:
+            if arg.value.strip():
                 self.arguments_after_clean.append(arg)
+                self.arguments_index.setdefault(normalize_name(arg.name), []).append(arg)
 
-        for need_arg in self.archive_url_args:
-            for arg in self.arguments_after_clean:
-                if arg.name.lower().strip().replace(" ", "_") == need_arg.lower().strip().replace(" ", "_"):
-                    self.archive_url_args_found.append(arg)
+        for need_arg in _NORMALIZED_ARCHIVE_URL_ARGS:
+            self.archive_url_args_found.extend(self.arguments_index.get(need_arg, ()))
 
     def replace_to(self, searched_list, arg):
-        my_arg = None
+        my_value = None
         for need_arg in searched_list:
-            if self.template.has_arg(need_arg.strip().lower()):
-                tem_arg = copy.deepcopy(self.template.get_arg(need_arg.strip().lower()))
-                if len(tem_arg.value) >= 10:
-                    self.template.del_arg(need_arg.strip().lower())
-                    my_arg = tem_arg
-
-        if my_arg is not None:
-            self.template.set_arg(arg.strip().lower(), my_arg.value.strip())
+            need_arg = need_arg.strip().lower()
+            tem_arg = self.template.get_arg(need_arg)
+            if tem_arg is not None:
+                # keep only the value, the argument object is invalid after del_arg
+                tem_value = tem_arg.value
+                if len(tem_value) >= 10:
+                    self.template.del_arg(need_arg)
+                    my_value = tem_value
+
+        if my_value is not None:
+            self.template.set_arg(arg.strip().lower(), my_value.strip())
 
     def update_template(self, url, timestamp):
         for need_arg in self.archive_url_args:
-            if self.template.has_arg(need_arg):
-                self.template.del_arg(need_arg)
+            self.template.del_arg(need_arg)
 
         for need_arg in self.archive_date_args:
-            if self.template.has_arg(need_arg):
-                self.template.del_arg(need_arg)
+            self.template.del_arg(need_arg)
 
-        formatter_ar = DateFormatter(language='ar')
         formatted_date_ar = formatter_ar.format_timestamp(timestamp)
 
         self.replace_to(self.url_args, "مسار")
@@ -0,0 +1,140 @@
+"""
+This module provides a class for remembering how archiving went per domain.
+
+The DomainMemory class records archive successes and failures per domain in
+an SQLite database.  Domains that keep failing (paywalls, robots.txt
+exclusions, dead hosts) are skipped for a cool-down period that doubles with
+every further failure, so the archive budget is spent on links that can
+actually be archived.
+"""
+
+import os
+import sqlite3
+import time
+from urllib.parse import urlsplit
+
+
+def get_domain(url):
+    """
+    Get the host name of a URL without a leading "www.".
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        str: The domain, or None if the URL has no host.
+    """
+    try:
+        host = urlsplit(url.strip()).hostname
+    except ValueError:
+        return None
+    if not host:
+        return None
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class DomainMemory:
+    """
+    A class for skipping domains that repeatedly fail to archive.
+
+    Args:
+        threshold (int, optional): The number of consecutive failures after
+         which a domain is skipped. Defaults to 3.
+        cooldown (int, optional): The first cool-down period in seconds.
+         Defaults to one day.
+        max_cooldown (int, optional): The longest cool-down period in seconds.
+         Defaults to 30 days.
+        database_path (str, optional): The SQLite database path. Defaults to
+         ~/webcite_domains.db.
+
+    Attributes:
+        threshold (int): The number of consecutive failures before skipping.
+        cooldown (int): The first cool-down period in seconds.
+        max_cooldown (int): The longest cool-down period in seconds.
+    """
+
+    def __init__(self, threshold=3, cooldown=86400, max_cooldown=30 * 86400, database_path=None):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.db_conn = self._create_db_table(database_path)
+
+    def _create_db_table(self, database_path):
+        """
+        Create the domains table in an SQLite database.
+
+        Returns:
+            sqlite3.Connection: A connection to the SQLite database.
+        """
+        if database_path is None:
+            home_path = os.path.expanduser("~")
+            database_path = os.path.join(home_path, "webcite_domains.db")
+
+        # the read jobs share the database, WAL lets one read while another writes
+        conn = sqlite3.connect(database_path, timeout=60)
+        conn.execute("PRAGMA journal_mode=WAL")
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS domains (
+                domain TEXT PRIMARY KEY,
+                successes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                skip_until INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.commit()
+        return conn
+
+    def is_skipped(self, url):
+        """
+        Check if the domain of a URL is in its cool-down period.
+
+        Returns:
+            bool: True if archiving the URL should be skipped, False otherwise.
+        """
+        domain = get_domain(url)
+        if domain is None:
+            return False
+        cursor = self.db_conn.cursor()
+        cursor.execute("SELECT skip_until FROM domains WHERE domain = ?", (domain,))
+        row = cursor.fetchone()
+        return row is not None and row[0] > int(time.time())
+
+    def add_success(self, url):
+        """
+        Record that a URL of the domain was archived, ending any cool-down.
+        """
+        domain = get_domain(url)
+        if domain is None:
+            return
+        cursor = self.db_conn.cursor()
+        cursor.execute("""
+            INSERT INTO domains (domain, successes) VALUES (?, 1)
+            ON CONFLICT(domain) DO UPDATE SET successes = successes + 1, failures = 0, skip_until = 0
+        """, (domain,))
+        self.db_conn.commit()
+
+    def add_failure(self, url):
+        """
+        Record that a URL of the domain could not be archived.
+
+        After threshold consecutive failures the domain is skipped for
+        cooldown seconds, doubled for every further failure up to max_cooldown.
+        """
+        domain = get_domain(url)
+        if domain is None:
+            return
+        cursor = self.db_conn.cursor()
+        cursor.execute("""
+            INSERT INTO domains (domain, failures) VALUES (?, 1)
+            ON CONFLICT(domain) DO UPDATE SET failures = failures + 1
+        """, (domain,))
+        cursor.execute("SELECT failures FROM domains WHERE domain = ?", (domain,))
+        failures = cursor.fetchone()[0]
+        if failures >= self.threshold:
+            period = min(self.cooldown * 2 ** (failures - self.threshold), self.max_cooldown)
+            cursor.execute("UPDATE domains SET skip_until = ? WHERE domain = ?",
+                           (int(time.time()) + period, domain))
+        self.db_conn.commit()
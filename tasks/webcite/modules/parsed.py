@@ -3,20 +3,34 @@ import traceback
 
 import wikitextparser as wtp
 
-from tasks.webcite.data import list_of_template
+from core.utils.text_edits import TextEdits
+from tasks.webcite.data import list_of_template, template_types, normalize_name
+from tasks.webcite.modules.availability import AvailabilityPrefetcher, lookup_limiter
 from tasks.webcite.modules.cite import Cite
 
 
 class Parsed:
 
-    def __init__(self, text, summary, limiter):
+    def __init__(self, text, summary, limiter, domains=None, availability=None):
         self.text = text
         self.cite_templates = []
+        # spans of the cite templates in the original text
+        self.cite_spans = []
+        self.edits = TextEdits(text)
         self.list_of_templates = list_of_template
+        self.template_types = template_types
         self.summary = summary
         self.limiter = limiter
+        # DomainMemory used to skip domains that keep failing to archive
+        self.domains = domains
+        # AvailabilityPrefetcher shared by the pages of one batch
+        self.availability = availability
         self.max_number = 20
         self.number = 0
+        # cite templates not checked because max_number was reached
+        self.pending_number = 0
+        # cite templates that got an archive link in this pass
+        self.updated_number = 0
 
     def __call__(self):
         if self.check():
@@ -25,37 +39,93 @@ class Parsed:
 
     def check(self):
         parsed = wtp.parse(self.text)
-        templates_found_number = 0
-        for needed_templated in self.list_of_templates:
-            for template in parsed.templates:
-                if needed_templated[0].lower().strip().replace(" ","_") == template.normal_name().lower().strip().replace(" ","_"):
-                    self.cite_templates.append(template)
-                    templates_found_number += 1
-        return bool(templates_found_number)
+        for template in parsed.templates:
+            if normalize_name(template.normal_name()) in self.template_types:
+                # detach the template from the page parse so editing it does not rewrite the whole page
+                self.cite_templates.append(wtp.Template(template.string))
+                self.cite_spans.append(template.span)
+        return bool(self.cite_templates)
 
     def start_replace(self):
-        for template in self.cite_templates:
-            # to make it only archive 10 links in one edit
-            if self.number == self.max_number:
-                break
+        candidates = self._find_candidates()
+        # to make it only archive max_number links in one edit
+        if len(candidates) > self.max_number:
+            self.pending_number = len(candidates) - self.max_number
+            candidates = candidates[:self.max_number]
+        if not candidates:
+            return
+
+        if self.availability is None:
+            self.availability = AvailabilityPrefetcher(candidates[0][0].user_agent, limiter=lookup_limiter())
+        # look up existing snapshots of all urls before saving any of them
+        self.availability.fill([cite for cite, _, _ in candidates])
+
+        for cite, url, (start, end) in candidates:
+            try:
+                self.number += 1
+                if cite.archive_object is None:
+                    time.sleep(2)
+                    if self.limiter.can_make_request():
+                        self.limiter.add_request()
+                        # start archive cite
+                        cite.archive_it()
+                        self._record_outcome(cite, url)
+                    else:
+                        print("Rate limit exceeded, sleeping for 60 seconds")
+                        time.sleep(60)
+                cite.update_template()
+                new_template = str(cite.template.template)
+                if new_template != cite.template.o_template:
+                    self.edits.add(start, end, new_template)
+                    self.updated_number += 1
+            except Exception as e:
+                print(f"An error occurred while processing {cite.template.template}: {e}")
+                just_the_string = traceback.format_exc()
+                print(just_the_string)
+        # rebuild the text once with all updated citations
+        self.text = self.edits.apply()
+
+    def _find_candidates(self):
+        """
+        Find the cites that have a url and no archive link.
+
+        Returns:
+            list: (cite, url, span) tuples in page order.
+        """
+        candidates = []
+        for template, span in zip(self.cite_templates, self.cite_spans):
             try:
                 cite = Cite(template)
                 # to check if url found
                 if cite.check_available():
                     # to check if cite has archive link
                     if cite.is_archived() is False:
-                        self.number += 1
-                        time.sleep(2)
-                        if self.limiter.can_make_request():
-                            self.limiter.add_request()
-                            # start archive cite
-                            cite.archive_it()
-                            cite.update_template()
-                        else:
-                            print("Rate limit exceeded, sleeping for 60 seconds")
-                            time.sleep(60)
-                        self.text = str(self.text).replace(str(cite.template.o_template), str(cite.template.template))
+                        url = cite.url.value.strip()
+                        if self.domains is not None and self.domains.is_skipped(url):
+                            print(f"skip {url} domain failed to archive recently")
+                            continue
+                        candidates.append((cite, url, span))
             except Exception as e:
                 print(f"An error occurred while processing {template}: {e}")
                 just_the_string = traceback.format_exc()
                 print(just_the_string)
+        return candidates
+
+    def _record_outcome(self, cite, url):
+        if cite.archive_object is not None:
+            # later pages of the batch reuse the new snapshot
+            self.availability.results[url] = cite.archive_object
+        if self.domains is None:
+            return
+        if cite.archive_object is not None:
+            self.domains.add_success(url)
+        elif cite.archive_failed:
+            self.domains.add_failure(url)
+
+    def reached_limit(self):
+        """Return True if the edit stopped at max_number and citations are left."""
+        return self.pending_number > 0
+
+    def made_progress(self):
+        """Return True if at least one citation got an archive link in this pass."""
+        return self.updated_number > 0
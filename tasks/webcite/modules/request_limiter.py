@@ -3,7 +3,8 @@ This module provides a class for rate-limiting HTTP requests.
 
 The RequestLimiter class tracks the number of requests made within a given time
 interval and blocks further requests if the limit is exceeded. It uses SQLite
-database to store the request records.
+database to store the request records, one table per named bucket, so
+different kinds of requests can be limited separately.
 """
 
 import os
@@ -19,31 +20,41 @@ class RequestLimiter:
         limit (int, optional): The maximum number of requests that
          can be made within the time interval.Defaults to 10.
         interval (int, optional): The time interval in seconds. Defaults to 60.
+        name (str, optional): The bucket of the requests, limiters with the
+         same name share their count across threads and processes. Defaults
+         to "requests", the bucket of the archive save requests.
+        database_path (str, optional): The SQLite database path. Defaults to
+         ~/request_limiter.db.
 
     Attributes:
         limit (int): The maximum number of requests that can be made within the time interval.
         interval (int): The time interval in seconds.
+        name (str): The bucket of the requests.
     """
 
-    def __init__(self, limit=10, interval=60):
+    def __init__(self, limit=10, interval=60, name="requests", database_path=None):
+        if not name.isidentifier():
+            raise ValueError(f"{name!r} is not a valid bucket name")
         self.limit = limit
         self.interval = interval
-        self.db_conn = self._create_db_table()
+        self.name = name
+        self.db_conn = self._create_db_table(database_path)
 
-    def _create_db_table(self):
+    def _create_db_table(self, database_path):
         """
         Create the requests table in an SQLite database.
 
         Returns:
             sqlite3.Connection: A connection to the SQLite database.
         """
-        home_path = os.path.expanduser("~")
-        database_path = os.path.join(home_path, "request_limiter.db")
+        if database_path is None:
+            home_path = os.path.expanduser("~")
+            database_path = os.path.join(home_path, "request_limiter.db")
 
         conn = sqlite3.connect(database_path)
         cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS requests (
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {self.name} (
                 id INTEGER PRIMARY KEY,
                 timestamp INTEGER
             )
@@ -62,7 +73,7 @@ class RequestLimiter:
         # calculate the time interval before which requests are allowed
         min_time = int(time.time()) - self.interval
         # count the number of requests made in the time interval
-        cursor.execute(f"SELECT COUNT(*) FROM requests WHERE timestamp >= {min_time}")
+        cursor.execute(f"SELECT COUNT(*) FROM {self.name} WHERE timestamp >= {min_time}")
         count = cursor.fetchone()[0]
         return count < self.limit
 
@@ -72,7 +83,7 @@ class RequestLimiter:
         """
         cursor = self.db_conn.cursor()
         # insert a new request record with the current timestamp
-        cursor.execute(f"INSERT INTO requests (timestamp) VALUES ({int(time.time())})")
+        cursor.execute(f"INSERT INTO {self.name} (timestamp) VALUES ({int(time.time())})")
         self.db_conn.commit()
 
     def clear_old_requests(self):
@@ -83,5 +94,5 @@ class RequestLimiter:
         cursor = self.db_conn.cursor()
         # delete request records that are older than the time interval
         min_time = int(time.time()) - self.interval - 120  # add 2 minute buffer
-        cursor.execute(f"DELETE FROM requests WHERE timestamp < {min_time}")
+        cursor.execute(f"DELETE FROM {self.name} WHERE timestamp < {min_time}")
         self.db_conn.commit()
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from database.engine import engine
 from database.helpers import is_page_present
-from tasks.webcite.module import get_pages
+from tasks.webcite.module import get_pages_with_priority
 from sqlalchemy.orm import Session
 from database.models import Page, Statistic, TaskName
 
@@ -27,13 +27,15 @@ def main(*args: str) -> int:
             time_diff = (now - last_query_time).seconds // 60
             print(f"time_diff: {time_diff}")
 
-            for page_title in get_pages(time_diff + 3):
+            for page_title, citation_count, popularity in get_pages_with_priority(time_diff + 3):
                 if not is_page_present(session, page_title=page_title, task_type=TaskName.WEBCITE):
                     print("add : " + page_title)
                     temp_model = Page(
                         title=page_title,
                         thread_number=random.randint(1, 3),
-                        task_name=TaskName.WEBCITE
+                        task_name=TaskName.WEBCITE,
+                        citation_count=citation_count,
+                        popularity=popularity
                     )
                     session.add(temp_model)
 
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from database.engine import engine
 from database.helpers import is_page_present
 from database.models import Page, TaskName
-from tasks.webcite.module import get_pages
+from tasks.webcite.module import get_pages_with_priority
 
 
 def main(*args: str) -> int:
@@ -17,13 +17,15 @@ def main(*args: str) -> int:
             time_diff = int(sys.argv[1])
             print(f"time_diff: {time_diff}")
 
-            for page_title in get_pages(time_diff + 3):
+            for page_title, citation_count, popularity in get_pages_with_priority(time_diff + 3):
                 if not is_page_present(session, page_title=page_title, task_type=TaskName.WEBCITE):
                     print("add : " + page_title)
                     temp_model = Page(
                         title=page_title,
                         thread_number=3,
-                        task_name=TaskName.WEBCITE
+                        task_name=TaskName.WEBCITE,
+                        citation_count=citation_count,
+                        popularity=popularity
                     )
                     session.add(temp_model)
 
@@ -0,0 +1,158 @@
+import datetime
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from core.utils.backfill import Backfill, month_slices, timestamp
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def execute(self, query):
+        start, end = re.findall(r"'(\d{14})'", query)
+        if start in self.connection.failing:
+            raise RuntimeError("replica went away")
+        self.connection.queries.append(start)
+        self.rows = [(b"page", timestamp, b"title") for timestamp in self.connection.timestamps
+                     if start <= timestamp < end]
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+
+class FakeConnection:
+
+    def __init__(self, timestamps, failing, queries):
+        self.timestamps = timestamps
+        self.failing = failing
+        self.queries = queries
+        self.closed = False
+
+    def cursor(self, cursor_class=None):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class TestMonthSlices(unittest.TestCase):
+
+    def test_exact_months(self):
+        slices = month_slices(datetime.date(1999, 11, 15), datetime.date(2000, 2, 29))
+        self.assertEqual([(timestamp(start), timestamp(end)) for start, end in slices], [
+            ("19991115000000", "19991201000000"),
+            ("19991201000000", "20000101000000"),
+            ("20000101000000", "20000201000000"),
+            ("20000201000000", "20000301000000"),
+        ])
+
+    def test_no_month_is_skipped_or_repeated(self):
+        slices = month_slices(datetime.date(1999, 1, 1), datetime.date(2023, 12, 31))
+        self.assertEqual(len(slices), 25 * 12)
+        for (_, end), (start, _) in zip(slices, slices[1:]):
+            self.assertEqual(end, start)
+
+
+class TestBackfill(unittest.TestCase):
+
+    query = "SELECT * FROM revision WHERE rev_timestamp >= '{start}' AND rev_timestamp < '{end}'"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "backfill.sqlite")
+        self.timestamps = ["20230105000000", "20230131235959", "20230201000000", "20230315120000"]
+        self.failing = set()
+        self.queries = []
+        self.connections = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def connect(self, dbname):
+        connection = FakeConnection(self.timestamps, self.failing, self.queries)
+        self.connections.append(connection)
+        return connection
+
+    def backfill(self):
+        return Backfill("test", self.database_path, "pages", ("deleted_page", "date_of_delete", "name_of_page"),
+                        self.query, slice_column="date_of_delete",
+                        create_table="CREATE TABLE IF NOT EXISTS pages "
+                                     "(deleted_page TEXT, date_of_delete TEXT, name_of_page TEXT)",
+                        workers=2, chunk_size=1, connect=self.connect)
+
+    def stored(self, backfill):
+        return sorted(row[0] for row in backfill.db_conn.execute("SELECT date_of_delete FROM pages"))
+
+    def test_loads_every_month_once(self):
+        backfill = self.backfill()
+        failed = backfill.run(month_slices(datetime.date(2023, 1, 1), datetime.date(2023, 3, 31)))
+        self.assertEqual(failed, 0)
+        self.assertEqual(self.stored(backfill), self.timestamps)
+        self.assertLessEqual(len(self.connections), 2)
+        self.assertTrue(all(connection.closed for connection in self.connections))
+        backfill.close()
+
+    def test_resume_runs_only_unfinished_slices(self):
+        slices = month_slices(datetime.date(2023, 1, 1), datetime.date(2023, 3, 31))
+        self.failing.add("20230201000000")
+        backfill = self.backfill()
+        self.assertEqual(backfill.run(slices), 1)
+        self.assertEqual(self.stored(backfill), ["20230105000000", "20230131235959", "20230315120000"])
+        backfill.close()
+
+        # rows of an interrupted slice are removed before it runs again
+        backfill = self.backfill()
+        backfill.db_conn.execute("INSERT INTO pages VALUES ('page', '20230201000000', 'title')")
+        backfill.db_conn.commit()
+        self.failing.clear()
+        self.queries.clear()
+        self.assertEqual(backfill.run(slices), 0)
+        self.assertEqual(self.queries, ["20230201000000"])
+        self.assertEqual(self.stored(backfill), self.timestamps)
+        backfill.close()
+
+    def test_writer_error_stops_the_workers(self):
+        # many one row chunks, so the workers fill the bounded queue while the writer fails
+        self.timestamps[:] = [f"202301{day:02d}000000" for day in range(1, 29)] * 4
+        slices = month_slices(datetime.date(2023, 1, 1), datetime.date(2023, 6, 30))
+        errors = []
+        completed = []
+
+        def run():
+            # the SQLite connection belongs to the thread that opens it
+            backfill = Backfill("test", self.database_path, "pages",
+                                ("deleted_page", "date_of_delete", "name_of_page"), self.query,
+                                slice_column="date_of_delete",
+                                create_table="CREATE TABLE IF NOT EXISTS pages (deleted_page TEXT, date_of_delete TEXT)",
+                                workers=2, chunk_size=1, connect=self.connect)
+            try:
+                backfill.run(slices)
+            except sqlite3.Error as e:
+                errors.append(e)
+            completed.append(backfill.completed())
+            backfill.close()
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout=20)
+        self.assertFalse(thread.is_alive(), "the backfill hangs after the writer failed")
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(completed, [set()])
+        self.assertTrue(all(connection.closed for connection in self.connections))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from core.utils import save_cache
+from core.utils.save_cache import SaveCache, save_if_changed
+
+
+class TestSaveCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = SaveCache(max_age=3600, database_path=os.path.join(self.directory.name, "saves.db"))
+        self.page = MagicMock()
+        self.page.site = "wikipedia:ar"
+        self.page.title.return_value = "ويكيبيديا:تقرير"
+        self.page.latest_revision_id = 42
+
+    def tearDown(self):
+        self.cache.db_conn.close()
+        self.directory.cleanup()
+
+    def test_first_save(self):
+        self.assertTrue(save_if_changed(self.page, "text", "summary", cache=self.cache))
+        self.page.save.assert_called_once_with(summary="summary")
+        self.assertEqual(self.page.text, "text")
+
+    def test_unchanged_text_is_skipped(self):
+        save_if_changed(self.page, "text", "summary", cache=self.cache)
+        self.assertFalse(save_if_changed(self.page, "text", "summary", cache=self.cache))
+        self.assertEqual(self.page.save.call_count, 1)
+
+    def test_changed_text_is_saved(self):
+        save_if_changed(self.page, "text", "summary", cache=self.cache)
+        self.assertTrue(save_if_changed(self.page, "new text", "summary", cache=self.cache))
+        self.assertEqual(self.page.save.call_count, 2)
+
+    def test_old_entry_is_saved_again(self):
+        self.cache.record("wikipedia:ar", "ويكيبيديا:تقرير", "text", 1)
+        self.cache.db_conn.execute("UPDATE saves SET saved_at = ?", (time.time() - 7200,))
+        self.assertFalse(self.cache.is_unchanged("wikipedia:ar", "ويكيبيديا:تقرير", "text"))
+
+    def test_failed_save_is_not_recorded(self):
+        self.page.save.side_effect = RuntimeError("edit conflict")
+        with self.assertRaises(RuntimeError):
+            save_if_changed(self.page, "text", "summary", cache=self.cache)
+        self.assertFalse(self.cache.is_unchanged("wikipedia:ar", "ويكيبيديا:تقرير", "text"))
+
+
+    def test_store_is_opened_in_wal_mode(self):
+        self.assertEqual(self.cache.db_conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+
+    def test_two_stores_save_at_the_same_time(self):
+        other = SaveCache(database_path=os.path.join(self.directory.name, "saves.db"))
+        self.addCleanup(other.db_conn.close)
+        errors = []
+
+        def save(cache, number):
+            try:
+                for index in range(20):
+                    cache.record("wikipedia:ar", f"{number}/{index}", "text")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save, args=(cache, number))
+                   for number, cache in enumerate([self.cache, other, self.cache, other])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(self.cache.db_conn.execute("SELECT COUNT(*) FROM saves").fetchone()[0], 80)
+
+    def test_max_age_defaults_to_the_module_setting(self):
+        other = SaveCache(database_path=os.path.join(self.directory.name, "saves.db"))
+        self.addCleanup(other.db_conn.close)
+        self.assertEqual(other.max_age, save_cache.default_max_age)
+        self.assertEqual(self.cache.max_age, 3600)
+
+if __name__ == '__main__':
+    unittest.main()
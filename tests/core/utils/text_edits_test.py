@@ -0,0 +1,27 @@
+import unittest
+
+from core.utils.text_edits import TextEdits
+
+
+class TestTextEdits(unittest.TestCase):
+
+    def test_no_edits(self):
+        edits = TextEdits("some text")
+        self.assertEqual(edits.apply(), "some text")
+
+    def test_edits_refer_to_original_offsets(self):
+        edits = TextEdits("aaa bbb ccc")
+        edits.add(8, 11, "C")
+        edits.add(0, 3, "AAAAA")
+        self.assertEqual(len(edits), 2)
+        self.assertEqual(edits.apply(), "AAAAA bbb C")
+
+    def test_overlapping_edit_is_ignored(self):
+        edits = TextEdits("aaa bbb ccc")
+        edits.add(0, 7, "X")
+        edits.add(4, 7, "Y")
+        self.assertEqual(edits.apply(), "X ccc")
+
+
+if __name__ == '__main__':
+    unittest.main()
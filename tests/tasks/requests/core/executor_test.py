@@ -0,0 +1,61 @@
+import unittest
+from types import SimpleNamespace
+
+from tasks.requests.core.executor import RequestExecutor, RequestHandler
+
+
+class FakeHandler(RequestHandler):
+    request_type = 1
+
+    def __init__(self, site):
+        super().__init__(site)
+        self.started = []
+
+    def start_request(self, request):
+        self.started.append(request.id)
+
+
+class FakeExecutor(RequestExecutor):
+    window_size = 2
+
+    def __init__(self, requests):
+        super().__init__(None, None, [FakeHandler])
+        # requests with the titles of their pending pages
+        self.requests = requests
+
+    def pending_requests(self, handler):
+        return self.requests
+
+    def pending_pages(self, handler, request):
+        return [SimpleNamespace(title=title, namespace=0) for title in request.titles]
+
+
+def request(request_id, titles):
+    return SimpleNamespace(id=request_id, titles=titles)
+
+
+class TestWindows(unittest.TestCase):
+
+    def test_windows_are_bounded(self):
+        executor = FakeExecutor([request(1, ["a", "b", "c"]), request(2, ["A", "d"])])
+        windows = [[[item[2].title for item in group] for group in plan] for plan in executor.windows()]
+        self.assertEqual(windows, [[["a"], ["b"]], [["c"], ["A"]], [["d"]]])
+
+    def test_requests_are_started_when_reached(self):
+        executor = FakeExecutor([request(1, ["a", "b"]), request(2, ["c"])])
+        handler = executor.handlers[0]
+        windows = executor.windows()
+        next(windows)
+        self.assertEqual(handler.started, [1])
+        list(windows)
+        self.assertEqual(handler.started, [1, 2])
+
+    def test_same_page_in_one_window(self):
+        executor = FakeExecutor([request(1, ["Foo bar"]), request(2, ["foo_bar"])])
+        plans = list(executor.windows())
+        self.assertEqual(len(plans), 1)
+        self.assertEqual([[item[1].id for item in group] for group in plans[0]], [[1, 2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
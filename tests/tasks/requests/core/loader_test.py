@@ -0,0 +1,82 @@
+import unittest
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from tasks.requests.core.database.models import Base, Request, Status, Page
+from tasks.requests.core.loader import PageLoader, database_rows
+
+
+class FailingRows:
+    """Yield rows and raise after stop rows, like a replica connection that drops."""
+
+    def __init__(self, rows, stop):
+        self.rows = rows
+        self.stop = stop
+
+    def __iter__(self):
+        for number, row in enumerate(self.rows):
+            if number == self.stop:
+                raise ConnectionError("lost the replica")
+            yield row
+
+
+class TestPageLoader(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite+pysqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        self.session = Session(engine)
+        self.request = Request(from_title="a", from_namespace=14, request_type=1)
+        self.session.add(self.request)
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    def stored(self):
+        return self.session.execute(select(Page.title, Page.namespace).order_by(Page.id)).all()
+
+    def test_load_in_chunks(self):
+        rows = [(f"p{number}", 0) for number in range(5)] + [("p0", "0"), ("p0", 10)]
+        stored = PageLoader(self.session, chunk_size=2).load(self.request, rows)
+        self.assertEqual(stored, 6)
+        self.assertEqual(self.stored()[-1], ("p0", 10))
+        self.assertEqual(self.request.status, Status.RECEIVED)
+        self.assertEqual(self.request.loaded_count, 6)
+        self.assertEqual(self.request.pending_count, 6)
+
+    def test_resume_after_an_error(self):
+        rows = [(f"p{number}", 0) for number in range(5)]
+        loader = PageLoader(self.session, chunk_size=2)
+        with self.assertRaises(ConnectionError):
+            loader.load(self.request, FailingRows(rows, stop=3))
+        self.session.rollback()
+        # the first chunk is kept, the chunk in progress is lost
+        self.assertEqual(self.request.loaded_count, 2)
+        self.assertEqual(self.request.status, Status.PENDING)
+
+        self.assertEqual(loader.load(self.request, rows), 3)
+        self.assertEqual([title for title, _ in self.stored()], ["p0", "p1", "p2", "p3", "p4"])
+        self.assertEqual(self.request.pending_count, 5)
+        self.assertEqual(self.request.status, Status.RECEIVED)
+
+
+class FakeDatabase:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def stream_content_from_database(self):
+        return iter(self.rows)
+
+
+class TestDatabaseRows(unittest.TestCase):
+
+    def test_rows_are_decoded(self):
+        database = FakeDatabase([{"prt_title": "عنوان".encode("utf-8"), "prt_namespace": 14}])
+        self.assertEqual(list(database_rows(database)), [("عنوان", 14)])
+        self.assertEqual(list(database_rows(database, namespace=0)), [("عنوان", 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
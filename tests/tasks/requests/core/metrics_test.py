@@ -0,0 +1,76 @@
+import unittest
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from tasks.requests.core.database.models import Base, Request, Status, PageEvent
+from tasks.requests.core.metrics import RequestMetrics, prune_events
+
+now = datetime(2024, 1, 1, 12, 0)
+
+
+class TestRequestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite+pysqlite:///:memory:")
+        Base.metadata.create_all(engine)
+        self.session = Session(engine)
+
+    def tearDown(self):
+        self.session.close()
+
+    def add_events(self, request_type, minutes_ago, count, failed=False, save_seconds=0):
+        for _ in range(count):
+            self.session.add(PageEvent(request_id=1, request_type=request_type, failed=failed,
+                                       save_seconds=save_seconds,
+                                       create_date=now - timedelta(minutes=minutes_ago)))
+        self.session.commit()
+
+    def add_request(self, request_type, status=Status.RECEIVED, pending=0):
+        request = Request(from_title="a", from_namespace=14, request_type=request_type,
+                          status=status, pending_count=pending)
+        self.session.add(request)
+        self.session.commit()
+        return request
+
+    def test_rate_counts_only_the_window(self):
+        self.add_events(1, 10, 30, save_seconds=2)
+        self.add_events(1, 20, 6, failed=True)
+        self.add_events(1, 200, 50)
+        stats = RequestMetrics(self.session, window_minutes=60, now=now).type_stats()
+        self.assertEqual(stats[1]["pages"], 30)
+        self.assertEqual(stats[1]["failed"], 6)
+        self.assertEqual(stats[1]["rate"], 0.5)
+        self.assertEqual(stats[1]["save_seconds"], 2)
+
+    def test_requests_of_a_type_queue_behind_each_other(self):
+        self.add_events(1, 10, 60)
+        self.add_request(1, pending=30)
+        self.add_request(1, pending=60)
+        self.add_request(2, pending=10)
+        self.add_request(1, status=Status.PENDING)
+        rows = RequestMetrics(self.session, window_minutes=60, now=now).rows()
+        etas = [(row["type"], row["loading"], row["eta"]) for row in rows]
+        self.assertEqual(etas, [
+            (1, False, now + timedelta(minutes=30)),
+            (1, False, now + timedelta(minutes=90)),
+            (1, True, None),
+            # no pages of this type were done in the window
+            (2, False, None),
+        ])
+
+    def test_eta_of_nothing_pending_is_now(self):
+        metrics = RequestMetrics(self.session, now=now)
+        self.assertEqual(metrics.eta(0, 0), now)
+        self.assertIsNone(metrics.eta(5, 0))
+
+    def test_prune_events(self):
+        self.add_events(1, 60, 3)
+        self.add_events(1, 8 * 24 * 60, 4)
+        self.assertEqual(prune_events(self.session, keep_days=7, now=now), 4)
+        self.assertEqual(len(self.session.scalars(select(PageEvent)).all()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from tasks.requests.core.database import migrate
+
+
+class TestMigrate(unittest.TestCase):
+
+    def test_counters_are_added_and_filled(self):
+        engine = create_engine("sqlite+pysqlite:///:memory:", poolclass=StaticPool)
+        with engine.begin() as connection:
+            # the tables as they were before the page counters
+            connection.execute(text("CREATE TABLE requests (id INTEGER PRIMARY KEY, from_title VARCHAR(255), "
+                                    "to_title VARCHAR(255), from_namespace INTEGER, to_namespace INTEGER, "
+                                    "request_type INTEGER, extra TEXT, status VARCHAR(9), create_date DATETIME, "
+                                    "update_date DATETIME)"))
+            connection.execute(text("CREATE TABLE pages (id INTEGER PRIMARY KEY, title VARCHAR(255), "
+                                    "namespace INTEGER, status VARCHAR(9), create_date DATETIME, "
+                                    "update_date DATETIME, extra TEXT, request_id INTEGER)"))
+            connection.execute(text("INSERT INTO requests (id, request_type, status) VALUES (1, 1, 'RECEIVED')"))
+            connection.execute(text("INSERT INTO pages (title, namespace, status, request_id) VALUES "
+                                    "('a', 0, 'PENDING', 1), ('b', 0, 'PENDING', 1), ('c', 0, 'COMPLETED', 1)"))
+
+        with patch.object(migrate, "engine", engine):
+            self.assertEqual(migrate.main(), 0)
+            # a second run has nothing left to do
+            self.assertEqual(migrate.main(), 0)
+
+        with engine.connect() as connection:
+            counts = connection.execute(text("SELECT pending_count, completed_count, failed_count "
+                                             "FROM requests")).one()
+        self.assertEqual(tuple(counts), (2, 1, 0))
+        indexes = {index["name"] for index in inspect(engine).get_indexes("pages")}
+        self.assertIn("ix_pages_request_status_namespace", indexes)
+
+
+if __name__ == '__main__':
+    unittest.main()
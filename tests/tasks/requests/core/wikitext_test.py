@@ -0,0 +1,56 @@
+import unittest
+
+from tasks.requests.core.wikitext import WikitextEditor
+from tasks.requests.remove.bot.remove_portal import RemovePortal
+
+
+class TestWikitextEditor(unittest.TestCase):
+
+    def test_templates_match_normalized_names(self):
+        editor = WikitextEditor("{{بذرة  علوم}} {{ بذرة علوم|x}} {{بذرة}} {{Stub}}")
+        names = [template.name for template in editor.templates(["بذرة علوم", "stub"])]
+        self.assertEqual(names, ["بذرة  علوم", " بذرة علوم", "Stub"])
+
+    def test_remove_and_rename(self):
+        text = "{{قديم|1}} نص {{قديم}} {{آخر}}"
+        editor = WikitextEditor(text)
+        first, second = editor.templates(["قديم"])
+        editor.remove(first)
+        editor.rename(second, "جديد")
+        self.assertEqual(editor.apply(), " نص {{جديد}} {{آخر}}")
+        # the original text is not changed
+        self.assertEqual(editor.text, text)
+
+    def test_category_links(self):
+        editor = WikitextEditor("[[تصنيف:قرى مصر|ق]] [[تصنيف:قرى_مصر]] [[تصنيف:مدن مصر]] [[قرى مصر]]")
+        for link in editor.category_links("قرى مصر"):
+            editor.remove(link)
+        self.assertEqual(editor.apply(), "  [[تصنيف:مدن مصر]] [[قرى مصر]]")
+
+    def test_nothing_to_apply(self):
+        text = "{{a}} [[b]]"
+        self.assertEqual(WikitextEditor(text).apply(), text)
+
+
+class TestRemovePortal(unittest.TestCase):
+
+    def remove(self, text, portal):
+        remover = RemovePortal(text, portal)
+        remover.start_remove()
+        return remover.tem_text
+
+    def test_portal_argument_is_removed_from_every_alias(self):
+        text = "{{شريط بوابات|مصر|علوم}}\n{{Portal bar|علوم}}\n{{صندوق بوابات|مصر}}"
+        self.assertEqual(self.remove(text, "علوم"), "{{شريط بوابات|مصر}}\n{{Portal bar}}\n{{صندوق بوابات|مصر}}")
+
+    def test_other_templates_keep_the_argument(self):
+        text = "{{معلومات|علوم}} {{بوابة| علوم }}"
+        self.assertEqual(self.remove(text, "علوم"), "{{معلومات|علوم}} {{بوابة}}")
+
+    def test_text_without_the_portal_is_unchanged(self):
+        text = "{{بوابة|مصر}}"
+        self.assertEqual(self.remove(text, "علوم"), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
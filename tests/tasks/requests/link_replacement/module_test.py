@@ -0,0 +1,82 @@
+import unittest
+from types import SimpleNamespace
+
+from tasks.requests.link_replacement.module import LinkRewriter, normalize_title, pipe_trick, title_pattern
+from tasks.requests.link_replacement.run import LinkReplacementHandler
+
+
+class TestTitlePattern(unittest.TestCase):
+
+    def test_spellings_of_one_title(self):
+        pattern = title_pattern("foo bar_baz")
+        for spelling in ("Foo bar baz", "foo_bar_baz", "Foo__bar baz"):
+            self.assertRegex(spelling, "^" + pattern + "$")
+        self.assertNotRegex("Foo barbaz", "^" + pattern + "$")
+
+    def test_normalize_title(self):
+        self.assertEqual(normalize_title(" foo__bar "), "Foo bar")
+
+
+class TestLinkRewriter(unittest.TestCase):
+
+    def rewrite(self, text, aliases=None):
+        return LinkRewriter([("Foo bar", "Qux")], aliases=aliases).rewrite(text)
+
+    def test_first_letter_and_underscores(self):
+        self.assertEqual(self.rewrite("[[foo_bar]]"), ("[[Qux|foo bar]]", {"Foo bar"}))
+
+    def test_anchor_is_kept(self):
+        self.assertEqual(self.rewrite("[[Foo bar#History]]")[0], "[[Qux#History|Foo bar#History]]")
+        self.assertEqual(self.rewrite("[[Foo bar#History|see]]")[0], "[[Qux#History|see]]")
+
+    def test_piped_link_keeps_its_label(self):
+        self.assertEqual(self.rewrite("[[Foo bar|the foo]]")[0], "[[Qux|the foo]]")
+
+    def test_pipe_trick_keeps_the_shown_text(self):
+        self.assertEqual(self.rewrite("[[Foo bar|]]")[0], "[[Qux|Foo bar]]")
+        rewriter = LinkRewriter([("Paris (Texas)", "Paris, Texas")])
+        self.assertEqual(rewriter.rewrite("[[Paris (Texas)|]]")[0], "[[Paris, Texas|Paris]]")
+
+    def test_colon_link(self):
+        self.assertEqual(self.rewrite("[[:Foo bar]]")[0], "[[:Qux|Foo bar]]")
+
+    def test_other_links_are_untouched(self):
+        text = "[[Foo barbaz]] [[Foo]] [[Other|Foo bar]]"
+        self.assertEqual(self.rewrite(text), (text, set()))
+
+    def test_redirects_to_the_source(self):
+        text, replaced = self.rewrite("[[Fb]] [[fb|x]]", aliases={"Foo bar": ["Fb", "Qux"]})
+        self.assertEqual(text, "[[Qux|Fb]] [[Qux|x]]")
+        self.assertEqual(replaced, {"Foo bar"})
+        # the destination is never rewritten to itself
+        self.assertEqual(self.rewrite("[[Qux]]", aliases={"Foo bar": ["Qux"]})[0], "[[Qux]]")
+
+    def test_several_requests_in_one_pass(self):
+        rewriter = LinkRewriter([("A", "B"), ("C d", "E")])
+        self.assertEqual(rewriter.rewrite("[[a]] [[C_d|x]]"), ("[[B|a]] [[E|x]]", {"A", "C d"}))
+
+
+class TestPipeTrick(unittest.TestCase):
+
+    def test_pipe_trick(self):
+        self.assertEqual(pipe_trick("Help:Foo (bar)"), "Foo")
+        self.assertEqual(pipe_trick("Paris, Texas"), "Paris")
+        self.assertEqual(pipe_trick("تصنيف:قرى_مصر"), "قرى مصر")
+
+
+
+class TestRewriterCache(unittest.TestCase):
+
+    def test_cache_is_bounded(self):
+        handler = LinkReplacementHandler(site=None)
+        handler.rewriter_cache_size = 2
+        requests = [SimpleNamespace(id=number, from_name=f"Foo {number}", to_name="Qux") for number in range(3)]
+        first = handler.rewriter([requests[0]])
+        handler.rewriter([requests[1]])
+        # a hit makes the entry the most recently used
+        self.assertIs(handler.rewriter([requests[0]]), first)
+        handler.rewriter([requests[2]])
+        self.assertEqual(list(handler.rewriters), [(0,), (2,)])
+
+if __name__ == '__main__':
+    unittest.main()
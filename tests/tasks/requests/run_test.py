@@ -0,0 +1,41 @@
+import unittest
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from tasks.requests import run
+from tasks.requests.core.database.models import Base, PageEvent
+from tasks.requests.core.metrics import utc_now
+
+
+class TestMain(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite+pysqlite:///:memory:", poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            for days in (0, 8, 30):
+                session.add(PageEvent(request_id=1, request_type=1, create_date=utc_now() - timedelta(days=days)))
+            session.commit()
+
+    def run_main(self, publish_status):
+        executor = MagicMock()
+        executor.return_value.run.return_value = 0
+        with patch.object(run, "engine", self.engine), patch.object(run, "RequestExecutor", executor), \
+                patch.object(run, "publish_status", publish_status), patch.object(run.pywikibot, "Site"):
+            self.assertEqual(run.main(), 0)
+        with Session(self.engine) as session:
+            return len(session.scalars(select(PageEvent)).all())
+
+    def test_run_prunes_old_events(self):
+        self.assertEqual(self.run_main(MagicMock()), 1)
+
+    def test_events_are_pruned_when_publishing_fails(self):
+        self.assertEqual(self.run_main(MagicMock(side_effect=RuntimeError("no wiki"))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from tasks.requests.template_distribution.models import WikiLinkExtractor, resolve_titles
+
+
+class FakeApi:
+    """Answers title queries from a map of title -> (namespace, target title or None)."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.queries = []
+
+    def request(self, site, **params):
+        titles = params["titles"].split("|")
+        self.queries.append(titles)
+        pages = []
+        for title in titles:
+            if title not in self.pages:
+                pages.append({"title": title, "missing": True})
+                continue
+            namespace, target = self.pages[title]
+            pages.append({"title": target or title, "ns": namespace})
+        return SimpleNamespace(submit=lambda: {"query": {"pages": pages}})
+
+
+def page(site, title):
+    return SimpleNamespace(title=lambda with_ns=True: title)
+
+
+class TestResolveTitles(unittest.TestCase):
+
+    def resolve(self, pages, titles, **kwargs):
+        api = FakeApi(pages)
+        with patch("pywikibot.data.api.Request", api.request), \
+                patch("tasks.requests.template_distribution.models.pywikibot.Page", page):
+            return list(resolve_titles(None, titles, **kwargs)), api.queries
+
+    def test_titles_are_queried_in_batches(self):
+        pages = {f"t{number}": (0, None) for number in range(5)}
+        titles, queries = self.resolve(pages, [f"t{number}" for number in range(5)], batch_size=2)
+        self.assertEqual(titles, ["t0", "t1", "t2", "t3", "t4"])
+        self.assertEqual(queries, [["t0", "t1"], ["t2", "t3"], ["t4"]])
+
+    def test_every_page_is_yielded_once(self):
+        pages = {"a": (0, None), "redirect": (0, "a"), "b": (0, None)}
+        titles, queries = self.resolve(pages, ["a", " a ", "redirect", "b", "a"], batch_size=2)
+        self.assertEqual(titles, ["a", "b"])
+        self.assertEqual(queries, [["a", "redirect"], ["b", "a"]])
+
+    def test_missing_pages_and_other_namespaces_are_skipped(self):
+        pages = {"a": (0, None), "user": (2, None)}
+        titles, _ = self.resolve(pages, ["a", "user", "missing", ""])
+        self.assertEqual(titles, ["a"])
+
+
+class TestWikiLinkExtractor(unittest.TestCase):
+
+    def test_category_links_are_skipped(self):
+        text = "[[a|label]] [[تصنيف:b]] [[Category:c]] [[d]]"
+        self.assertEqual(WikiLinkExtractor(text).extract_links(), ["a", "d"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from tasks.requests.add_category.run import AddCategoryHandler
+from tasks.requests.portal_distribution.run import has_portal
+from tasks.requests.template_distribution.run import TemplateDistributionHandler
+
+
+def fake_page(title="مقالة", namespace=0):
+    page = MagicMock()
+    page.title.return_value = title
+    page.namespace.return_value = namespace
+    # transforms must not read the page state from the API
+    page.templates.side_effect = AssertionError("templates read from the API")
+    page.categories.side_effect = AssertionError("categories read from the API")
+    return page
+
+
+class TestTemplateDistribution(unittest.TestCase):
+
+    def test_second_request_sees_the_template_added_in_memory(self):
+        handler = TemplateDistributionHandler(site=None)
+        request = SimpleNamespace(id=1, from_title="بذرة علوم", extra=None)
+        p = fake_page()
+        text, changed = handler.transform_batch([request, request], p, "نص\n[[تصنيف:علوم]]")
+        self.assertEqual(text.count("{{بذرة علوم}}"), 1)
+        self.assertEqual(changed, [request])
+
+    def test_template_used_through_a_redirect_is_not_added(self):
+        handler = TemplateDistributionHandler(site=None)
+        template = MagicMock()
+        redirect = MagicMock()
+        redirect.title.side_effect = lambda with_ns=True: "قالب:بذرة علم" if with_ns else "بذرة علم"
+        template.backlinks.return_value = [redirect]
+        request = SimpleNamespace(id=1, from_title="بذرة علوم", extra=None)
+        with patch("tasks.requests.template_distribution.run.pywikibot.Page", return_value=template):
+            handler.start_request(request)
+        template.backlinks.assert_called_once_with(filter_redirects=True, namespaces=[10])
+        text = "نص\n{{بذرة_علم}}\n[[تصنيف:علوم]]"
+        self.assertEqual(handler.transform(request, fake_page(), text), text)
+        self.assertIn("{{بذرة علوم}}", handler.transform(request, fake_page(), "نص"))
+
+
+class TestAddCategory(unittest.TestCase):
+
+    def handler(self, members):
+        handler = AddCategoryHandler(site=None)
+        category = MagicMock()
+        category.title.side_effect = lambda with_ns=True: "تصنيف:قرى مصر" if with_ns else "قرى مصر"
+        handler.categories = {1: category, 2: category}
+        handler.members = {1: members, 2: members}
+        return handler
+
+    def test_link_in_text_is_not_added_again(self):
+        handler = self.handler(members=None)
+        first, second = SimpleNamespace(id=1), SimpleNamespace(id=2)
+        text, changed = handler.transform_batch([first, second], fake_page(), "نص")
+        self.assertEqual(text, "نص\n[[تصنيف:قرى مصر]]")
+        self.assertEqual(changed, [first])
+
+    def test_members_of_the_replica_are_skipped(self):
+        handler = self.handler(members={(0, "مقالة")})
+        self.assertEqual(handler.transform(SimpleNamespace(id=1), fake_page(), "نص"), "نص")
+
+    def test_members_are_matched_in_their_namespace(self):
+        handler = self.handler(members={(10, "مقالة")})
+        self.assertEqual(handler.transform(SimpleNamespace(id=1), fake_page(namespace=10), "نص"), "نص")
+        self.assertEqual(handler.transform(SimpleNamespace(id=1), fake_page(), "نص"), "نص\n[[تصنيف:قرى مصر]]")
+
+    def test_load_members(self):
+        category = MagicMock()
+        category.pageid = 7
+        database = MagicMock()
+        database.return_value.stream_content_from_database.return_value = [
+            {"prt_title": "قالب_مصر".encode("utf-8"), "prt_namespace": 10},
+            {"prt_title": "قرية".encode("utf-8"), "prt_namespace": 0},
+        ]
+        with patch("tasks.requests.add_category.run.Database", database):
+            members = AddCategoryHandler(site=None).load_members(category)
+        self.assertEqual(members, {(10, "قالب مصر"), (0, "قرية")})
+        self.assertNotIn("page_namespace = 0", database.return_value.query)
+
+
+class TestHasPortal(unittest.TestCase):
+
+    def test_portal_bar_argument(self):
+        self.assertTrue(has_portal("نص\n{{شريط بوابات|مصر|علوم}}", "علوم"))
+
+    def test_portal_link(self):
+        self.assertTrue(has_portal("[[بوابة:علوم|العلوم]]", "علوم"))
+
+    def test_other_portal(self):
+        self.assertFalse(has_portal("{{شريط بوابات|مصر}}", "علوم"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import re
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from tasks.statistics.counters import Counter, CounterStore
+
+counter = Counter("test", "LAST", "DELTA {start} {end}")
+
+
+class FakeReplica:
+    """Rows of (id, key), answering the last id and delta queries of counter."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def fetch(self, query):
+        self.queries.append(query)
+        if query == "LAST":
+            return [{"last_id": max((row_id for row_id, _ in self.rows), default=None)}]
+        start, end = map(int, re.findall(r"\d+", query))
+        counts = {}
+        for row_id, key in self.rows:
+            if start < row_id <= end:
+                counts[key] = counts.get(key, 0) + 1
+        return [{"key": key, "value": value} for key, value in counts.items()]
+
+
+class TestCounterStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = CounterStore(os.path.join(self.directory.name, "counters.db"))
+        self.replica = FakeReplica([(1, 10), (2, 10), (3, 20), (4, 10), (5, 30)])
+        patcher = patch("tasks.statistics.counters.fetch", self.replica.fetch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_advance_in_slices(self):
+        self.store.advance(counter, slice_size=2)
+        self.assertEqual(self.store.watermark(counter), 5)
+        self.assertEqual(self.store.top(counter, 10), [(10, 3), (20, 1), (30, 1)])
+        self.assertEqual(self.replica.queries, ["LAST", "DELTA 0 2", "DELTA 2 4", "DELTA 4 5"])
+
+    def test_advance_counts_only_new_rows(self):
+        self.store.advance(counter)
+        self.replica.rows += [(6, 20), (7, 20)]
+        self.replica.queries.clear()
+        self.store.advance(counter)
+        self.assertEqual(self.replica.queries, ["LAST", "DELTA 5 7"])
+        self.assertEqual(self.store.top(counter, 2), [(10, 3), (20, 3)])
+        self.assertEqual(self.store.top(counter, 2, offset=2), [(30, 1)])
+
+    def test_ranked_skips_dropped_keys(self):
+        self.store.advance(counter)
+        rows = self.store.ranked(counter, lambda batch: [{"key": key, "value": value}
+                                                         for key, value in batch if key != 20],
+                                 limit=2, batch_size=1)
+        self.assertEqual(rows, [{"key": 10, "value": 3}, {"key": 30, "value": 1}])
+
+    def test_rebuild_finds_rows_below_the_watermark(self):
+        self.store.advance(counter)
+        # an undeleted revision gets its old id back
+        self.replica.rows.append((2, 30))
+        self.store.advance(counter)
+        self.assertEqual(self.store.top(counter, 10)[-1], (30, 1))
+        self.store.rebuild(counter)
+        self.assertEqual(self.store.top(counter, 10), [(10, 3), (30, 2), (20, 1)])
+        self.assertEqual(self.store.watermark(counter), 5)
+        # the staging counter is gone
+        self.assertEqual(self.store.db_conn.execute("SELECT COUNT(DISTINCT counter) FROM counters").fetchone()[0], 1)
+
+    def test_refresh_rebuilds_when_due(self):
+        self.store.advance(counter)
+        # a store filled before rebuilds were recorded is not rebuilt at once
+        with patch.object(self.store, "rebuild") as rebuild:
+            self.store.refresh(counter, rebuild_days=30)
+            rebuild.assert_not_called()
+        self.assertIsNotNone(self.store.rebuilt_at(counter))
+        with patch("tasks.statistics.counters.time.time", return_value=time.time() + 31 * 86400), \
+                patch.object(self.store, "rebuild") as rebuild:
+            self.store.refresh(counter, rebuild_days=30)
+            rebuild.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import sqlite3
+import unittest
+
+from tasks.statistics.group_activity import Metric, Source, group_activity_query, log_metric, log_source, sql_string
+
+
+class TestSql(unittest.TestCase):
+
+    def test_sql_string_escapes_quotes_and_backslashes(self):
+        self.assertEqual(sql_string("it's"), r"'it\'s'")
+        self.assertEqual(sql_string("a\\b"), r"'a\\b'")
+
+    def test_log_metric_condition(self):
+        metric = log_metric("blocks", "block", actions=["block", "reblock"], exclude_actions=["unblock"],
+                            params_like=["%a%"], params_not_like=["%b%"])
+        self.assertEqual(metric.condition,
+                         "log_type = 'block' AND log_action IN ('block', 'reblock') AND log_action NOT IN "
+                         "('unblock') AND log_params LIKE '%a%' AND log_params NOT LIKE '%b%'")
+        self.assertEqual(metric.log_type, "block")
+
+    def test_log_source_reads_only_the_log_types_of_its_metrics(self):
+        source = log_source([log_metric("b", "block"), log_metric("d", "delete"), log_metric("r", "block")])
+        self.assertEqual(source.where, "log_type IN ('block', 'delete')")
+
+    def test_one_pass_per_source(self):
+        query = group_activity_query("sysop", [log_source([log_metric("b", "block"), log_metric("d", "delete")])],
+                                     excluded_users=["Bot"])
+        self.assertEqual(query.count("FROM logging"), 1)
+        self.assertEqual(query.count("GROUP BY actor_user"), 1)
+        self.assertIn("user_name NOT IN ('Bot')", query)
+
+
+class TestQueryResult(unittest.TestCase):
+    """Run the generated query on a small copy of the replica tables."""
+
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.executescript("""
+            CREATE TABLE user (user_id INTEGER, user_name TEXT);
+            CREATE TABLE user_groups (ug_user INTEGER, ug_group TEXT);
+            CREATE TABLE actor (actor_id INTEGER, actor_user INTEGER);
+            CREATE TABLE logging (log_actor INTEGER, log_type TEXT, log_action TEXT, log_params TEXT);
+            CREATE TABLE revision (rev_actor INTEGER, rev_page INTEGER);
+            INSERT INTO user VALUES (1, 'A'), (2, 'B'), (3, 'C'), (4, 'Bot');
+            INSERT INTO user_groups VALUES (1, 'sysop'), (2, 'sysop'), (3, 'bureaucrat'), (4, 'sysop');
+            INSERT INTO actor VALUES (11, 1), (12, 2), (13, 3), (14, 4);
+            INSERT INTO logging VALUES
+                (11, 'block', 'block', ''), (11, 'block', 'unblock', ''), (11, 'delete', 'delete', ''),
+                (13, 'block', 'block', ''), (14, 'block', 'block', '');
+            INSERT INTO revision VALUES (12, 1), (12, 2), (13, 3);
+        """)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_counts_per_member(self):
+        sources = [
+            log_source([log_metric("blocks", "block", actions=["block"]), log_metric("deletions", "delete")]),
+            Source("revision", "rev_actor", [Metric("edits", "rev_page > 0")]),
+        ]
+        query = group_activity_query("sysop", sources, excluded_users=["Bot"])
+        rows = self.connection.execute(query).fetchall()
+        # members without rows get 0, users of other groups are left out
+        self.assertEqual(rows, [("A", 1, 1, 0), ("B", 0, 0, 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from tasks.statistics.journal import RunJournal, summary_table
+
+
+class TestRunJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "journal.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def journal(self, **kwargs):
+        return RunJournal(path=self.path, **kwargs)
+
+    def lines(self):
+        with open(self.path, encoding="utf-8") as file:
+            return [json.loads(line) for line in file]
+
+    def test_median_of_previous_runs(self):
+        journal = self.journal(window=3)
+        self.assertIsNone(journal.median("report"))
+        for seconds in (100, 1, 2, 3):
+            journal.record({"report": "report", "query_seconds": seconds})
+        journal.record({"report": "report", "query_seconds": None})
+        journal.record({"report": "other", "query_seconds": 50})
+        # only the last window runs with a query time count
+        self.assertEqual(self.journal(window=3).median("report"), 2.5)
+
+    def test_regression(self):
+        journal = self.journal(regression_threshold=2, min_seconds=5)
+        for seconds in (10, 12, 11):
+            journal.record({"report": "report", "query_seconds": seconds})
+        self.assertIsNone(journal.regression({"report": "report", "query_seconds": 21}))
+        self.assertIn("3.0 times its median of 11.0s",
+                      journal.regression({"report": "report", "query_seconds": 33}))
+        self.assertIsNone(journal.regression({"report": "new", "query_seconds": 1000}))
+
+    def test_small_slowdowns_are_not_regressions(self):
+        journal = self.journal(regression_threshold=2, min_seconds=5)
+        journal.record({"report": "report", "query_seconds": 1})
+        self.assertIsNone(journal.regression({"report": "report", "query_seconds": 4}))
+
+    def test_no_threshold(self):
+        journal = self.journal()
+        journal.record({"report": "report", "query_seconds": 1})
+        self.assertIsNone(journal.regression({"report": "report", "query_seconds": 1000}))
+
+    def test_file_is_trimmed_to_window(self):
+        journal = self.journal(window=2)
+        for seconds in range(5):
+            journal.record({"report": "a", "query_seconds": seconds})
+            journal.record({"report": "b", "query_seconds": seconds})
+        self.assertEqual(len(self.lines()), 10)
+        # the next process reading the journal trims it
+        self.journal(window=2).median("a")
+        self.assertEqual([(entry["report"], entry["query_seconds"]) for entry in self.lines()],
+                         [("a", 3), ("b", 3), ("a", 4), ("b", 4)])
+
+    def test_plan_is_stored_when_it_changes(self):
+        journal = self.journal(regression_threshold=2, min_seconds=0)
+        for seconds, plan in ((1, "scan"), (1, "scan"), (1, "index"), (1, "index"), (10, "index")):
+            journal.record({"report": "report", "query_seconds": seconds, "plan": plan})
+        self.assertEqual([entry.get("plan") for entry in self.lines()], ["scan", None, "index", None, "index"])
+        # a new process knows the last stored plan
+        self.journal().record({"report": "report", "query_seconds": 1, "plan": "index"})
+        self.assertNotIn("plan", self.lines()[-1])
+
+    def test_entries_take_the_current_report(self):
+        journal = self.journal()
+
+        def run():
+            journal.set_current_report("wiki_maintenance.category")
+            journal.record({"query_seconds": 1})
+            journal.set_current_report(None)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        self.assertIsNone(journal.current_report())
+        self.assertEqual(self.lines()[0]["report"], "wiki_maintenance.category")
+
+
+class TestSummaryTable(unittest.TestCase):
+
+    def test_slowest_first(self):
+        table = summary_table([
+            {"report": "fast", "query_seconds": 1.04, "rows": 3, "render_seconds": 0.01, "save_seconds": 2},
+            {"report": "failed", "error": "timeout"},
+            {"report": "slow", "query_seconds": 30, "rows": 0, "regression": "slow: ..."},
+        ]).splitlines()
+        self.assertEqual([line.split()[0] for line in table], ["report", "slow", "fast", "failed"])
+        self.assertTrue(table[1].endswith("REGRESSION"))
+        self.assertEqual(table[2].split()[1:], ["1.0", "3", "0.0", "2.0"])
+        self.assertEqual(table[3].split()[1:], ["-", "-", "-", "-", "ERROR:", "timeout"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+from tasks.statistics.module import QueryCache, normalize_sql
+
+
+class FakeDatabase:
+
+    def __init__(self, query, replica="arwiki_p", rows=None, delay=0):
+        self.query = query
+        self.replica = replica
+        self.rows = rows if rows is not None else [{"page_title": "a"}]
+        self.delay = delay
+        self.runs = 0
+        self.result = None
+
+    def get_content_from_database(self):
+        self.runs += 1
+        time.sleep(self.delay)
+        self.result = self.rows
+
+
+class TestNormalizeSql(unittest.TestCase):
+
+    def test_whitespace_and_semicolon(self):
+        self.assertEqual(normalize_sql("  SELECT  a,\n\tb\nFROM t ;\n"), "SELECT a, b FROM t")
+
+    def test_quoted_text_is_kept(self):
+        self.assertEqual(normalize_sql("SELECT 'a  b', \"c\\\"  d\"  FROM t"), "SELECT 'a  b', \"c\\\"  d\" FROM t")
+        self.assertEqual(normalize_sql("SELECT '-- x' FROM t"), "SELECT '-- x' FROM t")
+
+    def test_comments_are_removed(self):
+        self.assertEqual(normalize_sql("SELECT a -- first\nFROM t # second\nWHERE /* third */ b"),
+                         "SELECT a FROM t WHERE b")
+
+    def test_line_after_a_comment_is_not_merged_into_it(self):
+        # different queries: the second one has no FROM
+        self.assertNotEqual(normalize_sql("SELECT a -- comment\nFROM t"), normalize_sql("SELECT a -- comment FROM t"))
+
+    def test_hints_are_kept(self):
+        self.assertEqual(normalize_sql("SELECT /*+ MAX_EXECUTION_TIME(1000) */ a"),
+                         "SELECT /*+ MAX_EXECUTION_TIME(1000) */ a")
+
+
+class TestQueryCache(unittest.TestCase):
+
+    def test_same_query_runs_once(self):
+        cache = QueryCache()
+        first = FakeDatabase("SELECT a FROM t")
+        second = FakeDatabase("SELECT a\nFROM t;")
+        self.assertEqual(cache.rows(first), ([{"page_title": "a"}], False))
+        self.assertEqual(cache.rows(second), ([{"page_title": "a"}], True))
+        self.assertEqual((first.runs, second.runs), (1, 0))
+
+    def test_replica_is_part_of_the_key(self):
+        cache = QueryCache()
+        cache.rows(FakeDatabase("SELECT a FROM t"))
+        other = FakeDatabase("SELECT a FROM t", replica="wikidatawiki_p")
+        self.assertFalse(cache.rows(other)[1])
+        self.assertEqual(other.runs, 1)
+
+    def test_waits_for_the_query_in_flight(self):
+        cache = QueryCache()
+        databases = [FakeDatabase("SELECT a FROM t", delay=0.2) for _ in range(3)]
+        results = []
+        threads = [threading.Thread(target=lambda database=database: results.append(cache.rows(database)))
+                   for database in databases]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum(database.runs for database in databases), 1)
+        self.assertEqual(sorted(cached for _, cached in results), [False, True, True])
+
+    def test_every_caller_gets_its_own_rows(self):
+        cache = QueryCache()
+        rows, _ = cache.rows(FakeDatabase("SELECT a FROM t"))
+        rows[0]["page_title"] = "changed"
+        rows.append({"page_title": "b"})
+        self.assertEqual(cache.rows(FakeDatabase("SELECT a FROM t"))[0], [{"page_title": "a"}])
+
+    def test_clear(self):
+        cache = QueryCache()
+        cache.rows(FakeDatabase("SELECT a FROM t"))
+        cache.clear()
+        database = FakeDatabase("SELECT a FROM t")
+        self.assertFalse(cache.rows(database)[1])
+        self.assertEqual(database.runs, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import json
+import os
+import tempfile
+import unittest
+
+from tasks.statistics.module import ArticleTables
+from tasks.statistics.registry import RegistryError, load_registry
+
+
+def entry(**changes):
+    report = {
+        "name": "test_report",
+        "query": "sql/bot_wars.sql",
+        "stub": "stub/bot_wars.txt",
+        "page": "ويكيبيديا:تقارير قاعدة البيانات/اختبار",
+        "columns": [{"title": "الرقم", "format": "index"}, {"title": "الاسم", "field": "page_title"}],
+    }
+    report.update(changes)
+    return report
+
+
+def cells(spec, row):
+    tables = ArticleTables()
+    tables.add_table("main_table", spec.columns)
+    return [str(formatter(row, [row], 0)) for formatter in tables.tables[0].formatters()]
+
+
+class TestLoadRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "reports.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self, entries):
+        with open(self.path, "w", encoding="utf-8") as file:
+            if isinstance(entries, str):
+                file.write(entries)
+            else:
+                json.dump(entries, file, ensure_ascii=False)
+        return load_registry(self.path)
+
+    def assertInvalid(self, entries, message):
+        with self.assertRaisesRegex(RegistryError, message):
+            self.load(entries)
+
+    def test_shipped_registry_is_valid(self):
+        specs = load_registry()
+        self.assertEqual(len(specs), 22)
+        for spec in specs.values():
+            self.assertTrue(spec.query.strip())
+            self.assertIn(spec.schedule, ("daily", "weekly", "manual"))
+
+    def test_valid_entry(self):
+        spec = self.load([entry()])["test_report"]
+        self.assertEqual(spec.schedule, "daily")
+        self.assertEqual(spec.replica, "arwiki")
+        self.assertEqual(spec.columns[1], ("الاسم", "page_title"))
+
+    def test_invalid_json(self):
+        self.assertInvalid("[{", "reports.json")
+
+    def test_not_a_list(self):
+        self.assertInvalid({"name": "x"}, "must be a list")
+
+    def test_report_not_an_object(self):
+        self.assertInvalid(["x"], "must be an object")
+
+    def test_missing_name(self):
+        self.assertInvalid([entry(name="")], "needs a name")
+
+    def test_missing_key(self):
+        report = entry()
+        del report["page"]
+        self.assertInvalid([report], "test_report: page is missing")
+
+    def test_unknown_key(self):
+        self.assertInvalid([entry(limit=10)], "unknown keys limit")
+
+    def test_unknown_schedule(self):
+        self.assertInvalid([entry(schedule="hourly")], "schedule must be one of")
+
+    def test_invalid_replica(self):
+        self.assertInvalid([entry(replica="arwiki; drop")], "is not a replica database name")
+
+    def test_missing_file(self):
+        self.assertInvalid([entry(query="sql/missing.sql")], "the query file sql/missing.sql does not exist")
+
+    def test_empty_columns(self):
+        self.assertInvalid([entry(columns=[])], "columns must be a non empty list")
+
+    def test_column_without_title(self):
+        self.assertInvalid([entry(columns=[{"field": "page_title"}])], "column 1 needs a title")
+
+    def test_column_without_field_or_format(self):
+        self.assertInvalid([entry(columns=[{"title": "x", "pattern": "y"}])], "needs either a field or a format")
+
+    def test_unknown_format(self):
+        self.assertInvalid([entry(columns=[{"title": "x", "format": "bold"}])], "unknown format bold")
+
+    def test_wrong_format_arguments(self):
+        self.assertInvalid([entry(columns=[{"title": "x", "format": "number"}])], "column x:")
+
+    def test_invalid_text_pattern(self):
+        for pattern in ("[[%(page_title]]", "[[%s]]", "%(page_len)q"):
+            self.assertInvalid([entry(columns=[{"title": "x", "format": "text", "pattern": pattern}])],
+                               "column x: the pattern")
+
+    def test_duplicate_name(self):
+        self.assertInvalid([entry(), entry()], "test_report: the name is used twice")
+
+
+class TestMigratedReports(unittest.TestCase):
+    """The rows of reports moved to the registry, as their removed modules rendered them."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.specs = load_registry()
+
+    def test_articles_by_size(self):
+        row = {"page_namespace": 0, "page_title": "مصر", "page_len": 250000}
+        self.assertEqual(cells(self.specs["Articles_by_size"], row),
+                         ["1", "[[{{ns:0}}:مصر]]", "0", "250000"])
+
+    def test_inactive_users(self):
+        row = {"ll_actor_name": "Some_user__name", "last_edit_date": "20200101000000",
+               "user_groups": "autoreview"}
+        self.assertEqual(cells(self.specs["inactive_users"], row), [
+            "1",
+            "[[مستخدم:Some_user__name|Some user_name]]",
+            "{{نسخ:#time:j F Y|20200101000000}}",
+            "مراجع تلقائي",
+        ])
+
+    def test_list_of_wikipedians_by_number_of_edits(self):
+        row = {"user_name": "Someone", "user_editcount": 1234567}
+        self.assertEqual(cells(self.specs["list_of_wikipedians_by_number_of_edits"], row), [
+            "1", "[[مستخدم:Someone|Someone]]", "[[خاص:مساهمات/Someone|1٬234٬567]]",
+        ])
+
+    def test_statistics_pages_may_be_down(self):
+        spec = self.specs["statistics_pages_may_be_down_that_need_to_be_checked"]
+        row = {"page_namespace": 4, "page_title": "تقرير", "page_len": 10, "needed_to_check": "YES"}
+        self.assertEqual(cells(spec, row), ["1", "[[{{ns:4}}:تقرير]]", "10 بايت", "{{Y}}"])
+        row["needed_to_check"] = "NO"
+        self.assertEqual(cells(spec, row)[3], "{{N}}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from tasks.webcite.modules import availability
+from tasks.webcite.modules.availability import AvailabilityPrefetcher
+from tasks.webcite.modules.cite import Cite
+from tasks.webcite.modules.parsed import Parsed
+
+
+def make_response(rows):
+    response = MagicMock()
+    response.status_code = 200
+    response.text = "[]" if rows else ""
+    response.json.return_value = rows
+    return response
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.prefetcher = AvailabilityPrefetcher("test agent")
+        self.prefetcher.session = MagicMock()
+
+    def test_prefetch_deduplicates_urls(self):
+        self.prefetcher.session.get.return_value = make_response(
+            [["timestamp", "original"], ["20200101000000", "http://example.com/a"]])
+        self.prefetcher.prefetch(["http://example.com/a", "http://example.com/a"])
+        self.prefetcher.prefetch(["http://example.com/a"])
+        self.assertEqual(self.prefetcher.session.get.call_count, 1)
+        archive = self.prefetcher.results["http://example.com/a"]
+        self.assertEqual(archive.timestamp, "20200101000000")
+        self.assertEqual(archive.url, "https://web.archive.org/web/20200101000000/http://example.com/a")
+
+    def test_fill_cites(self):
+        self.prefetcher.session.get.return_value = make_response([])
+        pobj = Parsed("{{Cite web|url=http://example.com/b}}", "Test summary", None)
+        pobj.check()
+        cite = Cite(pobj.cite_templates[0])
+        self.prefetcher.fill([cite])
+        self.assertIsNone(cite.archive_object)
+        self.assertTrue(cite.availability_checked)
+
+    def test_failed_lookup_is_not_stored(self):
+        response = MagicMock()
+        response.status_code = 503
+        self.prefetcher.session.get.return_value = response
+        self.prefetcher.prefetch(["http://example.com/c"])
+        self.assertNotIn("http://example.com/c", self.prefetcher.results)
+
+    def test_snapshots_older_than_max_age_are_not_asked_for(self):
+        self.prefetcher.session.get.return_value = make_response([])
+        self.prefetcher.prefetch(["http://example.com/d"])
+        self.assertIn("from", self.prefetcher.session.get.call_args.kwargs["params"])
+
+        prefetcher = AvailabilityPrefetcher("test agent", max_age=None)
+        prefetcher.session = MagicMock()
+        prefetcher.session.get.return_value = make_response([])
+        prefetcher.prefetch(["http://example.com/d"])
+        self.assertNotIn("from", prefetcher.session.get.call_args.kwargs["params"])
+
+    def test_lookups_wait_for_the_limiter(self):
+        limiter = MagicMock()
+        # the first check finds the rate limit reached
+        limiter.can_make_request.side_effect = [False, True, True]
+        prefetcher = AvailabilityPrefetcher("test agent", limiter=limiter)
+        prefetcher.session = MagicMock()
+        prefetcher.session.get.return_value = make_response([])
+        prefetcher.prefetch(["http://example.com/e", "http://example.com/f"])
+        self.assertEqual(limiter.add_request.call_count, 2)
+        self.assertEqual(limiter.can_make_request.call_count, 3)
+
+    def test_concurrent_lookups_are_capped_for_all_prefetchers(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def get(*args, **kwargs):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+            return make_response([])
+
+        prefetchers = []
+        for _ in range(3):
+            prefetcher = AvailabilityPrefetcher("test agent", workers=4)
+            prefetcher.session = MagicMock()
+            prefetcher.session.get.side_effect = get
+            prefetchers.append(prefetcher)
+        threads = [threading.Thread(target=prefetcher.prefetch,
+                                    args=([f"http://example.com/{number}/{i}" for i in range(8)],))
+                   for number, prefetcher in enumerate(prefetchers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(max(peak), availability.max_concurrent_lookups)
+        self.assertEqual(sum(len(prefetcher.results) for prefetcher in prefetchers), 24)
+
+
+if __name__ == '__main__':
+    unittest.main()
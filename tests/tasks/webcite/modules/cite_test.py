@@ -0,0 +1,51 @@
+import unittest
+
+from tasks.webcite.modules.cite import Cite
+from tasks.webcite.modules.cites.mailinglist import MailingList
+from tasks.webcite.modules.cites.news import News
+from tasks.webcite.modules.cites.webcite import WebCite
+from tasks.webcite.modules.parsed import Parsed
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_set_right_class(self):
+        text = """{{استشهاد ويب| url = https://example.com/page }}
+{{Cite  news|url=http://example.com/news}}
+{{cite mailing list|url=http://example.com/list}}
+{{معلومات شخص|url=http://example.com/other}}"""
+        pobj = Parsed(text, "Test summary", None)
+        self.assertTrue(pobj.check())
+        self.assertEqual(len(pobj.cite_templates), 3)
+        classes = [type(Cite(template).template) for template in pobj.cite_templates]
+        self.assertEqual(classes, [WebCite, News, MailingList])
+
+    def test_original_span_record(self):
+        text = "{{Cite web|url=http://example.com/page}} text {{Cite web|url=http://example.com/page}}"
+        pobj = Parsed(text, "Test summary", None)
+        pobj.check()
+        self.assertEqual(pobj.cite_spans, [(0, 40), (46, 86)])
+        cite = Cite(pobj.cite_templates[1])
+        self.assertEqual(cite.url.value, "http://example.com/page")
+        cite.template.update_template("https://web.archive.org/web/20230101000000/http://example.com/page",
+                                      "20230101000000")
+        start, end = pobj.cite_spans[1]
+        pobj.edits.add(start, end, str(cite.template.template))
+        new_text = pobj.edits.apply()
+        # the identical citation before it is left untouched
+        self.assertTrue(new_text.startswith("{{Cite web|url=http://example.com/page}} text {{Cite web|"))
+        self.assertIn("مسار أرشيف=https://web.archive.org/web/20230101000000/http://example.com/page", new_text)
+
+    def test_is_url_excluded(self):
+        pobj = Parsed("{{Cite web|url=http://example.com/page}}", "Test summary", None)
+        pobj.check()
+        cite = Cite(pobj.cite_templates[0])
+        self.assertTrue(cite.check_available())
+        self.assertIsNone(cite.is_url_excluded("https://Web.Archive.org/web/2020/http://example.com"))
+        self.assertIsNone(cite.is_url_excluded("http://localhost:8000/page"))
+        self.assertIsNone(cite.is_url_excluded("https://www.google.com/search?q=x"))
+        self.assertTrue(cite.is_url_excluded("https://www.google.com/maps"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+
+from tasks.webcite.modules.domain_memory import DomainMemory, get_domain
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.domains = DomainMemory(threshold=2, database_path=os.path.join(self.directory.name, "domains.db"))
+
+    def tearDown(self):
+        self.domains.db_conn.close()
+        self.directory.cleanup()
+
+    def test_get_domain(self):
+        self.assertEqual(get_domain("https://www.example.com/page?q=1"), "example.com")
+        self.assertEqual(get_domain(" http://News.Example.com "), "news.example.com")
+        self.assertIsNone(get_domain("not a url"))
+
+    def test_skip_after_threshold(self):
+        url = "https://www.example.com/page"
+        self.domains.add_failure(url)
+        self.assertFalse(self.domains.is_skipped(url))
+        self.domains.add_failure("http://example.com/other")
+        self.assertTrue(self.domains.is_skipped(url))
+        self.assertFalse(self.domains.is_skipped("https://example.org/page"))
+
+    def test_success_ends_cooldown(self):
+        url = "https://example.com/page"
+        self.domains.add_failure(url)
+        self.domains.add_failure(url)
+        self.domains.add_success(url)
+        self.assertFalse(self.domains.is_skipped(url))
+
+
+if __name__ == '__main__':
+    unittest.main()
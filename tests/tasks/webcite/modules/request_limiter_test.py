@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from tasks.webcite.modules.request_limiter import RequestLimiter
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "request_limiter.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def limiter(self, **kwargs):
+        limiter = RequestLimiter(database_path=self.database_path, **kwargs)
+        self.addCleanup(limiter.db_conn.close)
+        return limiter
+
+    def test_limit(self):
+        limiter = self.limiter(limit=2)
+        limiter.add_request()
+        self.assertTrue(limiter.can_make_request())
+        limiter.add_request()
+        self.assertFalse(limiter.can_make_request())
+
+    def test_buckets_are_counted_apart(self):
+        saves = self.limiter(limit=1)
+        lookups = self.limiter(limit=1, name="lookups")
+        lookups.add_request()
+        self.assertFalse(lookups.can_make_request())
+        self.assertTrue(saves.can_make_request())
+        # limiters of the same bucket share the count
+        self.assertFalse(self.limiter(limit=1, name="lookups").can_make_request())
+
+    def test_bucket_name_is_checked(self):
+        with self.assertRaises(ValueError):
+            self.limiter(name="lookups; DROP TABLE requests")
+
+
+if __name__ == '__main__':
+    unittest.main()
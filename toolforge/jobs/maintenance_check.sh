@@ -8,6 +8,7 @@ export PYWIKIBOT_DIR="$HOME/repos"
 export PYTHONPATH="${PYTHONPATH}:$HOME/repos"
 
 
+python3  "$HOME"/repos/database/migrate.py
 python3  "$HOME"/repos/tasks/maintenance/task/portal_aliases.py
 python3  "$HOME"/repos/tasks/maintenance/task/awb/template_redirects.py
 python3  "$HOME"/repos/tasks/maintenance/task/awb/rename_template_parameters.py
@@ -7,6 +7,7 @@ export PYWIKIBOT_DIR="$HOME/repos"
 
 export PYTHONPATH="${PYTHONPATH}:$HOME/repos"
 
+python3  "$HOME"/repos/database/migrate.py
 python3  "$HOME"/repos/tasks/maintenance/read.py
 python3  "$HOME"/repos/tasks/webcite/read.py
 python3  "$HOME"/repos/tasks/maintenance/data/orphan/remove.py
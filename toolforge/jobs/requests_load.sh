@@ -7,6 +7,8 @@ export PYWIKIBOT_DIR="$HOME/repos"
 export PYTHONPATH="${PYTHONPATH}:$HOME/repos"
 
 
+python3  "$HOME"/repos/database/migrate.py
+python3  "$HOME"/repos/tasks/requests/core/database/migrate.py
 python3  "$HOME"/repos/tasks/requests/link_replacement/load.py
 python3  "$HOME"/repos/tasks/requests/template_distribution/load.py
 python3  "$HOME"/repos/tasks/requests/add_category/load.py
@@ -7,12 +7,10 @@ export PYWIKIBOT_DIR="$HOME/repos"
 export PYTHONPATH="${PYTHONPATH}:$HOME/repos"
 
 
-python3  "$HOME"/repos/tasks/requests/link_replacement/run.py
-python3  "$HOME"/repos/tasks/requests/template_distribution/run.py
-python3  "$HOME"/repos/tasks/requests/portal_distribution/run.py
-python3  "$HOME"/repos/tasks/requests/replace_template/run.py
-python3  "$HOME"/repos/tasks/requests/add_category/run.py
-python3  "$HOME"/repos/tasks/requests/remove/run.py
+python3  "$HOME"/repos/tasks/requests/core/database/migrate.py
+# runs link_replacement, template_distribution, portal_distribution,
+# replace_template, add_category and remove in one process
+python3  "$HOME"/repos/tasks/requests/run.py
 
 # Exit the script after running all the Python files
 exit 0
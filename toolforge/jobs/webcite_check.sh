@@ -8,6 +8,7 @@ export PYWIKIBOT_DIR="$HOME/repos"
 export PYTHONPATH="${PYTHONPATH}:$HOME/repos"
 
 
+python3  "$HOME"/repos/database/migrate.py
 python3  "$HOME"/repos/tasks/webcite/check.py
 
 